@@ -1,15 +1,29 @@
 """Interfaz pública para el módulo del Algoritmo Genético."""
 
 from .ag import (
+    configuracion_efectiva,
     construir_gene_space,
+    fitness_poblacion,
     run_ag,
     run_generations,
     simular_individuo,
 )
+from .compilada import InstanciaCompilada, compilar_instancia
+from .incremental import TrazaIndividuo, evaluar_cambios, trazar_individuo
+from .presolve import CromosomaReducido, presolver
 
 __all__ = [
+    "CromosomaReducido",
+    "InstanciaCompilada",
+    "TrazaIndividuo",
+    "compilar_instancia",
+    "configuracion_efectiva",
     "construir_gene_space",
+    "evaluar_cambios",
+    "fitness_poblacion",
+    "presolver",
     "run_ag",
     "run_generations",
     "simular_individuo",
+    "trazar_individuo",
 ]
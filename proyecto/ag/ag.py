@@ -1,12 +1,25 @@
 from __future__ import annotations
 
-from collections import defaultdict
-import heapq
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
 import numpy as np
 import pygad
 
+from .cache import CacheFitness
+from .compilada import InstanciaCompilada, _operarios_por_tarea, compilar_instancia
+from .inicio import codificar_spt, poblacion_inicial
+from .motor import (
+    EstadoSimulacion,
+    calcular_fitness,
+    decodificar,
+    ejecutar,
+    evaluar_poblacion,
+)
+from .paralelo import EvaluadorParalelo
+from .parada import ControlParada
+from .perfil import PerfilCorrida
+from .presolve import CromosomaReducido, presolver
 from .utils import formatear_resultados_ag
 
 
@@ -20,8 +33,38 @@ DEFAULT_GA_CONFIG: Dict[str, Any] = {
     "mutation_type": "random",
     "mutation_percent_genes": 15,
     "random_seed": 42,
+    "fitness_batch_size": 100,
 }
 
+# Opciones propias del AG que viajan en ``ga_config`` pero no se pasan a PyGAD.
+DEFAULT_OPCIONES_AG: Dict[str, Any] = {
+    # Procesos para evaluar el fitness en paralelo; 1 evalúa en el proceso actual.
+    "num_procesos": 1,
+    # Entradas de la cache LRU de fitness por forma canónica; 0 la desactiva.
+    "tamano_cache_fitness": 10_000,
+    # Quita del cromosoma los genes fijos o irrelevantes antes de correr el AG. Cambia
+    # el espacio que recorre PyGAD, y con él la solución para una misma semilla.
+    "presolve": False,
+    # Parada anticipada (ver ``ControlParada``); None desactiva cada criterio.
+    "generaciones_saturacion": None,
+    "tiempo_maximo_s": None,
+    "max_evaluaciones": None,
+    # Siembra la población inicial con el cronograma SPT y variantes mutadas de él,
+    # que ocupan ``fraccion_inicio_spt`` de la población.
+    "inicio_spt": False,
+    "fraccion_inicio_spt": 0.5,
+    # Modelo de islas: poblaciones independientes en procesos separados que cada
+    # ``intervalo_migracion`` generaciones envían sus ``migrantes`` mejores a la vecina.
+    "islas": 1,
+    "intervalo_migracion": 10,
+    "migrantes": 2,
+    # Registra tiempos por fase y por generación en ``resultado["perfil"]``.
+    "perfilar": False,
+}
+
+# Opciones que no cambian la solución del AG (ver ``configuracion_efectiva``).
+OPCIONES_SIN_EFECTO = ("num_procesos", "tamano_cache_fitness", "perfilar")
+
 
 def run_ag(instancia: Dict[str, Any], instancia_id: str = "instancia") -> Dict[str, Any]:
     """Ejecuta el AG, formatea los resultados y los retorna listos para consumir."""
@@ -50,188 +93,77 @@ def construir_gene_space(instancia: Dict[str, Any]) -> List[Any]:
 def fitness_func(
     solution: Sequence[float],
     solution_idx: int,
-    instancia: Optional[Dict[str, Any]] = None,
+    instancia: Optional[Dict[str, Any] | InstanciaCompilada] = None,
 ) -> float:
     """Evalúa un individuo calculando su fitness a partir de la simulación."""
     if instancia is None:
         raise ValueError("Se requiere la instancia del problema para evaluar el fitness.")
 
-    simulacion = simular_individuo(solution, instancia)
-    penalizaciones = simulacion["penalizaciones"]
-
-    fitness = (
-        100 * simulacion["tareas_ejecutadas"]
-        - 10 * penalizaciones["prerequisitos"]
-        - 10 * penalizaciones["repuestos"]
-        - 15 * penalizaciones["operario_no_apto"]
-        - 12 * penalizaciones["ot_ocupada"]
-        - 0.1 * penalizaciones["exceso_tiempo"]
-        - 15 * simulacion["desbalance"]
-        - 10 * simulacion["makespan"]
+    simulacion = simular_individuo(solution, instancia, solo_metricas=True)
+    return calcular_fitness(
+        simulacion["tareas_ejecutadas"],
+        simulacion["penalizaciones"],
+        simulacion["desbalance"],
+        simulacion["makespan"],
     )
-    return float(fitness)
+
+
+def fitness_poblacion(
+    soluciones: np.ndarray,
+    instancia: Dict[str, Any] | InstanciaCompilada,
+) -> np.ndarray:
+    """Evalúa una matriz de individuos (uno por fila) en una sola llamada.
+
+    Decodifica todos los genes de operario y las prioridades con NumPy y reutiliza
+    los mismos buffers de simulación para cada fila. Devuelve los mismos valores
+    que ``fitness_func`` aplicado fila a fila.
+    """
+    return evaluar_poblacion(soluciones, _compilada(instancia))
 
 
 def simular_individuo(
     genotipo: Sequence[float],
-    instancia: Dict[str, Any],
+    instancia: Dict[str, Any] | InstanciaCompilada,
+    solo_metricas: bool = False,
 ) -> Dict[str, Any]:
-    """Simula la ejecución del cromosoma usando eventos en tiempo real."""
-    tareas = instancia.get("tareas_a_programar", [])
-    if not tareas:
-        raise ValueError("La instancia no contiene tareas a programar.")
-
-    n_tareas = len(tareas)
-    if len(genotipo) < 2 * n_tareas:
-        raise ValueError("El genotipo recibido no tiene la longitud esperada.")
-
-    tiempos_procesamiento = instancia.get("tiempos_procesamiento", {})
-    horizonte = instancia.get("horizonte")
-    if horizonte is None:
-        raise ValueError("La instancia debe definir un horizonte de planificación.")
-    operarios = instancia.get("operarios") or sorted(
-        instancia.get("operarios_aptos", {}).keys()
+    """Simula la ejecución del cromosoma usando eventos en tiempo real.
+
+    Con ``solo_metricas=True`` devuelve sólo lo que usa el fitness
+    (``tareas_ejecutadas``, ``penalizaciones``, ``makespan``, ``desbalance`` y
+    ``n_tareas``), sin armar el cronograma, los rechazos ni la ocupación por OT.
+    """
+    compilada = _compilada(instancia)
+    operarios_asignados, tareas_por_operario = decodificar(genotipo, compilada)
+    estado_sim = ejecutar(
+        EstadoSimulacion(compilada),
+        operarios_asignados,
+        tareas_por_operario,
+        detalle=not solo_metricas,
     )
-    operarios_por_tarea = _operarios_por_tarea(instancia)
-    repuestos_por_ot = instancia.get("repuestos_por_ot", {})
-    mapeo_ot = instancia.get("mapeo_ot", {})
-    prerequisitos = instancia.get("prerequisitos", {})
-
-    genes = np.asarray(genotipo)
-    operarios_asignados = genes[:n_tareas].astype(int)
-    prioridades = genes[n_tareas:]
-
-    tareas_por_operario: Dict[int, List[Dict[str, Any]]] = defaultdict(list)
-    for idx, (ot, tarea) in enumerate(tareas):
-        duracion = tiempos_procesamiento.get(tarea)
-        if duracion is None:
-            raise ValueError(f"No se definió duración para la tarea {tarea}.")
-
-        operario = int(operarios_asignados[idx])
-        prioridad = float(prioridades[idx]) + idx * 1e-10
-        tareas_por_operario[operario].append(
-            {
-                "idx": idx,
-                "ot": ot,
-                "tarea": tarea,
-                "prioridad": prioridad,
-                "duracion": int(duracion),
-                "estado": "pendiente",
-            }
-        )
+    if solo_metricas:
+        return {
+            "tareas_ejecutadas": len(estado_sim.asignadas),
+            "penalizaciones": estado_sim.penalizaciones(),
+            "makespan": estado_sim.makespan(),
+            "desbalance": estado_sim.desbalance(),
+            "n_tareas": compilada.n_tareas,
+        }
 
-    for registros in tareas_por_operario.values():
-        registros.sort(key=lambda item: item["prioridad"], reverse=True)
-
-    tiempo_por_operario = {int(op): 0 for op in operarios}
-    tareas_completadas_por_ot: Dict[int, set] = defaultdict(set)
-    ocupacion_ot: Dict[int, List[Tuple[int, int]]] = defaultdict(list)
-    cronograma_dict: Dict[int, Dict[str, Any]] = {}
-    tareas_rechazadas: List[Dict[str, Any]] = []
-    penalizaciones = {
-        "prerequisitos": 0.0,
-        "repuestos": 0.0,
-        "operario_no_apto": 0.0,
-        "exceso_tiempo": 0.0,
-        "ot_ocupada": 0.0,
-    }
-    eventos: List[Tuple[int, int, int, int, int]] = []
-
-    def intentar_asignar_tareas_operario(operario: int, tiempo_actual: int) -> bool:
-        """Intenta asignar la siguiente tarea disponible de un operario."""
-        if operario not in tareas_por_operario:
-            return False
-        tiempo_por_operario.setdefault(operario, 0)
-        if tiempo_por_operario[operario] > tiempo_actual:
-            return False
-
-        for tarea_info in tareas_por_operario[operario]:
-            if tarea_info["estado"] != "pendiente":
-                continue
-
-            idx = tarea_info["idx"]
-            ot = tarea_info["ot"]
-            tarea = tarea_info["tarea"]
-            duracion = tarea_info["duracion"]
-
-            if not _operario_es_apto(tarea, operario, operarios_por_tarea):
-                penalizaciones["operario_no_apto"] += 1
-                tarea_info["estado"] = "rechazada"
-                tareas_rechazadas.append(
-                    {"ot": ot, "tarea": tarea, "operario": operario, "motivo": "operario"}
-                )
-                continue
-
-            if not _tiene_repuesto(ot, tarea, mapeo_ot, repuestos_por_ot):
-                penalizaciones["repuestos"] += 1
-                tarea_info["estado"] = "rechazada"
-                tareas_rechazadas.append(
-                    {"ot": ot, "tarea": tarea, "operario": operario, "motivo": "repuesto"}
-                )
-                continue
-
-            if not _prerequisitos_cumplidos(
-                tarea, ot, prerequisitos, mapeo_ot, tareas_completadas_por_ot
-            ):
-                penalizaciones["prerequisitos"] += 0.1
-                continue
-
-            inicio = max(tiempo_actual, tiempo_por_operario[operario])
-            fin = inicio + duracion
-
-            if fin > horizonte:
-                penalizaciones["exceso_tiempo"] += fin - horizonte
-                tarea_info["estado"] = "rechazada"
-                tareas_rechazadas.append(
-                    {"ot": ot, "tarea": tarea, "operario": operario, "motivo": "horizonte"}
-                )
-                continue
-
-            if not _ot_disponible(ot, inicio, fin, ocupacion_ot):
-                penalizaciones["ot_ocupada"] += 0.1
-                continue
-
-            cronograma_dict[idx] = {
+    tareas = compilada.tareas
+    duraciones = compilada.duraciones_l
+    inicios = estado_sim.inicios
+    cronograma = sorted(
+        (
+            {
                 "idx": idx,
-                "ot": ot,
-                "tarea": tarea,
-                "operario": operario,
-                "inicio": inicio,
-                "fin": fin,
+                "ot": tareas[idx][0],
+                "tarea": tareas[idx][1],
+                "operario": operarios_asignados[idx],
+                "inicio": inicios[idx],
+                "fin": inicios[idx] + duraciones[idx],
             }
-            ocupacion_ot[ot].append((inicio, fin))
-            tiempo_por_operario[operario] = fin
-            tarea_info["estado"] = "asignada"
-            heapq.heappush(eventos, (fin, idx, ot, tarea, operario))
-            return True
-
-        return False
-
-    for operario in list(tareas_por_operario.keys()):
-        intentar_asignar_tareas_operario(operario, 0)
-
-    while eventos:
-        tiempo_actual, _, ot, tarea, operario = heapq.heappop(eventos)
-        tareas_completadas_por_ot[ot].add(tarea)
-        intentar_asignar_tareas_operario(operario, tiempo_actual)
-        for otro_op in list(tareas_por_operario.keys()):
-            if otro_op != operario:
-                intentar_asignar_tareas_operario(otro_op, tiempo_actual)
-
-    for operario, registros in tareas_por_operario.items():
-        for tarea_info in registros:
-            if tarea_info["estado"] == "pendiente":
-                tareas_rechazadas.append(
-                    {
-                        "ot": tarea_info["ot"],
-                        "tarea": tarea_info["tarea"],
-                        "operario": operario,
-                        "motivo": "pendiente",
-                    }
-                )
-
-    cronograma = sorted(
-        cronograma_dict.values(),
+            for idx in estado_sim.asignadas
+        ),
         key=lambda registro: (
             registro["operario"],
             registro["inicio"],
@@ -239,25 +171,21 @@ def simular_individuo(
             registro["idx"],
         ),
     )
-    tiempos_finales = list(tiempo_por_operario.values())
-    makespan = max(tiempos_finales) if tiempos_finales else 0
-    carga_por_operario: Dict[int, int] = defaultdict(int)
-    for registro in cronograma:
-        duracion = max(0, int(registro["fin"]) - int(registro["inicio"]))
-        carga_por_operario[int(registro["operario"])] += duracion
-    cargas = list(carga_por_operario.values())
-    desbalance = float(np.std(cargas)) if cargas else 0.0
+    tareas_rechazadas = [
+        {"ot": tareas[idx][0], "tarea": tareas[idx][1], "operario": operario, "motivo": motivo}
+        for idx, operario, motivo in estado_sim.rechazos
+    ]
 
     return {
         "cronograma": cronograma,
         "tareas_rechazadas": tareas_rechazadas,
-        "tiempo_por_operario": tiempo_por_operario,
-        "ocupacion_ot": dict(ocupacion_ot),
+        "tiempo_por_operario": estado_sim.tiempo_por_operario,
+        "ocupacion_ot": estado_sim.intervalos_por_ot(),
         "tareas_ejecutadas": len(cronograma),
-        "penalizaciones": penalizaciones,
-        "makespan": makespan,
-        "desbalance": desbalance,
-        "n_tareas": n_tareas,
+        "penalizaciones": estado_sim.penalizaciones(),
+        "makespan": estado_sim.makespan(),
+        "desbalance": estado_sim.desbalance(),
+        "n_tareas": compilada.n_tareas,
     }
 
 
@@ -267,99 +195,230 @@ def run_generations(instancia: Dict[str, Any]) -> Dict[str, Any]:
     if not tareas:
         raise ValueError("Debe proporcionar al menos una tarea a programar.")
 
-    n_tareas = len(tareas)
-    gene_space = construir_gene_space(instancia)
-    ga_params = {**DEFAULT_GA_CONFIG, **instancia.get("ga_config", {})}
-
-    def fitness_wrapper(ga_instance, solution, solution_idx):
-        return fitness_func(solution, solution_idx, instancia)
+    ga_params, opciones = _separar_opciones(instancia.get("ga_config", {}))
+    if int(opciones["islas"] or 1) > 1:
+        from .islas import run_islas
+
+        return run_islas(instancia, ga_params, opciones)
+
+    perfil = PerfilCorrida() if opciones["perfilar"] else None
+    compilada = compilar_instancia(instancia)
+
+    num_procesos = int(opciones["num_procesos"] or 1)
+    evaluador = EvaluadorParalelo(compilada, num_procesos) if num_procesos > 1 else None
+    if evaluador is not None:
+        # Cada llamada recibe la población completa para repartirla entre los procesos.
+        ga_params["fitness_batch_size"] = ga_params["sol_per_pop"]
+        evaluar = evaluador
+    else:
+        evaluar = partial(fitness_poblacion, instancia=compilada)
+
+    gene_space, reduccion, semilla_spt = _preparar_cromosoma(instancia, compilada, opciones)
+    evaluar, cache = _cadena_evaluacion(evaluar, compilada, reduccion, opciones)
+    if perfil is not None:
+        evaluar = perfil.medir_fitness(evaluar)
+
+    if semilla_spt is not None:
+        ga_params["initial_population"] = poblacion_inicial(
+            semilla_spt,
+            gene_space,
+            ga_params["sol_per_pop"],
+            float(opciones["fraccion_inicio_spt"]),
+            ga_params["mutation_percent_genes"] / 100,
+            np.random.default_rng(ga_params.get("random_seed")),
+        )
 
+    parada = ControlParada.desde_opciones(opciones)
     ga_params.update(
         {
-            "fitness_func": fitness_wrapper,
+            "fitness_func": _fitness_pygad(evaluar, parada, ga_params.get("fitness_batch_size")),
             "num_genes": len(gene_space),
             "gene_space": gene_space,
+            "on_generation": parada.en_generacion,
         }
     )
+    if perfil is not None:
+        ga_params.update(
+            {
+                "on_start": perfil.en_inicio,
+                "on_fitness": perfil.en_fitness,
+                "on_generation": _encadenar_generacion(perfil, parada),
+            }
+        )
 
-    ga_instance = pygad.GA(**ga_params)
-    ga_instance.run()
+    try:
+        ga_instance = pygad.GA(**ga_params)
+        ga_instance.run()
+    finally:
+        if evaluador is not None:
+            evaluador.cerrar()
 
-    solution, fitness, solution_idx = ga_instance.best_solution()
-    simulacion = simular_individuo(solution, instancia)
+    solution, fitness, solution_idx = ga_instance.best_solution(
+        pop_fitness=ga_instance.last_generation_fitness
+    )
+    resultado = _resultado_ga(
+        compilada,
+        reduccion,
+        parada,
+        solution,
+        fitness,
+        ga_instance.generations_completed,
+        getattr(ga_instance, "best_solutions_fitness", []),
+    )
+    if perfil is not None:
+        perfil.cerrar_fase("resultado_s")
+    resultado.update(
+        {
+            "solution_idx": solution_idx,
+            "cache_fitness": cache.estadisticas() if cache is not None else None,
+            "perfil": perfil.resumen() if perfil is not None else None,
+            "paralelo": (
+                {
+                    "llamadas_pool": evaluador.llamadas_pool,
+                    "llamadas_locales": evaluador.llamadas_locales,
+                }
+                if evaluador is not None
+                else None
+            ),
+        }
+    )
+    return resultado
+
+
+def _preparar_cromosoma(
+    instancia: Dict[str, Any],
+    compilada: InstanciaCompilada,
+    opciones: Dict[str, Any],
+) -> Tuple[List[Any], Optional[CromosomaReducido], Optional[np.ndarray]]:
+    """gene_space de la búsqueda, reducción del presolve y semilla SPT en ese espacio."""
+    gene_space = construir_gene_space(instancia)
+    semilla_spt = codificar_spt(instancia, gene_space) if opciones["inicio_spt"] else None
+    reduccion = presolver(gene_space, compilada) if opciones["presolve"] else None
+    if reduccion is not None and reduccion.num_genes == 0:
+        # Sin decisiones libres PyGAD no tiene qué evolucionar; se usa el cromosoma completo.
+        reduccion = None
+    if reduccion is not None:
+        gene_space = reduccion.gene_space
+        if semilla_spt is not None:
+            semilla_spt = reduccion.reducir(semilla_spt)
+    return gene_space, reduccion, semilla_spt
+
+
+def _cadena_evaluacion(
+    evaluar: Callable[[np.ndarray], np.ndarray],
+    compilada: InstanciaCompilada,
+    reduccion: Optional[CromosomaReducido],
+    opciones: Dict[str, Any],
+) -> Tuple[Callable[[np.ndarray], np.ndarray], Optional[CacheFitness]]:
+    """Envuelve ``evaluar`` con la cache de fitness y la expansión del presolve."""
+    tamano_cache = int(opciones["tamano_cache_fitness"] or 0)
+    cache = CacheFitness(compilada.n_tareas, tamano_cache) if tamano_cache > 0 else None
+    if cache is not None:
+        evaluar = partial(cache.evaluar, evaluar=evaluar)
+    if reduccion is not None:
+        evaluar = partial(_evaluar_reducidas, reduccion=reduccion, evaluar=evaluar)
+    return evaluar, cache
+
+
+def _fitness_pygad(
+    evaluar: Callable[[np.ndarray], np.ndarray],
+    parada: ControlParada,
+    fitness_batch_size: Optional[int],
+) -> Callable[..., Any]:
+    """Función de fitness con la firma que espera PyGAD, por individuo o por lote."""
+    if fitness_batch_size in (None, 1):
+
+        def fitness_wrapper(ga_instance, solution, solution_idx):
+            parada.registrar_evaluaciones(1)
+            return float(evaluar(np.asarray(solution)[np.newaxis, :])[0])
+
+    else:
+
+        def fitness_wrapper(ga_instance, soluciones, indices):
+            parada.registrar_evaluaciones(len(soluciones))
+            return evaluar(soluciones)
+
+    return fitness_wrapper
+
+
+def _encadenar_generacion(perfil: PerfilCorrida, parada: ControlParada) -> Callable[..., Any]:
+    def on_generation(ga_instance):
+        perfil.en_generacion(ga_instance)
+        return parada.en_generacion(ga_instance)
+
+    return on_generation
+
+
+def _resultado_ga(
+    compilada: InstanciaCompilada,
+    reduccion: Optional[CromosomaReducido],
+    parada: ControlParada,
+    solution: np.ndarray,
+    fitness: float,
+    generaciones: int,
+    best_solutions_fitness: List[float],
+) -> Dict[str, Any]:
+    """Resultado de ``run_generations`` a partir del mejor individuo encontrado."""
+    if reduccion is not None:
+        solution = reduccion.expandir(solution)
+    resumen_parada = parada.resumen(generaciones)
+    simulacion = simular_individuo(solution, compilada)
     simulacion.update(
         {
             "fitness": float(fitness),
-            "generaciones": ga_instance.generations_completed,
-            "best_solutions_fitness": getattr(ga_instance, "best_solutions_fitness", []),
+            "generaciones": generaciones,
+            "best_solutions_fitness": best_solutions_fitness,
+            "criterios_parada": resumen_parada["criterios"],
+            "evaluaciones": resumen_parada["evaluaciones"],
         }
     )
 
     return {
         "solution": solution,
         "fitness": float(fitness),
-        "solution_idx": solution_idx,
         "simulacion": simulacion,
+        "presolve": reduccion.estadisticas() if reduccion is not None else None,
+        "parada": resumen_parada,
     }
 
 
-def _operarios_por_tarea(instancia: Dict[str, Any]) -> Dict[int, List[int]]:
-    """Genera el mapeo tarea -> operarios aptos."""
-    if "operarios_por_tarea" in instancia:
-        return {
-            tarea: sorted(operarios)
-            for tarea, operarios in instancia["operarios_por_tarea"].items()
-        }
+def _compilada(instancia: Dict[str, Any] | InstanciaCompilada) -> InstanciaCompilada:
+    if isinstance(instancia, InstanciaCompilada):
+        return instancia
+    return compilar_instancia(instancia)
+
+
+def _evaluar_reducidas(
+    soluciones: np.ndarray,
+    reduccion: CromosomaReducido,
+    evaluar: Callable[[np.ndarray], np.ndarray],
+) -> np.ndarray:
+    return evaluar(reduccion.expandir(soluciones))
 
-    operarios_aptos = instancia.get("operarios_aptos", {})
-    resultado: Dict[int, List[int]] = defaultdict(list)
-    for operario, tareas in operarios_aptos.items():
-        for tarea in tareas:
-            resultado[tarea].append(int(operario))
-    return {tarea: sorted(ops) for tarea, ops in resultado.items()}
-
-
-def _operario_es_apto(
-    tarea: int, operario: int, operarios_por_tarea: Dict[int, List[int]]
-) -> bool:
-    return operario in operarios_por_tarea.get(tarea, [])
-
-
-def _tiene_repuesto(
-    ot: int,
-    tarea: int,
-    mapeo_ot: Dict[int, List[int]],
-    repuestos_por_ot: Dict[int, List[int]],
-) -> bool:
-    tareas_ot = mapeo_ot.get(ot, [])
-    if tarea not in tareas_ot:
-        return False
-    idx = tareas_ot.index(tarea)
-    repuestos = repuestos_por_ot.get(ot, [])
-    return idx < len(repuestos) and bool(repuestos[idx])
-
-
-def _prerequisitos_cumplidos(
-    tarea: int,
-    ot: int,
-    prerequisitos: Dict[int, Iterable[int]],
-    mapeo_ot: Dict[int, List[int]],
-    tareas_completadas_por_ot: Dict[int, set],
-) -> bool:
-    prereqs = prerequisitos.get(tarea, [])
-    tareas_en_ot = mapeo_ot.get(ot, [])
-    completadas = tareas_completadas_por_ot.get(ot, set())
-    relevantes = [p for p in prereqs if p in tareas_en_ot]
-    return all(req in completadas for req in relevantes)
-
-
-def _ot_disponible(
-    ot: int,
-    inicio: int,
-    fin: int,
-    ocupacion_ot: Dict[int, List[Tuple[int, int]]],
-) -> bool:
-    for inicio_ocupado, fin_ocupado in ocupacion_ot.get(ot, []):
-        if inicio < fin_ocupado and fin > inicio_ocupado:
-            return False
-    return True
+
+def configuracion_efectiva(ga_config: Dict[str, Any]) -> Dict[str, Any]:
+    """Parámetros y opciones con los que correría el AG, sin los que no alteran el resultado.
+
+    ``num_procesos``, ``tamano_cache_fitness`` y ``perfilar`` cambian cómo se evalúa o
+    se mide la corrida, pero no la solución; el resto se completa con los valores por
+    defecto, así que dos ``ga_config`` que producen la misma corrida coinciden.
+    """
+    ga_params, opciones = _separar_opciones(ga_config)
+    for clave in OPCIONES_SIN_EFECTO:
+        opciones.pop(clave)
+    return {**ga_params, **opciones}
+
+
+def _separar_opciones(ga_config: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """Divide ``ga_config`` en parámetros de PyGAD y opciones propias del AG."""
+    ga_params = {**DEFAULT_GA_CONFIG, **ga_config}
+    opciones = {
+        clave: ga_params.pop(clave, valor) for clave, valor in DEFAULT_OPCIONES_AG.items()
+    }
+    if ga_params.get("fitness_batch_size") is not None:
+        # PyGAD rechaza lotes más grandes que la población (p. ej. sol_per_pop=20 con
+        # el lote por defecto de 100); con poblaciones chicas el lote es la población.
+        ga_params["fitness_batch_size"] = min(
+            int(ga_params["fitness_batch_size"]), int(ga_params["sol_per_pop"])
+        )
+    return ga_params, opciones
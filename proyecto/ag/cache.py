@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from typing import Callable, Dict, List
+
+import numpy as np
+
+
+class CacheFitness:
+    """Cache LRU de fitness indexada por la forma canónica del cromosoma.
+
+    Dos cromosomas con la misma asignación de operarios y el mismo orden de tareas
+    dentro de la cola de cada operario producen la misma simulación, aunque sus genes
+    de prioridad difieran; ambos comparten entrada.
+    """
+
+    def __init__(self, n_tareas: int, tamano_maximo: int) -> None:
+        if tamano_maximo < 1:
+            raise ValueError("tamano_maximo debe ser un entero positivo.")
+        self.n_tareas = n_tareas
+        self.tamano_maximo = tamano_maximo
+        self.aciertos = 0
+        self.fallos = 0
+        self._valores: "OrderedDict[bytes, float]" = OrderedDict()
+
+    def evaluar(
+        self,
+        soluciones: np.ndarray,
+        evaluar: Callable[[np.ndarray], np.ndarray],
+    ) -> np.ndarray:
+        """Fitness de cada fila; sólo las formas canónicas nuevas llegan a ``evaluar``."""
+        soluciones = np.asarray(soluciones)
+        claves = claves_canonicas(soluciones, self.n_tareas)
+        resultados = np.empty(len(claves), dtype=float)
+
+        pendientes: Dict[bytes, List[int]] = {}
+        for fila, clave in enumerate(claves):
+            valor = self._valores.get(clave)
+            if valor is not None:
+                self._valores.move_to_end(clave)
+                resultados[fila] = valor
+                self.aciertos += 1
+            else:
+                pendientes.setdefault(clave, []).append(fila)
+
+        if pendientes:
+            filas = [posiciones[0] for posiciones in pendientes.values()]
+            valores = evaluar(soluciones[filas])
+            for (clave, posiciones), valor in zip(pendientes.items(), valores):
+                resultados[posiciones] = valor
+                self.fallos += 1
+                # Repeticiones dentro del mismo lote no requieren otra simulación.
+                self.aciertos += len(posiciones) - 1
+                self._guardar(clave, float(valor))
+
+        return resultados
+
+    def registrar(self, soluciones: np.ndarray, valores: np.ndarray) -> None:
+        """Guarda fitness ya conocidos (p. ej. de una población evaluada en otro proceso)."""
+        claves = claves_canonicas(np.asarray(soluciones), self.n_tareas)
+        for clave, valor in zip(claves, valores):
+            self._guardar(clave, float(valor))
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "entradas": len(self._valores),
+            "tamano_maximo": self.tamano_maximo,
+        }
+
+    def _guardar(self, clave: bytes, valor: float) -> None:
+        self._valores[clave] = valor
+        self._valores.move_to_end(clave)
+        while len(self._valores) > self.tamano_maximo:
+            self._valores.popitem(last=False)
+
+
+def claves_canonicas(soluciones: np.ndarray, n_tareas: int) -> List[bytes]:
+    """Operario de cada tarea más el orden de las tareas agrupadas por operario."""
+    operarios = soluciones[:, :n_tareas].astype(np.int64)
+    prioridades = soluciones[:, n_tareas : 2 * n_tareas].astype(float) + (
+        np.arange(n_tareas) * 1e-10
+    )
+    ordenes = np.argsort(-prioridades, axis=1, kind="stable")
+    rangos = np.empty_like(ordenes)
+    np.put_along_axis(rangos, ordenes, np.arange(n_tareas)[np.newaxis, :], axis=1)
+    colas = np.lexsort((rangos, operarios), axis=1)
+    return [
+        fila_operarios.tobytes() + fila_colas.tobytes()
+        for fila_operarios, fila_colas in zip(operarios, colas)
+    ]
@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import numpy as np
+
+
+@dataclass
+class InstanciaCompilada:
+    """Representación en arreglos de una instancia, construida una sola vez por corrida.
+
+    Las tareas se identifican por su posición en ``tareas_a_programar``; los operarios,
+    OT y tipos de tarea se indexan de forma compacta para poder acceder a todo con
+    enteros durante la simulación.
+    """
+
+    tareas: List[Tuple[int, int]]
+    horizonte: int
+    duraciones: np.ndarray
+    operarios: np.ndarray
+    operarios_instancia: List[int]
+    aptitud: np.ndarray
+    tiene_repuesto: np.ndarray
+    ots: np.ndarray
+    ot_de_tarea: np.ndarray
+    tipos: np.ndarray
+    tipo_de_tarea: np.ndarray
+    prereq_ptr: np.ndarray
+    prereq_idx: np.ndarray
+    indice_operario: Dict[int, int] = field(init=False, repr=False)
+    # Espejos en listas de Python: el bucle de eventos accede elemento a elemento y
+    # el indexado escalar de listas es bastante más barato que el de ndarray.
+    duraciones_l: List[int] = field(init=False, repr=False)
+    aptitud_l: List[List[bool]] = field(init=False, repr=False)
+    tiene_repuesto_l: List[bool] = field(init=False, repr=False)
+    ot_de_tarea_l: List[int] = field(init=False, repr=False)
+    tipo_de_tarea_l: List[int] = field(init=False, repr=False)
+    prereqs_l: List[Tuple[int, ...]] = field(init=False, repr=False)
+    # Índices inversos: tareas que esperan a cada (OT, tipo) y tareas de cada OT.
+    dependientes_l: List[List[int]] = field(init=False, repr=False)
+    tareas_de_ot_l: List[List[int]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.indice_operario = {int(op): fila for fila, op in enumerate(self.operarios)}
+        self.duraciones_l = self.duraciones.tolist()
+        self.aptitud_l = self.aptitud.tolist()
+        self.tiene_repuesto_l = self.tiene_repuesto.tolist()
+        self.ot_de_tarea_l = self.ot_de_tarea.tolist()
+        self.tipo_de_tarea_l = self.tipo_de_tarea.tolist()
+        ptr = self.prereq_ptr.tolist()
+        idx = self.prereq_idx.tolist()
+        self.prereqs_l = [tuple(idx[ptr[i] : ptr[i + 1]]) for i in range(len(self.tareas))]
+
+        n_tipos = len(self.tipos)
+        self.dependientes_l = [[] for _ in range(len(self.ots) * n_tipos)]
+        self.tareas_de_ot_l = [[] for _ in range(len(self.ots))]
+        for tarea_idx, (ot_idx, requeridos) in enumerate(zip(self.ot_de_tarea_l, self.prereqs_l)):
+            self.tareas_de_ot_l[ot_idx].append(tarea_idx)
+            for tipo in requeridos:
+                self.dependientes_l[ot_idx * n_tipos + tipo].append(tarea_idx)
+
+    @property
+    def n_tareas(self) -> int:
+        return len(self.tareas)
+
+    def prerequisitos(self, idx: int) -> np.ndarray:
+        """Tipos (índices compactos) que deben estar completados en la OT de la tarea."""
+        return self.prereq_idx[self.prereq_ptr[idx] : self.prereq_ptr[idx + 1]]
+
+
+def compilar_instancia(instancia: Dict[str, Any]) -> InstanciaCompilada:
+    """Traduce el dict de la instancia a arreglos listos para simular."""
+    tareas = [(int(ot), int(tarea)) for ot, tarea in instancia.get("tareas_a_programar", [])]
+    if not tareas:
+        raise ValueError("La instancia no contiene tareas a programar.")
+
+    horizonte = instancia.get("horizonte")
+    if horizonte is None:
+        raise ValueError("La instancia debe definir un horizonte de planificación.")
+
+    tiempos_procesamiento = instancia.get("tiempos_procesamiento", {})
+    duraciones: List[int] = []
+    for _, tarea in tareas:
+        duracion = tiempos_procesamiento.get(tarea)
+        if duracion is None:
+            raise ValueError(f"No se definió duración para la tarea {tarea}.")
+        duraciones.append(int(duracion))
+
+    operarios_instancia = [
+        int(op)
+        for op in (
+            instancia.get("operarios") or sorted(instancia.get("operarios_aptos", {}).keys())
+        )
+    ]
+    operarios_por_tarea = _operarios_por_tarea(instancia)
+    operarios = sorted(
+        set(operarios_instancia).union(
+            int(op) for ops in operarios_por_tarea.values() for op in ops
+        )
+    )
+    fila_operario = {op: fila for fila, op in enumerate(operarios)}
+    aptitud = np.zeros((len(operarios), len(tareas)), dtype=bool)
+    for idx, (_, tarea) in enumerate(tareas):
+        for op in operarios_por_tarea.get(tarea, []):
+            aptitud[fila_operario[int(op)], idx] = True
+
+    mapeo_ot = instancia.get("mapeo_ot", {})
+    repuestos_por_ot = instancia.get("repuestos_por_ot", {})
+    prerequisitos = instancia.get("prerequisitos", {})
+
+    ots: List[int] = []
+    indice_ot: Dict[int, int] = {}
+    tipos: List[int] = []
+    indice_tipo: Dict[int, int] = {}
+
+    def _indice(valor: int, indices: Dict[int, int], valores: List[int]) -> int:
+        if valor not in indices:
+            indices[valor] = len(valores)
+            valores.append(valor)
+        return indices[valor]
+
+    tiene_repuesto: List[bool] = []
+    ot_de_tarea: List[int] = []
+    tipo_de_tarea: List[int] = []
+    prereq_ptr: List[int] = [0]
+    prereq_idx: List[int] = []
+    for ot, tarea in tareas:
+        ot_de_tarea.append(_indice(ot, indice_ot, ots))
+        tipo_de_tarea.append(_indice(tarea, indice_tipo, tipos))
+
+        tareas_ot = list(mapeo_ot.get(ot, []))
+        repuestos = repuestos_por_ot.get(ot, [])
+        if tarea in tareas_ot:
+            posicion = tareas_ot.index(tarea)
+            tiene_repuesto.append(posicion < len(repuestos) and bool(repuestos[posicion]))
+        else:
+            tiene_repuesto.append(False)
+
+        # Sólo cuentan los prerequisitos cuyo tipo forma parte de la misma OT.
+        for req in prerequisitos.get(tarea, []):
+            if req in tareas_ot:
+                prereq_idx.append(_indice(int(req), indice_tipo, tipos))
+        prereq_ptr.append(len(prereq_idx))
+
+    return InstanciaCompilada(
+        tareas=tareas,
+        horizonte=int(horizonte),
+        duraciones=np.asarray(duraciones, dtype=np.int64),
+        operarios=np.asarray(operarios, dtype=np.int64),
+        operarios_instancia=operarios_instancia,
+        aptitud=aptitud,
+        tiene_repuesto=np.asarray(tiene_repuesto, dtype=bool),
+        ots=np.asarray(ots, dtype=np.int64),
+        ot_de_tarea=np.asarray(ot_de_tarea, dtype=np.int64),
+        tipos=np.asarray(tipos, dtype=np.int64),
+        tipo_de_tarea=np.asarray(tipo_de_tarea, dtype=np.int64),
+        prereq_ptr=np.asarray(prereq_ptr, dtype=np.int64),
+        prereq_idx=np.asarray(prereq_idx, dtype=np.int64),
+    )
+
+
+def _operarios_por_tarea(instancia: Dict[str, Any]) -> Dict[int, List[int]]:
+    """Genera el mapeo tarea -> operarios aptos."""
+    if "operarios_por_tarea" in instancia:
+        return {
+            tarea: sorted(operarios)
+            for tarea, operarios in instancia["operarios_por_tarea"].items()
+        }
+
+    operarios_aptos = instancia.get("operarios_aptos", {})
+    resultado: Dict[int, List[int]] = defaultdict(list)
+    for operario, tareas in operarios_aptos.items():
+        for tarea in tareas:
+            resultado[tarea].append(int(operario))
+    return {tarea: sorted(ops) for tarea, ops in resultado.items()}
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import numpy as np
+
+from spt.spt import simular_spt
+
+
+def codificar_spt(instancia: Dict[str, Any], gene_space: List[Any]) -> np.ndarray:
+    """Cromosoma completo que reproduce el cronograma de ``simular_spt``.
+
+    Cada tarea programada conserva el operario que le dio SPT; las prioridades se
+    derivan del orden de inicio, de modo que la cola de cada operario queda en el
+    mismo orden en que SPT las ejecutó. Las tareas que SPT no programó van al primer
+    operario apto y detrás de todas las programadas.
+    """
+    n_tareas = len(gene_space) // 2
+    cronograma = sorted(
+        simular_spt(instancia)["cronograma"],
+        key=lambda registro: (registro["inicio"], registro["fin"], registro["idx"]),
+    )
+
+    cromosoma = np.empty(2 * n_tareas, dtype=float)
+    for idx in range(n_tareas):
+        cromosoma[idx] = gene_space[idx][0]
+
+    programadas = [registro["idx"] for registro in cronograma]
+    restantes = sorted(set(range(n_tareas)).difference(programadas))
+    for registro in cronograma:
+        cromosoma[registro["idx"]] = registro["operario"]
+    for rango, idx in enumerate(programadas + restantes):
+        cromosoma[n_tareas + idx] = 1.0 - (rango + 0.5) / n_tareas
+    return cromosoma
+
+
+def poblacion_inicial(
+    semilla: np.ndarray,
+    gene_space: List[Any],
+    sol_per_pop: int,
+    fraccion_semilla: float,
+    tasa_mutacion: float,
+    rng: np.random.Generator,
+) -> np.ndarray:
+    """Población con ``semilla``, variantes mutadas de ella y el resto al azar.
+
+    La primera fila es la semilla tal cual; las siguientes, hasta ``fraccion_semilla``
+    de la población, cambian cada gen con probabilidad ``tasa_mutacion`` por un valor
+    nuevo de su ``gene_space``. Las demás filas se muestrean uniformemente, como la
+    población inicial de PyGAD.
+    """
+    if not 0.0 < fraccion_semilla <= 1.0:
+        raise ValueError("fraccion_semilla debe estar en (0, 1].")
+    poblacion = np.empty((sol_per_pop, len(gene_space)), dtype=float)
+    for gen, espacio in enumerate(gene_space):
+        poblacion[:, gen] = _muestrear(espacio, sol_per_pop, rng)
+
+    sembradas = max(1, int(round(fraccion_semilla * sol_per_pop)))
+    poblacion[0] = semilla
+    if sembradas > 1:
+        variantes = np.tile(semilla, (sembradas - 1, 1))
+        mutar = rng.random(variantes.shape) < tasa_mutacion
+        # Los valores nuevos se toman de las filas aleatorias ya muestreadas.
+        variantes[mutar] = poblacion[1:sembradas][mutar]
+        poblacion[1:sembradas] = variantes
+    return poblacion
+
+
+def _muestrear(espacio: Any, cantidad: int, rng: np.random.Generator) -> np.ndarray:
+    if isinstance(espacio, dict):
+        return rng.uniform(espacio["low"], espacio["high"], size=cantidad)
+    return rng.choice(np.asarray(espacio, dtype=float), size=cantidad)
@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+import pygad
+
+from .ag import (
+    _cadena_evaluacion,
+    _fitness_pygad,
+    _preparar_cromosoma,
+    _resultado_ga,
+    fitness_poblacion,
+)
+from .compilada import compilar_instancia
+from .inicio import poblacion_inicial
+from .parada import ControlParada
+from .perfil import PerfilCorrida
+
+
+# Contexto de evaluación de cada proceso de islas; se arma una vez en el inicializador.
+_CONTEXTO_ISLA: Optional[Dict[str, Any]] = None
+
+
+def _inicializar_isla(instancia: Dict[str, Any], opciones: Dict[str, Any]) -> None:
+    global _CONTEXTO_ISLA
+    compilada = compilar_instancia(instancia)
+    gene_space, reduccion, _ = _preparar_cromosoma(instancia, compilada, opciones)
+    evaluar, cache = _cadena_evaluacion(
+        partial(fitness_poblacion, instancia=compilada), compilada, reduccion, opciones
+    )
+    _CONTEXTO_ISLA = {
+        "gene_space": gene_space,
+        "reduccion": reduccion,
+        "evaluar": evaluar,
+        "cache": cache,
+    }
+
+
+class _FitnessConocido:
+    """Devuelve sin evaluar el fitness ya calculado de la población que recibe una época.
+
+    PyGAD evalúa la población inicial de cada instancia nueva; en las épocas
+    posteriores a la primera esa población ya viene evaluada (y con los migrantes
+    puestos), así que sólo las filas que no figuran llegan a ``evaluar``.
+    """
+
+    def __init__(
+        self,
+        poblacion: np.ndarray,
+        fitness: np.ndarray,
+        evaluar: Callable[[np.ndarray], np.ndarray],
+    ) -> None:
+        self.evaluar = evaluar
+        self.aciertos = 0
+        self._pendientes: Dict[bytes, List[Any]] = {}
+        for fila, valor in zip(np.asarray(poblacion, dtype=float), fitness):
+            self._pendientes.setdefault(fila.tobytes(), [float(valor), 0])[1] += 1
+
+    def __call__(self, soluciones: np.ndarray) -> np.ndarray:
+        if not self._pendientes:
+            return self.evaluar(soluciones)
+        soluciones = np.asarray(soluciones, dtype=float)
+        resultados = np.empty(len(soluciones), dtype=float)
+        nuevas = []
+        for fila, solucion in enumerate(soluciones):
+            clave = solucion.tobytes()
+            pendiente = self._pendientes.get(clave)
+            if pendiente is None:
+                nuevas.append(fila)
+                continue
+            resultados[fila] = pendiente[0]
+            self.aciertos += 1
+            pendiente[1] -= 1
+            if pendiente[1] == 0:
+                del self._pendientes[clave]
+        if nuevas:
+            resultados[nuevas] = self.evaluar(soluciones[nuevas])
+        return resultados
+
+
+def _evolucionar(
+    poblacion: Optional[np.ndarray],
+    fitness: Optional[np.ndarray],
+    ga_params: Dict[str, Any],
+    perfilar: bool = False,
+) -> Dict[str, Any]:
+    """Corre una época de una isla y devuelve su población, fitness y trayectoria.
+
+    Las islas no guardan estado en el proceso: cada época recibe la población (ya
+    evaluada) y la semilla de PyGAD, así que cualquier worker puede atenderla. Las
+    ``evaluaciones`` no incluyen la población recibida, que no se vuelve a simular;
+    ``cache_fitness`` son los aciertos y fallos de la cache del worker en esta época.
+    """
+    if _CONTEXTO_ISLA is None:
+        raise RuntimeError("El worker no recibió la instancia de las islas.")
+    contexto = _CONTEXTO_ISLA
+    cache = contexto["cache"]
+
+    evaluar = contexto["evaluar"]
+    perfil = PerfilCorrida() if perfilar else None
+    if perfil is not None:
+        evaluar = perfil.medir_fitness(evaluar)
+    conocido = None
+    if poblacion is not None and fitness is not None:
+        if cache is not None:
+            # Los hijos iguales a un individuo recibido también salen de la cache.
+            reduccion = contexto["reduccion"]
+            completas = reduccion.expandir(poblacion) if reduccion is not None else poblacion
+            cache.registrar(completas, fitness)
+        evaluar = conocido = _FitnessConocido(poblacion, fitness, evaluar)
+
+    aciertos, fallos = (cache.aciertos, cache.fallos) if cache is not None else (0, 0)
+    contador = ControlParada()
+    params = {
+        **ga_params,
+        "fitness_func": _fitness_pygad(evaluar, contador, ga_params.get("fitness_batch_size")),
+        "num_genes": len(contexto["gene_space"]),
+        "gene_space": contexto["gene_space"],
+    }
+    if poblacion is not None:
+        params["initial_population"] = poblacion
+    if perfil is not None:
+        params.update(
+            {
+                "on_start": perfil.en_inicio,
+                "on_fitness": perfil.en_fitness,
+                "on_generation": perfil.en_generacion,
+            }
+        )
+
+    ga_instance = pygad.GA(**params)
+    ga_instance.run()
+    return {
+        "poblacion": np.asarray(ga_instance.population, dtype=float).copy(),
+        "fitness": np.asarray(ga_instance.last_generation_fitness, dtype=float).copy(),
+        "trayectoria": [float(valor) for valor in ga_instance.best_solutions_fitness],
+        "evaluaciones": contador.evaluaciones - (conocido.aciertos if conocido else 0),
+        "cache_fitness": (
+            {
+                "proceso": os.getpid(),
+                "aciertos": cache.aciertos - aciertos,
+                "fallos": cache.fallos - fallos,
+                "entradas": cache.estadisticas()["entradas"],
+                "tamano_maximo": cache.tamano_maximo,
+            }
+            if cache is not None
+            else None
+        ),
+        "perfil": perfil.resumen() if perfil is not None else None,
+    }
+
+
+def run_islas(
+    instancia: Dict[str, Any],
+    ga_params: Dict[str, Any],
+    opciones: Dict[str, Any],
+) -> Dict[str, Any]:
+    """AG con modelo de islas; devuelve el mismo formato que ``run_generations``.
+
+    Cada isla es una población de PyGAD que evoluciona en un proceso propio durante
+    ``intervalo_migracion`` generaciones (una época). Al cerrar cada época, la isla
+    ``i`` recibe los ``migrantes`` mejores individuos de la isla ``i - 1`` (en anillo),
+    que reemplazan a sus peores. Las semillas de PyGAD se derivan de
+    ``(random_seed, isla, época)``, así que el resultado es reproducible. Los criterios
+    de parada anticipada se revisan al cerrar cada época.
+    """
+    islas = int(opciones["islas"])
+    intervalo = int(opciones["intervalo_migracion"])
+    migrantes = int(opciones["migrantes"])
+    sol_per_pop = int(ga_params["sol_per_pop"])
+    if intervalo < 1:
+        raise ValueError("intervalo_migracion debe ser un entero positivo.")
+    if not 0 <= migrantes < sol_per_pop:
+        raise ValueError("migrantes debe estar entre 0 y sol_per_pop - 1.")
+
+    perfil = PerfilCorrida() if opciones["perfilar"] else None
+    compilada = compilar_instancia(instancia)
+    gene_space, reduccion, semilla_spt = _preparar_cromosoma(instancia, compilada, opciones)
+    entropia = ga_params.get("random_seed")
+    if entropia is None:
+        entropia = np.random.SeedSequence().entropy
+
+    poblaciones: List[Optional[np.ndarray]] = [None] * islas
+    fitness: List[Optional[np.ndarray]] = [None] * islas
+    if semilla_spt is not None:
+        poblaciones = [
+            poblacion_inicial(
+                semilla_spt,
+                gene_space,
+                sol_per_pop,
+                float(opciones["fraccion_inicio_spt"]),
+                ga_params["mutation_percent_genes"] / 100,
+                np.random.default_rng(np.random.SeedSequence([entropia, isla])),
+            )
+            for isla in range(islas)
+        ]
+
+    parada = ControlParada.desde_opciones(opciones)
+    trayectoria: List[float] = []
+    perfiles: List[List[Dict[str, Any]]] = [[] for _ in range(islas)]
+    caches: Dict[int, Dict[str, int]] = {}
+    aciertos = fallos = 0
+    total = int(ga_params["num_generations"])
+    completadas = 0
+    epoca = 0
+    if perfil is not None:
+        perfil.cerrar_fase("preparacion_s")
+    with ProcessPoolExecutor(
+        max_workers=islas,
+        initializer=_inicializar_isla,
+        initargs=(instancia, opciones),
+    ) as pool:
+        while completadas < total:
+            generaciones = min(intervalo, total - completadas)
+            futuros = [
+                pool.submit(
+                    _evolucionar,
+                    poblaciones[isla],
+                    fitness[isla],
+                    {
+                        **ga_params,
+                        "num_generations": generaciones,
+                        "random_seed": _semilla_isla(entropia, isla, epoca),
+                    },
+                    perfil is not None,
+                )
+                for isla in range(islas)
+            ]
+            trayectorias: List[List[float]] = []
+            for isla, futuro in enumerate(futuros):
+                epoca_isla = futuro.result()
+                poblaciones[isla] = epoca_isla["poblacion"]
+                fitness[isla] = epoca_isla["fitness"]
+                # Salvo en la primera época, el primer valor es la población recibida.
+                trayectoria_isla = epoca_isla["trayectoria"]
+                trayectorias.append(trayectoria_isla if epoca == 0 else trayectoria_isla[1:])
+                parada.registrar_evaluaciones(epoca_isla["evaluaciones"])
+                if epoca_isla["cache_fitness"] is not None:
+                    estadisticas = epoca_isla["cache_fitness"]
+                    aciertos += estadisticas["aciertos"]
+                    fallos += estadisticas["fallos"]
+                    caches[estadisticas["proceso"]] = estadisticas
+                if epoca_isla["perfil"] is not None:
+                    perfiles[isla].extend(
+                        _generaciones_epoca(epoca_isla["perfil"], completadas, epoca == 0)
+                    )
+            trayectoria.extend(max(valores) for valores in zip(*trayectorias))
+
+            completadas += generaciones
+            epoca += 1
+            if parada.revisar(trayectoria) is not None:
+                break
+            if completadas < total and migrantes > 0:
+                _migrar(poblaciones, fitness, migrantes)
+
+    if perfil is not None:
+        perfil.cerrar_fase("ga_s")
+    mejor_isla = max(range(islas), key=lambda isla: fitness[isla].max())
+    mejor_fila = int(np.argmax(fitness[mejor_isla]))
+    resultado = _resultado_ga(
+        compilada,
+        reduccion,
+        parada,
+        poblaciones[mejor_isla][mejor_fila],
+        float(fitness[mejor_isla][mejor_fila]),
+        completadas,
+        trayectoria,
+    )
+    if perfil is not None:
+        perfil.cerrar_fase("resultado_s")
+    resultado.update(
+        {
+            "solution_idx": mejor_fila,
+            "cache_fitness": (
+                {
+                    "aciertos": aciertos,
+                    "fallos": fallos,
+                    "entradas": sum(cache["entradas"] for cache in caches.values()),
+                    "tamano_maximo": sum(cache["tamano_maximo"] for cache in caches.values()),
+                }
+                if caches
+                else None
+            ),
+            "perfil": _perfil_islas(perfil, perfiles) if perfil is not None else None,
+            "islas": {
+                "islas": islas,
+                "intervalo_migracion": intervalo,
+                "migrantes": migrantes,
+                "epocas": epoca,
+                "mejor_isla": mejor_isla,
+                "fitness_por_isla": [float(valores.max()) for valores in fitness],
+            },
+        }
+    )
+    return resultado
+
+
+def _generaciones_epoca(
+    resumen: Dict[str, Any], completadas: int, primera: bool
+) -> List[Dict[str, Any]]:
+    """Generaciones de una época de una isla, numeradas desde el inicio de la corrida.
+
+    En la primera época la población inicial queda como generación 0; en las demás,
+    su evaluación (que sólo simula lo que no venía evaluado) se suma a la primera
+    generación de la época.
+    """
+    generaciones = [dict(registro) for registro in resumen["generaciones"]]
+    for registro in generaciones:
+        registro["generacion"] += completadas
+    inicial = resumen["poblacion_inicial"]
+    if inicial is None:
+        return generaciones
+    if primera:
+        return [{**inicial, "generacion": 0}, *generaciones]
+    if generaciones:
+        for clave in ("segundos", "fitness_s", "evaluaciones"):
+            generaciones[0][clave] += inicial[clave]
+    return generaciones
+
+
+def _perfil_islas(
+    perfil: PerfilCorrida, perfiles: List[List[Dict[str, Any]]]
+) -> Dict[str, Any]:
+    """Perfil con el formato de ``PerfilCorrida.resumen`` combinando todas las islas.
+
+    Por generación, ``segundos`` es el de la isla más lenta (corren en paralelo) y
+    ``fitness_s`` y ``evaluaciones`` suman todas las islas; ``islas`` conserva el
+    detalle de cada una. En las fases, ``ga_s`` es el tiempo de pared de las épocas
+    (con las migraciones) y ``fitness_s`` la suma del fitness de todas las islas.
+    """
+    combinadas = []
+    for registros in zip(*perfiles):
+        combinadas.append(
+            {
+                "generacion": registros[0]["generacion"],
+                "segundos": max(registro["segundos"] for registro in registros),
+                "fitness_s": sum(registro["fitness_s"] for registro in registros),
+                "evaluaciones": sum(registro["evaluaciones"] for registro in registros),
+                "mejor_fitness": max(registro["mejor_fitness"] for registro in registros),
+            }
+        )
+    # El mejor fitness de cada isla es acumulado dentro de una época; entre épocas
+    # la población recibida lo conserva, así que el máximo corrido es el de la corrida.
+    mejor = -np.inf
+    for registro in combinadas:
+        mejor = max(mejor, registro["mejor_fitness"])
+        registro["mejor_fitness"] = mejor
+
+    poblacion_inicial = None
+    if combinadas and combinadas[0]["generacion"] == 0:
+        poblacion_inicial = combinadas.pop(0)
+        del poblacion_inicial["generacion"]
+    fitness_s = sum(registro["fitness_s"] for registros in perfiles for registro in registros)
+    return {
+        "fases": {**perfil.fases, "fitness_s": fitness_s},
+        "total_s": perfil.resumen()["total_s"],
+        "poblacion_inicial": poblacion_inicial,
+        "generaciones": combinadas,
+        "mejor_fitness": [registro["mejor_fitness"] for registro in combinadas],
+        "islas": perfiles,
+    }
+
+
+def _migrar(
+    poblaciones: List[np.ndarray],
+    fitness: List[np.ndarray],
+    migrantes: int,
+) -> None:
+    """Los mejores de cada isla reemplazan a los peores de la siguiente, en anillo."""
+    salientes = []
+    for poblacion, valores in zip(poblaciones, fitness):
+        mejores = np.argsort(-valores, kind="stable")[:migrantes]
+        salientes.append((poblacion[mejores].copy(), valores[mejores].copy()))
+
+    for isla, (poblacion, valores) in enumerate(zip(poblaciones, fitness)):
+        entrantes, valores_entrantes = salientes[isla - 1]
+        peores = np.argsort(valores, kind="stable")[:migrantes]
+        poblacion[peores] = entrantes
+        valores[peores] = valores_entrantes
+
+
+def _semilla_isla(entropia: int, isla: int, epoca: int) -> int:
+    return int(np.random.SeedSequence([entropia, isla, epoca]).generate_state(1)[0])
@@ -0,0 +1,685 @@
+from __future__ import annotations
+
+import heapq
+import math
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from comun.ocupacion import IndiceOcupacion
+
+from .compilada import InstanciaCompilada
+
+
+PENDIENTE, ASIGNADA, RECHAZADA = 0, 1, 2
+
+
+class EstadoSimulacion:
+    """Buffers preasignados que el bucle de eventos reutiliza entre individuos."""
+
+    __slots__ = (
+        "compilada",
+        "estado",
+        "inicios",
+        "completadas",
+        "ocupacion_ot",
+        "asignadas",
+        "rechazos",
+        "tiempo_por_operario",
+        "operarios_asignados",
+        "tareas_por_operario",
+        "pen_prerequisitos",
+        "pen_repuestos",
+        "pen_operario_no_apto",
+        "pen_exceso_tiempo",
+        "pen_ot_ocupada",
+    )
+
+    def __init__(self, compilada: InstanciaCompilada) -> None:
+        self.compilada = compilada
+        n_tareas = compilada.n_tareas
+        self.estado = [PENDIENTE] * n_tareas
+        self.inicios = [0] * n_tareas
+        self.completadas = bytearray(len(compilada.ots) * len(compilada.tipos))
+        self.ocupacion_ot: Dict[int, IndiceOcupacion] = {}
+        self.asignadas: List[int] = []
+        self.rechazos: List[Tuple[int, int, str]] = []
+        self.tiempo_por_operario: Dict[int, int] = {}
+        self.operarios_asignados: List[int] = []
+        self.tareas_por_operario: Dict[int, List[int]] = {}
+        self._limpiar_penalizaciones()
+
+    def reiniciar(self) -> None:
+        n_tareas = len(self.estado)
+        self.estado[:] = [PENDIENTE] * n_tareas
+        self.completadas[:] = bytes(len(self.completadas))
+        self.ocupacion_ot = {}
+        self.asignadas = []
+        self.rechazos = []
+        self.tiempo_por_operario = {op: 0 for op in self.compilada.operarios_instancia}
+        self._limpiar_penalizaciones()
+
+    def _limpiar_penalizaciones(self) -> None:
+        self.pen_prerequisitos = 0.0
+        self.pen_repuestos = 0.0
+        self.pen_operario_no_apto = 0.0
+        self.pen_exceso_tiempo = 0.0
+        self.pen_ot_ocupada = 0.0
+
+    def penalizaciones(self) -> Dict[str, float]:
+        return {
+            "prerequisitos": self.pen_prerequisitos,
+            "repuestos": self.pen_repuestos,
+            "operario_no_apto": self.pen_operario_no_apto,
+            "exceso_tiempo": self.pen_exceso_tiempo,
+            "ot_ocupada": self.pen_ot_ocupada,
+        }
+
+    def intervalos_por_ot(self) -> Dict[int, List[Tuple[int, int]]]:
+        """Intervalos ocupados de cada OT, en el orden en que se asignaron."""
+        return {ot: indice.intervalos() for ot, indice in self.ocupacion_ot.items()}
+
+    def makespan(self) -> int:
+        tiempos_finales = list(self.tiempo_por_operario.values())
+        return max(tiempos_finales) if tiempos_finales else 0
+
+    def cargas(self) -> List[int]:
+        """Carga trabajada por operario, en orden creciente de operario."""
+        duraciones = self.compilada.duraciones_l
+        carga: Dict[int, int] = {}
+        for idx in self.asignadas:
+            operario = self.operarios_asignados[idx]
+            carga[operario] = carga.get(operario, 0) + duraciones[idx]
+        return [carga[op] for op in sorted(carga)]
+
+    def desbalance(self) -> float:
+        cargas = self.cargas()
+        return _desviacion(cargas) if cargas else 0.0
+
+    def fitness(self) -> float:
+        return calcular_fitness(
+            len(self.asignadas), self.penalizaciones(), self.desbalance(), self.makespan()
+        )
+
+
+class RegistroEjecucion:
+    """Lo que anota ``ejecutar`` para poder volver a simular desde una pasada intermedia.
+
+    - ``instantaneas[p]``: estado al comenzar la pasada ``p`` del bucle de eventos,
+      tomado cada ``cada`` pasadas (la primera es la 1, tras el barrido inicial).
+    - ``barridos[o]``: ``(pasada, alcance)`` de cada barrido real del operario ``o``;
+      ``alcance`` es cuántas posiciones de su cola decidieron el resultado
+      (``len(cola) + 1`` si la recorrió entera sin asignar).
+    - ``lecturas[t]``: primera pasada en que el bucle consultó el operario de la tarea
+      ``t`` para marcarlo como sucio.
+
+    Al terminar guarda además ``asignadas``, ``rechazos`` e ``inicios`` finales: las
+    instantáneas sólo guardan cuántas asignaciones y rechazos había, que son prefijos
+    de esas listas.
+    """
+
+    __slots__ = (
+        "cada",
+        "instantaneas",
+        "barridos",
+        "lecturas",
+        "asignadas",
+        "rechazos",
+        "inicios",
+    )
+
+    def __init__(self, cada: int = 1) -> None:
+        if cada < 1:
+            raise ValueError("cada debe ser un entero positivo.")
+        self.cada = cada
+        self.instantaneas: Dict[int, Tuple[Any, ...]] = {}
+        self.barridos: Dict[int, List[Tuple[int, int]]] = {}
+        self.lecturas: Dict[int, int] = {}
+        self.asignadas: List[int] = []
+        self.rechazos: List[Tuple[int, int, str]] = []
+        self.inicios: List[int] = []
+
+
+def decodificar(
+    genotipo: Sequence[float], compilada: InstanciaCompilada
+) -> Tuple[List[int], Dict[int, List[int]]]:
+    """Operario de cada tarea y cola de tareas por operario ordenada por prioridad."""
+    n_tareas = compilada.n_tareas
+    if len(genotipo) < 2 * n_tareas:
+        raise ValueError("El genotipo recibido no tiene la longitud esperada.")
+
+    genes = np.asarray(genotipo)
+    operarios_asignados = genes[:n_tareas].astype(int).tolist()
+    prioridades = (
+        np.asarray(genes[n_tareas : 2 * n_tareas], dtype=float) + np.arange(n_tareas) * 1e-10
+    ).tolist()
+
+    tareas_por_operario: Dict[int, List[int]] = {}
+    for idx, operario in enumerate(operarios_asignados):
+        tareas_por_operario.setdefault(operario, []).append(idx)
+    for cola in tareas_por_operario.values():
+        cola.sort(key=prioridades.__getitem__, reverse=True)
+    return operarios_asignados, tareas_por_operario
+
+
+def decodificar_poblacion(
+    soluciones: np.ndarray, compilada: InstanciaCompilada
+) -> List[Tuple[List[int], Dict[int, List[int]]]]:
+    """Versión vectorizada de ``decodificar`` para una matriz de individuos."""
+    n_tareas = compilada.n_tareas
+    soluciones = np.asarray(soluciones)
+    if soluciones.ndim != 2 or soluciones.shape[1] < 2 * n_tareas:
+        raise ValueError("El genotipo recibido no tiene la longitud esperada.")
+
+    operarios = soluciones[:, :n_tareas].astype(int)
+    prioridades = soluciones[:, n_tareas : 2 * n_tareas].astype(float) + (
+        np.arange(n_tareas) * 1e-10
+    )
+    # Orden descendente estable: a igual prioridad conserva el orden original, igual que
+    # ``list.sort(reverse=True)`` en ``decodificar``.
+    ordenes = np.argsort(-prioridades, axis=1, kind="stable")
+
+    decodificados = []
+    for operarios_fila, orden in zip(operarios.tolist(), ordenes.tolist()):
+        tareas_por_operario: Dict[int, List[int]] = {op: [] for op in operarios_fila}
+        for idx in orden:
+            tareas_por_operario[operarios_fila[idx]].append(idx)
+        decodificados.append((operarios_fila, tareas_por_operario))
+    return decodificados
+
+
+def evaluar_poblacion(soluciones: np.ndarray, compilada: InstanciaCompilada) -> np.ndarray:
+    """Fitness de cada fila de ``soluciones`` reutilizando un único juego de buffers."""
+    estado_sim = EstadoSimulacion(compilada)
+    decodificados = decodificar_poblacion(soluciones, compilada)
+    resultados = np.empty(len(decodificados), dtype=float)
+    for fila, (operarios_asignados, tareas_por_operario) in enumerate(decodificados):
+        ejecutar(estado_sim, operarios_asignados, tareas_por_operario, detalle=False)
+        resultados[fila] = estado_sim.fitness()
+    return resultados
+
+
+def calcular_fitness(
+    tareas_ejecutadas: int,
+    penalizaciones: Dict[str, float],
+    desbalance: float,
+    makespan: int,
+) -> float:
+    fitness = (
+        100 * tareas_ejecutadas
+        - 10 * penalizaciones["prerequisitos"]
+        - 10 * penalizaciones["repuestos"]
+        - 15 * penalizaciones["operario_no_apto"]
+        - 12 * penalizaciones["ot_ocupada"]
+        - 0.1 * penalizaciones["exceso_tiempo"]
+        - 15 * desbalance
+        - 10 * makespan
+    )
+    return float(fitness)
+
+
+def ejecutar(
+    estado_sim: EstadoSimulacion,
+    operarios_asignados: List[int],
+    tareas_por_operario: Dict[int, List[int]],
+    detalle: bool = True,
+    registro: Optional[RegistroEjecucion] = None,
+    desde: Optional[Tuple[RegistroEjecucion, int]] = None,
+) -> EstadoSimulacion:
+    """Corre el bucle de eventos del cromosoma decodificado sobre ``estado_sim``.
+
+    Produce exactamente el mismo resultado que ``ejecutar_barrido`` (cronograma,
+    rechazos en el mismo orden y penalizaciones bit a bit), pero sin recorrer la cola
+    de todos los operarios en cada evento. Tras cada evento sólo se revisan los
+    operarios "sucios": los que acaban de quedar libres, los que tienen tareas en una
+    OT que se liberó, los que tienen una tarea cuyos prerequisitos pendientes llegaron
+    a cero y aquellos con una tarea que ya no entra en el horizonte. Un operario
+    ocioso que no cambió repetiría el mismo barrido sin asignar nada, así que sólo se
+    contabilizan las penalizaciones que ese barrido habría sumado.
+
+    Con ``detalle=False`` no se registran los rechazos (``estado_sim.rechazos`` queda
+    vacío): es el modo del fitness, que sólo usa los escalares de ``EstadoSimulacion``.
+
+    Con ``registro`` se anotan instantáneas y accesos al cromosoma (ver
+    ``RegistroEjecucion``). ``desde=(registro, p)`` retoma la simulación al comienzo
+    de la pasada ``p`` de esa otra corrida, en lugar de empezar desde t=0; sólo es
+    válido si el cromosoma actual no se distingue del de aquella corrida antes de la
+    pasada ``p`` (ver ``ag.incremental``).
+    """
+    estado_sim.reiniciar()
+    estado_sim.operarios_asignados = operarios_asignados
+    estado_sim.tareas_por_operario = tareas_por_operario
+
+    compilada = estado_sim.compilada
+    tareas = compilada.tareas
+    horizonte = compilada.horizonte
+    duraciones = compilada.duraciones_l
+    aptitud = compilada.aptitud_l
+    indice_operario = compilada.indice_operario
+    tiene_repuesto = compilada.tiene_repuesto_l
+    ot_de_tarea = compilada.ot_de_tarea_l
+    tipo_de_tarea = compilada.tipo_de_tarea_l
+    dependientes = compilada.dependientes_l
+    tareas_de_ot = compilada.tareas_de_ot_l
+    n_tipos = len(compilada.tipos)
+
+    estado = estado_sim.estado
+    inicios = estado_sim.inicios
+    completadas = estado_sim.completadas
+    ocupacion_ot = estado_sim.ocupacion_ot
+    asignadas = estado_sim.asignadas
+    rechazos = estado_sim.rechazos
+    tiempo_por_operario = estado_sim.tiempo_por_operario
+
+    # Prerequisitos aún no completados de cada tarea.
+    faltan = [len(requeridos) for requeridos in compilada.prereqs_l]
+    posicion = {operario: orden for orden, operario in enumerate(tareas_por_operario)}
+    # Último barrido real de cada operario y lo que sumaría repetirlo sin cambios.
+    ultima_pasada: Dict[int, int] = {}
+    ociosas_prerequisitos: Dict[int, int] = {}
+    ociosas_ot: Dict[int, int] = {}
+    version: Dict[int, int] = {}
+    conteos = [0, 0]  # prerequisitos, ot_ocupada (en décimas)
+
+    eventos: List[Tuple[int, int, int]] = []
+    liberaciones: List[Tuple[int, int, int]] = []
+    vencimientos: List[Tuple[int, int, int]] = []
+    memoria = (ultima_pasada, ociosas_prerequisitos, ociosas_ot, version)
+    colas = (eventos, liberaciones, vencimientos)
+    barridos = registro.barridos if registro is not None else None
+    lecturas = registro.lecturas if registro is not None else None
+
+    def barrer(operario: int, tiempo_actual: int, pasada: int) -> None:
+        anterior = ultima_pasada.get(operario)
+        if anterior is not None:
+            repeticiones = pasada - anterior - 1
+            conteos[0] += repeticiones * ociosas_prerequisitos[operario]
+            conteos[1] += repeticiones * ociosas_ot[operario]
+        ultima_pasada[operario] = pasada
+
+        fila = indice_operario.get(operario)
+        bloqueadas_prerequisitos = 0
+        bloqueadas_ot = 0
+        limite = None
+        for idx in tareas_por_operario[operario]:
+            if estado[idx] != PENDIENTE:
+                continue
+
+            if fila is None or not aptitud[fila][idx]:
+                estado_sim.pen_operario_no_apto += 1
+                estado[idx] = RECHAZADA
+                if detalle:
+                    rechazos.append((idx, operario, "operario"))
+                continue
+
+            if not tiene_repuesto[idx]:
+                estado_sim.pen_repuestos += 1
+                estado[idx] = RECHAZADA
+                if detalle:
+                    rechazos.append((idx, operario, "repuesto"))
+                continue
+
+            if faltan[idx]:
+                bloqueadas_prerequisitos += 1
+                continue
+
+            inicio = max(tiempo_actual, tiempo_por_operario[operario])
+            fin = inicio + duraciones[idx]
+
+            if fin > horizonte:
+                estado_sim.pen_exceso_tiempo += fin - horizonte
+                estado[idx] = RECHAZADA
+                if detalle:
+                    rechazos.append((idx, operario, "horizonte"))
+                continue
+
+            ot_idx = ot_de_tarea[idx]
+            ot = tareas[idx][0]
+            indice_ot = ocupacion_ot.get(ot)
+            if indice_ot is not None and not indice_ot.disponible(inicio, fin):
+                bloqueadas_ot += 1
+                vence = horizonte - duraciones[idx]
+                if limite is None or vence < limite:
+                    limite = vence
+                continue
+
+            inicios[idx] = inicio
+            if indice_ot is None:
+                indice_ot = ocupacion_ot[ot] = IndiceOcupacion()
+            indice_ot.agregar(inicio, fin)
+            tiempo_por_operario[operario] = fin
+            estado[idx] = ASIGNADA
+            asignadas.append(idx)
+            heapq.heappush(eventos, (fin, idx, operario))
+            heapq.heappush(liberaciones, (fin, operario, ot_idx))
+            if barridos is not None:
+                cola = tareas_por_operario[operario]
+                barridos.setdefault(operario, []).append((pasada, cola.index(idx) + 1))
+            conteos[0] += bloqueadas_prerequisitos
+            conteos[1] += bloqueadas_ot
+            # Ocupado hasta ``fin``: no se le hacen barridos hasta su liberación.
+            ociosas_prerequisitos[operario] = 0
+            ociosas_ot[operario] = 0
+            return
+
+        if barridos is not None:
+            alcance = len(tareas_por_operario[operario]) + 1
+            barridos.setdefault(operario, []).append((pasada, alcance))
+        conteos[0] += bloqueadas_prerequisitos
+        conteos[1] += bloqueadas_ot
+        ociosas_prerequisitos[operario] = bloqueadas_prerequisitos
+        ociosas_ot[operario] = bloqueadas_ot
+        version[operario] = version.get(operario, 0) + 1
+        if limite is not None:
+            # Cuando el tiempo supere ``limite`` alguna tarea bloqueada por la OT
+            # pasará a rechazarse por horizonte: el barrido deja de ser repetible.
+            heapq.heappush(vencimientos, (limite, operario, version[operario]))
+
+    if desde is None:
+        for operario in tareas_por_operario:
+            tiempo_por_operario.setdefault(operario, 0)
+            barrer(operario, 0, 0)
+        pasada = 0
+    else:
+        origen, pasada = desde
+        _restaurar(estado_sim, origen, pasada, faltan, memoria, conteos, colas)
+        pasada -= 1
+
+    sucios = set()
+    while eventos:
+        if registro is not None and pasada % registro.cada == 0:
+            registro.instantaneas[pasada + 1] = _instantanea(
+                estado_sim, faltan, memoria, conteos, colas
+            )
+        tiempo_actual, idx, operario = heapq.heappop(eventos)
+        pasada += 1
+
+        clave = ot_de_tarea[idx] * n_tipos + tipo_de_tarea[idx]
+        if not completadas[clave]:
+            completadas[clave] = 1
+            for dependiente in dependientes[clave]:
+                faltan[dependiente] -= 1
+                if not faltan[dependiente] and estado[dependiente] == PENDIENTE:
+                    sucios.add(operarios_asignados[dependiente])
+                    if lecturas is not None:
+                        lecturas.setdefault(dependiente, pasada)
+
+        while liberaciones and liberaciones[0][0] <= tiempo_actual:
+            _, liberado, ot_idx = heapq.heappop(liberaciones)
+            sucios.add(liberado)
+            for tarea_idx in tareas_de_ot[ot_idx]:
+                if estado[tarea_idx] == PENDIENTE:
+                    sucios.add(operarios_asignados[tarea_idx])
+                    if lecturas is not None:
+                        lecturas.setdefault(tarea_idx, pasada)
+
+        while vencimientos and vencimientos[0][0] < tiempo_actual:
+            _, vencido, version_vencida = heapq.heappop(vencimientos)
+            if version[vencido] == version_vencida:
+                sucios.add(vencido)
+
+        if not sucios:
+            continue
+        libres = [op for op in sucios if tiempo_por_operario[op] <= tiempo_actual]
+        sucios.clear()
+        # Mismo orden que el barrido completo: primero el operario del evento y luego
+        # el resto según su orden de aparición.
+        libres.sort(key=lambda op: (op != operario, posicion[op]))
+        for libre in libres:
+            barrer(libre, tiempo_actual, pasada)
+
+    for operario, anterior in ultima_pasada.items():
+        repeticiones = pasada - anterior
+        conteos[0] += repeticiones * ociosas_prerequisitos[operario]
+        conteos[1] += repeticiones * ociosas_ot[operario]
+    estado_sim.pen_prerequisitos = _decimas(conteos[0])
+    estado_sim.pen_ot_ocupada = _decimas(conteos[1])
+
+    if detalle:
+        for operario, cola in tareas_por_operario.items():
+            for idx in cola:
+                if estado[idx] == PENDIENTE:
+                    rechazos.append((idx, operario, "pendiente"))
+
+    if registro is not None:
+        registro.asignadas = asignadas[:]
+        registro.rechazos = rechazos[:]
+        registro.inicios = inicios[:]
+    return estado_sim
+
+
+def _instantanea(
+    estado_sim: EstadoSimulacion,
+    faltan: List[int],
+    memoria: Tuple[Dict[int, int], ...],
+    conteos: List[int],
+    colas: Tuple[List[Tuple[int, int, int]], ...],
+) -> Tuple[Any, ...]:
+    # La ocupación de las OT no se copia: se reconstruye con las primeras
+    # ``len(asignadas)`` asignaciones, en el mismo orden en que se hicieron.
+    return (
+        len(estado_sim.asignadas),
+        len(estado_sim.rechazos),
+        estado_sim.estado[:],
+        bytes(estado_sim.completadas),
+        faltan[:],
+        dict(estado_sim.tiempo_por_operario),
+        estado_sim.pen_operario_no_apto,
+        estado_sim.pen_repuestos,
+        estado_sim.pen_exceso_tiempo,
+        tuple(dict(diccionario) for diccionario in memoria),
+        conteos[:],
+        tuple(cola[:] for cola in colas),
+    )
+
+
+def _restaurar(
+    estado_sim: EstadoSimulacion,
+    origen: RegistroEjecucion,
+    pasada: int,
+    faltan: List[int],
+    memoria: Tuple[Dict[int, int], ...],
+    conteos: List[int],
+    colas: Tuple[List[Tuple[int, int, int]], ...],
+) -> None:
+    """Lleva ``estado_sim`` y los acumuladores de ``ejecutar`` a ``origen.instantaneas[pasada]``."""
+    (
+        n_asignadas,
+        n_rechazos,
+        estado,
+        completadas,
+        faltan_origen,
+        tiempo_por_operario,
+        estado_sim.pen_operario_no_apto,
+        estado_sim.pen_repuestos,
+        estado_sim.pen_exceso_tiempo,
+        memoria_origen,
+        conteos_origen,
+        colas_origen,
+    ) = origen.instantaneas[pasada]
+
+    estado_sim.estado[:] = estado
+    estado_sim.completadas[:] = completadas
+    estado_sim.tiempo_por_operario.clear()
+    estado_sim.tiempo_por_operario.update(tiempo_por_operario)
+    estado_sim.rechazos.extend(origen.rechazos[:n_rechazos])
+
+    compilada = estado_sim.compilada
+    tareas = compilada.tareas
+    duraciones = compilada.duraciones_l
+    inicios = estado_sim.inicios
+    ocupacion_ot = estado_sim.ocupacion_ot
+    for idx in origen.asignadas[:n_asignadas]:
+        inicio = inicios[idx] = origen.inicios[idx]
+        ot = tareas[idx][0]
+        indice_ot = ocupacion_ot.get(ot)
+        if indice_ot is None:
+            indice_ot = ocupacion_ot[ot] = IndiceOcupacion()
+        indice_ot.agregar(inicio, inicio + duraciones[idx])
+        estado_sim.asignadas.append(idx)
+
+    faltan[:] = faltan_origen
+    for diccionario, guardado in zip(memoria, memoria_origen):
+        diccionario.update(guardado)
+    conteos[:] = conteos_origen
+    for cola, guardada in zip(colas, colas_origen):
+        cola[:] = guardada
+
+
+def ejecutar_barrido(
+    estado_sim: EstadoSimulacion,
+    operarios_asignados: List[int],
+    tareas_por_operario: Dict[int, List[int]],
+) -> EstadoSimulacion:
+    """Versión de referencia: tras cada evento vuelve a barrer la cola de cada operario."""
+    estado_sim.reiniciar()
+    estado_sim.operarios_asignados = operarios_asignados
+    estado_sim.tareas_por_operario = tareas_por_operario
+
+    compilada = estado_sim.compilada
+    tareas = compilada.tareas
+    horizonte = compilada.horizonte
+    duraciones = compilada.duraciones_l
+    aptitud = compilada.aptitud_l
+    indice_operario = compilada.indice_operario
+    tiene_repuesto = compilada.tiene_repuesto_l
+    ot_de_tarea = compilada.ot_de_tarea_l
+    tipo_de_tarea = compilada.tipo_de_tarea_l
+    prereqs = compilada.prereqs_l
+    n_tipos = len(compilada.tipos)
+
+    estado = estado_sim.estado
+    inicios = estado_sim.inicios
+    completadas = estado_sim.completadas
+    ocupacion_ot = estado_sim.ocupacion_ot
+    asignadas = estado_sim.asignadas
+    rechazos = estado_sim.rechazos
+    tiempo_por_operario = estado_sim.tiempo_por_operario
+    eventos: List[Tuple[int, int, int]] = []
+
+    def intentar_asignar_tareas_operario(operario: int, tiempo_actual: int) -> bool:
+        """Intenta asignar la siguiente tarea disponible de un operario."""
+        if operario not in tareas_por_operario:
+            return False
+        tiempo_por_operario.setdefault(operario, 0)
+        if tiempo_por_operario[operario] > tiempo_actual:
+            return False
+
+        fila = indice_operario.get(operario)
+        for idx in tareas_por_operario[operario]:
+            if estado[idx] != PENDIENTE:
+                continue
+
+            if fila is None or not aptitud[fila][idx]:
+                estado_sim.pen_operario_no_apto += 1
+                estado[idx] = RECHAZADA
+                rechazos.append((idx, operario, "operario"))
+                continue
+
+            if not tiene_repuesto[idx]:
+                estado_sim.pen_repuestos += 1
+                estado[idx] = RECHAZADA
+                rechazos.append((idx, operario, "repuesto"))
+                continue
+
+            ot_idx = ot_de_tarea[idx]
+            base = ot_idx * n_tipos
+            if not all(completadas[base + req] for req in prereqs[idx]):
+                estado_sim.pen_prerequisitos += 0.1
+                continue
+
+            inicio = max(tiempo_actual, tiempo_por_operario[operario])
+            fin = inicio + duraciones[idx]
+
+            if fin > horizonte:
+                estado_sim.pen_exceso_tiempo += fin - horizonte
+                estado[idx] = RECHAZADA
+                rechazos.append((idx, operario, "horizonte"))
+                continue
+
+            ot = tareas[idx][0]
+            indice_ot = ocupacion_ot.get(ot)
+            if indice_ot is not None and not indice_ot.disponible(inicio, fin):
+                estado_sim.pen_ot_ocupada += 0.1
+                continue
+
+            inicios[idx] = inicio
+            if indice_ot is None:
+                indice_ot = ocupacion_ot[ot] = IndiceOcupacion()
+            indice_ot.agregar(inicio, fin)
+            tiempo_por_operario[operario] = fin
+            estado[idx] = ASIGNADA
+            asignadas.append(idx)
+            heapq.heappush(eventos, (fin, idx, operario))
+            return True
+
+        return False
+
+    operarios_cola = list(tareas_por_operario.keys())
+    for operario in operarios_cola:
+        intentar_asignar_tareas_operario(operario, 0)
+
+    while eventos:
+        tiempo_actual, idx, operario = heapq.heappop(eventos)
+        completadas[ot_de_tarea[idx] * n_tipos + tipo_de_tarea[idx]] = 1
+        intentar_asignar_tareas_operario(operario, tiempo_actual)
+        for otro_op in operarios_cola:
+            if otro_op != operario:
+                intentar_asignar_tareas_operario(otro_op, tiempo_actual)
+
+    for operario, cola in tareas_por_operario.items():
+        for idx in cola:
+            if estado[idx] == PENDIENTE:
+                rechazos.append((idx, operario, "pendiente"))
+
+    return estado_sim
+
+
+# _SUMAS_DECIMAS[k] es 0.1 sumado k veces partiendo de 0.0, tal como lo acumula el
+# barrido de referencia; multiplicar k * 0.1 no da el mismo float.
+_SUMAS_DECIMAS: List[float] = [0.0]
+
+
+def _decimas(cantidad: int) -> float:
+    while len(_SUMAS_DECIMAS) <= cantidad:
+        _SUMAS_DECIMAS.append(_SUMAS_DECIMAS[-1] + 0.1)
+    return _SUMAS_DECIMAS[cantidad]
+
+
+def _desviacion(valores: List[int]) -> float:
+    """``np.std(valores)`` sin crear arreglos, con el mismo resultado bit a bit.
+
+    NumPy suma en float64 por bloques de 8 acumuladores (suma "pairwise"); se repite
+    ese orden para que el fitness no cambie respecto de ``np.std``. Con más de 128
+    valores NumPy además parte el arreglo en mitades, así que se delega en él.
+    """
+    n = len(valores)
+    if n > 128:
+        return float(np.std(valores))
+    media = float(sum(valores)) / n
+    cuadrados = [(valor - media) * (valor - media) for valor in valores]
+    return math.sqrt(_suma_pairwise(cuadrados) / n)
+
+
+def _suma_pairwise(valores: List[float]) -> float:
+    n = len(valores)
+    if n < 8:
+        suma = 0.0
+        for valor in valores:
+            suma += valor
+        return suma
+    r = valores[:8]
+    fin_bloques = n - n % 8
+    for i in range(8, fin_bloques, 8):
+        r[0] += valores[i]
+        r[1] += valores[i + 1]
+        r[2] += valores[i + 2]
+        r[3] += valores[i + 3]
+        r[4] += valores[i + 4]
+        r[5] += valores[i + 5]
+        r[6] += valores[i + 6]
+        r[7] += valores[i + 7]
+    suma = ((r[0] + r[1]) + (r[2] + r[3])) + ((r[4] + r[5]) + (r[6] + r[7]))
+    for i in range(fin_bloques, n):
+        suma += valores[i]
+    return suma
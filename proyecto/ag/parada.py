@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Optional
+
+
+class ControlParada:
+    """Criterios de parada anticipada del AG, evaluados al cerrar cada generación.
+
+    - ``generaciones_saturacion``: corta si el mejor fitness no mejoró en las últimas
+      K generaciones.
+    - ``tiempo_maximo_s``: corta cuando el tiempo desde el inicio de la corrida
+      (incluida la población inicial) alcanza el presupuesto.
+    - ``max_evaluaciones``: corta antes de la generación que superaría el máximo de
+      evaluaciones de fitness, estimando su costo con la generación anterior.
+
+    ``en_generacion`` se pasa como ``on_generation`` de PyGAD; ``criterios`` guarda
+    los que dispararon.
+    """
+
+    def __init__(
+        self,
+        generaciones_saturacion: Optional[int] = None,
+        tiempo_maximo_s: Optional[float] = None,
+        max_evaluaciones: Optional[int] = None,
+    ) -> None:
+        if generaciones_saturacion is not None and generaciones_saturacion < 1:
+            raise ValueError("generaciones_saturacion debe ser un entero positivo.")
+        if tiempo_maximo_s is not None and tiempo_maximo_s <= 0:
+            raise ValueError("tiempo_maximo_s debe ser positivo.")
+        if max_evaluaciones is not None and max_evaluaciones < 1:
+            raise ValueError("max_evaluaciones debe ser un entero positivo.")
+        self.generaciones_saturacion = generaciones_saturacion
+        self.tiempo_maximo_s = tiempo_maximo_s
+        self.max_evaluaciones = max_evaluaciones
+        self.evaluaciones = 0
+        self.criterios: List[str] = []
+        self._evaluaciones_previas = 0
+        self._inicio = time.perf_counter()
+
+    @classmethod
+    def desde_opciones(cls, opciones: Dict[str, Any]) -> "ControlParada":
+        return cls(
+            generaciones_saturacion=opciones.get("generaciones_saturacion"),
+            tiempo_maximo_s=opciones.get("tiempo_maximo_s"),
+            max_evaluaciones=opciones.get("max_evaluaciones"),
+        )
+
+    @property
+    def segundos(self) -> float:
+        return time.perf_counter() - self._inicio
+
+    def registrar_evaluaciones(self, cantidad: int) -> None:
+        self.evaluaciones += cantidad
+
+    def en_generacion(self, ga_instance) -> Optional[str]:
+        # Mejor fitness de cada población, incluida la que se acaba de evaluar.
+        trayectoria = list(ga_instance.best_solutions_fitness)
+        trayectoria.append(max(ga_instance.last_generation_fitness))
+        return self.revisar(trayectoria)
+
+    def revisar(self, trayectoria: List[float]) -> Optional[str]:
+        """Revisa los criterios al cerrar un paso (una generación o una época de islas).
+
+        ``trayectoria`` es el mejor fitness por generación hasta el momento; el costo del
+        próximo paso se estima con las evaluaciones registradas desde la revisión anterior.
+        """
+        evaluaciones_paso = self.evaluaciones - self._evaluaciones_previas
+        self._evaluaciones_previas = self.evaluaciones
+
+        k = self.generaciones_saturacion
+        if k is not None and len(trayectoria) > k and trayectoria[-1] <= trayectoria[-1 - k]:
+            self.criterios.append("saturacion")
+        if self.tiempo_maximo_s is not None and self.segundos >= self.tiempo_maximo_s:
+            self.criterios.append("tiempo")
+        if (
+            self.max_evaluaciones is not None
+            and self.evaluaciones + evaluaciones_paso > self.max_evaluaciones
+        ):
+            self.criterios.append("evaluaciones")
+        return "stop" if self.criterios else None
+
+    def resumen(self, generaciones: int) -> Dict[str, Any]:
+        return {
+            # Sin criterio anticipado la corrida terminó por ``num_generations``.
+            "criterios": list(self.criterios) or ["num_generations"],
+            "generaciones": generaciones,
+            "evaluaciones": self.evaluaciones,
+            "segundos": self.segundos,
+        }
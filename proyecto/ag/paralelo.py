@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional
+
+import numpy as np
+
+from .compilada import InstanciaCompilada
+from .motor import evaluar_poblacion
+
+
+# Filas mínimas por fragmento para que valga la pena mandarlo a un worker. Cada
+# llamada al pool tiene un costo fijo (serializar las filas, despertar al worker y
+# recibir los valores); con menos filas, por ejemplo cuando la cache de fitness deja
+# pocos fallos por generación, el lote se evalúa en el proceso actual.
+MIN_FILAS_POR_PROCESO = 8
+
+# Instancia compilada de cada proceso worker; se fija una sola vez en el inicializador.
+_COMPILADA_WORKER: Optional[InstanciaCompilada] = None
+
+
+def _inicializar_worker(compilada: InstanciaCompilada) -> None:
+    global _COMPILADA_WORKER
+    _COMPILADA_WORKER = compilada
+
+
+def _evaluar_fragmento(soluciones: np.ndarray) -> np.ndarray:
+    if _COMPILADA_WORKER is None:
+        raise RuntimeError("El worker no recibió la instancia compilada.")
+    return evaluar_poblacion(soluciones, _COMPILADA_WORKER)
+
+
+class EvaluadorParalelo:
+    """Reparte el fitness de una población entre procesos que ya tienen la instancia.
+
+    La instancia se envía a cada worker una única vez (al crearlo); por llamada sólo
+    viajan las filas de la población y los valores de fitness. Los fragmentos se
+    reensamblan en orden, así que el resultado es idéntico al de ``evaluar_poblacion``.
+
+    Cada fragmento lleva al menos ``min_filas_por_proceso`` filas; si el lote no
+    alcanza para dos fragmentos se evalúa en el proceso actual. ``llamadas_pool`` y
+    ``llamadas_locales`` cuentan qué camino tomó cada llamada.
+    """
+
+    def __init__(
+        self,
+        compilada: InstanciaCompilada,
+        num_procesos: int,
+        min_filas_por_proceso: int = MIN_FILAS_POR_PROCESO,
+    ) -> None:
+        if num_procesos < 1:
+            raise ValueError("num_procesos debe ser un entero positivo.")
+        if min_filas_por_proceso < 1:
+            raise ValueError("min_filas_por_proceso debe ser un entero positivo.")
+        self.compilada = compilada
+        self.num_procesos = num_procesos
+        self.min_filas_por_proceso = min_filas_por_proceso
+        self.llamadas_pool = 0
+        self.llamadas_locales = 0
+        self._pool = ProcessPoolExecutor(
+            max_workers=num_procesos,
+            initializer=_inicializar_worker,
+            initargs=(compilada,),
+        )
+
+    def __call__(self, soluciones: np.ndarray) -> np.ndarray:
+        soluciones = np.asarray(soluciones)
+        procesos = min(self.num_procesos, len(soluciones) // self.min_filas_por_proceso)
+        if procesos < 2:
+            self.llamadas_locales += 1
+            return evaluar_poblacion(soluciones, self.compilada)
+        self.llamadas_pool += 1
+        fragmentos = np.array_split(soluciones, procesos)
+        return np.concatenate(list(self._pool.map(_evaluar_fragmento, fragmentos)))
+
+    def cerrar(self) -> None:
+        self._pool.shutdown(wait=True)
+
+    def __enter__(self) -> "EvaluadorParalelo":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cerrar()
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+
+class PerfilCorrida:
+    """Instrumentación opcional de ``run_generations`` por fase y por generación.
+
+    Registra el tiempo de preparación, de la población inicial, de cada generación
+    (total y dentro de las llamadas de fitness, con sus evaluaciones y el mejor
+    fitness alcanzado) y de la construcción del resultado. El tiempo de una
+    generación que no es fitness corresponde a selección, cruce y mutación de PyGAD.
+    """
+
+    def __init__(self) -> None:
+        self._inicio = time.perf_counter()
+        self._marca = self._inicio
+        self._fitness_s = 0.0
+        self._evaluaciones = 0
+        self._mejor = -np.inf
+        self.fases: Dict[str, float] = {}
+        self.poblacion_inicial: Optional[Dict[str, float]] = None
+        self.generaciones: List[Dict[str, float]] = []
+
+    def medir_fitness(
+        self, evaluar: Callable[[np.ndarray], np.ndarray]
+    ) -> Callable[[np.ndarray], np.ndarray]:
+        def evaluar_medido(soluciones: np.ndarray) -> np.ndarray:
+            inicio = time.perf_counter()
+            valores = evaluar(soluciones)
+            self._fitness_s += time.perf_counter() - inicio
+            self._evaluaciones += len(soluciones)
+            return valores
+
+        return evaluar_medido
+
+    def cerrar_fase(self, nombre: str) -> None:
+        ahora = time.perf_counter()
+        self.fases[nombre] = self.fases.get(nombre, 0.0) + ahora - self._marca
+        self._marca = ahora
+
+    def en_inicio(self, ga_instance) -> None:
+        self.cerrar_fase("preparacion_s")
+        self._reiniciar_ventana()
+
+    def en_fitness(self, ga_instance, fitness: np.ndarray) -> None:
+        # PyGAD llama a on_fitness al comenzar cada generación; la primera vez cierra
+        # la evaluación de la población inicial.
+        if self.poblacion_inicial is None:
+            self.poblacion_inicial = self._ventana(fitness)
+            self._reiniciar_ventana()
+
+    def en_generacion(self, ga_instance) -> None:
+        registro = self._ventana(ga_instance.last_generation_fitness)
+        registro["generacion"] = ga_instance.generations_completed
+        self.generaciones.append(registro)
+        self._reiniciar_ventana()
+
+    def resumen(self) -> Dict[str, Any]:
+        fitness_s = sum(registro["fitness_s"] for registro in self.generaciones)
+        ga_s = sum(registro["segundos"] for registro in self.generaciones)
+        if self.poblacion_inicial is not None:
+            fitness_s += self.poblacion_inicial["fitness_s"]
+            ga_s += self.poblacion_inicial["segundos"]
+        return {
+            "fases": {**self.fases, "ga_s": ga_s, "fitness_s": fitness_s},
+            "total_s": time.perf_counter() - self._inicio,
+            "poblacion_inicial": self.poblacion_inicial,
+            "generaciones": self.generaciones,
+            "mejor_fitness": [registro["mejor_fitness"] for registro in self.generaciones],
+        }
+
+    def _ventana(self, fitness: np.ndarray) -> Dict[str, float]:
+        self._mejor = max(self._mejor, float(np.max(fitness)))
+        return {
+            "segundos": time.perf_counter() - self._marca,
+            "fitness_s": self._fitness_s,
+            "evaluaciones": self._evaluaciones,
+            "mejor_fitness": self._mejor,
+        }
+
+    def _reiniciar_ventana(self) -> None:
+        self._marca = time.perf_counter()
+        self._fitness_s = 0.0
+        self._evaluaciones = 0
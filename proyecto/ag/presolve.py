@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+import numpy as np
+
+from .compilada import InstanciaCompilada
+
+
+@dataclass
+class CromosomaReducido:
+    """Cromosoma con sólo las decisiones libres y su correspondencia con el completo.
+
+    ``genes_libres`` indica, para cada gen reducido, su posición en el cromosoma
+    completo; el resto de posiciones toma el valor fijo de ``plantilla``.
+    """
+
+    n_tareas: int
+    plantilla: np.ndarray
+    genes_libres: np.ndarray
+    gene_space: List[Any]
+    operarios_fijos: int
+    tareas_sin_repuesto: int
+
+    @property
+    def num_genes(self) -> int:
+        return len(self.genes_libres)
+
+    def expandir(self, soluciones: np.ndarray) -> np.ndarray:
+        """Lleva una o varias soluciones reducidas al cromosoma completo."""
+        soluciones = np.asarray(soluciones, dtype=float)
+        filas = np.atleast_2d(soluciones)
+        completas = np.tile(self.plantilla, (len(filas), 1))
+        completas[:, self.genes_libres] = filas
+        return completas[0] if soluciones.ndim == 1 else completas
+
+    def reducir(self, soluciones: np.ndarray) -> np.ndarray:
+        """Extrae de una o varias soluciones completas los genes libres."""
+        return np.asarray(soluciones, dtype=float)[..., self.genes_libres]
+
+    def estadisticas(self) -> Dict[str, int]:
+        return {
+            "genes_originales": len(self.plantilla),
+            "genes_libres": self.num_genes,
+            "operarios_fijos": self.operarios_fijos,
+            "tareas_sin_repuesto": self.tareas_sin_repuesto,
+        }
+
+
+def presolver(gene_space: List[Any], compilada: InstanciaCompilada) -> CromosomaReducido:
+    """Quita del cromosoma los genes que no influyen en la búsqueda.
+
+    - Gen de operario de una tarea con un único operario apto: siempre vale ese.
+    - Gen de prioridad de una tarea sin repuesto en su OT: la simulación la rechaza en
+      cuanto la alcanza la cola de su operario (siempre lo hace, con la misma
+      penalización) sin detener el barrido, así que su posición en la cola no cambia
+      nada. Se fija en 0. Su gen de operario se conserva: el orden en que aparecen los
+      operarios en el cromosoma decide el orden de barrido entre ellos.
+    """
+    n_tareas = compilada.n_tareas
+    plantilla = np.zeros(2 * n_tareas, dtype=float)
+    libres_operario: List[int] = []
+    libres_prioridad: List[int] = []
+    espacio_operario: List[Any] = []
+    operarios_fijos = 0
+    tareas_sin_repuesto = 0
+
+    for idx in range(n_tareas):
+        opciones = gene_space[idx]
+        plantilla[idx] = opciones[0]
+        if len(opciones) == 1:
+            operarios_fijos += 1
+        else:
+            libres_operario.append(idx)
+            espacio_operario.append(opciones)
+        if compilada.tiene_repuesto_l[idx]:
+            libres_prioridad.append(n_tareas + idx)
+        else:
+            tareas_sin_repuesto += 1
+
+    return CromosomaReducido(
+        n_tareas=n_tareas,
+        plantilla=plantilla,
+        genes_libres=np.asarray(libres_operario + libres_prioridad, dtype=np.int64),
+        gene_space=espacio_operario + [gene_space[pos] for pos in libres_prioridad],
+        operarios_fijos=operarios_fijos,
+        tareas_sin_repuesto=tareas_sin_repuesto,
+    )
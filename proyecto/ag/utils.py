@@ -1,7 +1,9 @@
 import csv
 from pathlib import Path
 from statistics import pstdev
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Sequence
+
+from comun.salida import SalidaSQLite
 
 
 CSV_COLUMNS = [
@@ -14,8 +16,13 @@ CSV_COLUMNS = [
     "makespan",
     "carga_total",
     "carga_std",
+    "generaciones",
+    "criterios_parada",
 ]
 
+# Columnas opcionales de rendimiento por instancia (``simulador.py --perfil``).
+CSV_COLUMNS_RENDIMIENTO = ["runtime_s", "evaluaciones"]
+
 
 def formatear_resultados_ag(
     instancia: Dict[str, Any],
@@ -45,6 +52,9 @@ def formatear_resultados_ag(
         "makespan": simulacion.get("makespan", 0),
         "carga_total": carga_total,
         "carga_std": carga_std,
+        "generaciones": simulacion.get("generaciones"),
+        "criterios_parada": "+".join(simulacion.get("criterios_parada", [])) or None,
+        "evaluaciones": simulacion.get("evaluaciones"),
         "carga_por_operario": carga_por_operario,
         "tiempo_por_operario": dict(tiempos_operario),
         "intervalos_por_ot": {
@@ -98,7 +108,11 @@ def _calcular_carga_por_operario(
     return carga
 
 
-def exportar_csv_ag(resultado: Dict[str, Any], ruta: str) -> None:
+def exportar_csv_ag(
+    resultado: Dict[str, Any],
+    ruta: str,
+    columnas: Sequence[str] = CSV_COLUMNS,
+) -> None:
     """Agrega el resultado a un CSV orientado a métricas comparativas."""
 
     csv_path = Path(ruta)
@@ -106,7 +120,18 @@ def exportar_csv_ag(resultado: Dict[str, Any], ruta: str) -> None:
     escribir_encabezado = not csv_path.exists()
 
     with csv_path.open("a", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=CSV_COLUMNS)
+        writer = csv.DictWriter(csvfile, fieldnames=columnas)
         if escribir_encabezado:
             writer.writeheader()
-        writer.writerow({columna: resultado.get(columna) for columna in CSV_COLUMNS})
+        writer.writerow({columna: resultado.get(columna) for columna in columnas})
+
+
+def exportar_sqlite_ag(
+    resultado: Dict[str, Any],
+    ruta: str,
+    columnas: Sequence[str] = CSV_COLUMNS,
+) -> None:
+    """Guarda el resultado, con sus asignaciones, en una base SQLite (ver ``SalidaSQLite``)."""
+
+    with SalidaSQLite(ruta, columnas) as salida:
+        salida.escribir(resultado)
@@ -0,0 +1 @@
+"""Benchmarks de rendimiento; se ejecutan desde ``proyecto/`` con ``python -m benchmarks.<nombre>``."""
@@ -0,0 +1,95 @@
+"""Verifica ``ResumenComparativo`` contra un cálculo por lotes sobre un CSV de resultados.
+
+Lee el CSV de ``simulador.py``, alimenta el resumen en línea instancia por instancia
+y compara cada media y desviación con las de ``statistics`` calculadas sobre todas
+las filas de cada grupo. Mide además el costo por instancia del resumen en línea.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.agregados resultados.csv
+"""
+
+import argparse
+import csv
+import math
+import statistics
+import time
+from itertools import groupby
+from typing import Dict, List, Tuple
+
+from comun.agregados import GRUPO_DIFERENCIA, METRICAS_RESUMEN, ResumenComparativo
+
+
+def _leer(ruta: str) -> List[List[Dict[str, float]]]:
+    """Filas del CSV agrupadas por instancia, con las métricas convertidas a número."""
+    with open(ruta, newline="") as archivo:
+        filas = list(csv.DictReader(archivo))
+    instancias = []
+    for _, grupo in groupby(filas, key=lambda fila: fila["instancia_id"]):
+        instancias.append(
+            [
+                {
+                    "algoritmo": fila["algoritmo"],
+                    "num_OT": int(fila["num_OT"]),
+                    **{metrica: float(fila[metrica]) for metrica in METRICAS_RESUMEN},
+                }
+                for fila in grupo
+            ]
+        )
+    return instancias
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("csv")
+    parser.add_argument("--ancho_rango", type=int, default=4)
+    args = parser.parse_args()
+
+    instancias = _leer(args.csv)
+    resumen = ResumenComparativo(args.ancho_rango)
+    inicio = time.perf_counter()
+    for resultados in instancias:
+        resumen.registrar_instancia(resultados)
+    segundos = time.perf_counter() - inicio
+
+    valores: Dict[Tuple[str, str], Dict[str, List[float]]] = {}
+    for resultados in instancias:
+        por_algoritmo = {resultado["algoritmo"]: resultado for resultado in resultados}
+        num_ot = resultados[0]["num_OT"]
+        rango = (num_ot // args.ancho_rango) * args.ancho_rango
+        etiqueta = f"{rango}-{rango + args.ancho_rango - 1}"
+        grupos = list(por_algoritmo.items())
+        if "AG" in por_algoritmo and "SPT" in por_algoritmo:
+            diferencia = {
+                metrica: por_algoritmo["AG"][metrica] - por_algoritmo["SPT"][metrica]
+                for metrica in METRICAS_RESUMEN
+            }
+            grupos.append((GRUPO_DIFERENCIA, diferencia))
+        for grupo, resultado in grupos:
+            for clave in ((grupo, etiqueta), (grupo, "todas")):
+                for metrica in METRICAS_RESUMEN:
+                    valores.setdefault(clave, {}).setdefault(metrica, []).append(resultado[metrica])
+
+    maximo_error = 0.0
+    for fila in resumen.resumen():
+        lote = valores[(fila["grupo"], fila["num_OT"])]
+        for metrica in METRICAS_RESUMEN:
+            datos = lote[metrica]
+            esperado_desv = statistics.stdev(datos) if len(datos) > 1 else 0.0
+            for obtenido, esperado in (
+                (fila[f"{metrica}_media"], statistics.fmean(datos)),
+                (fila[f"{metrica}_desv"], esperado_desv),
+            ):
+                maximo_error = max(maximo_error, abs(obtenido - esperado))
+                if not math.isclose(obtenido, esperado, rel_tol=1e-9, abs_tol=1e-9):
+                    raise SystemExit(
+                        f"{fila['grupo']} {fila['num_OT']} {metrica}: {obtenido} != {esperado}"
+                    )
+
+    print(resumen.tabla())
+    print(f"Instancias: {len(instancias)}; {segundos / len(instancias) * 1e6:.1f} us por instancia")
+    print(f"Coincide con el cálculo por lotes (error máximo {maximo_error:.2e}).")
+
+
+if __name__ == "__main__":
+    main()
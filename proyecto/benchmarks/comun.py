@@ -0,0 +1,32 @@
+"""Utilidades compartidas por los benchmarks."""
+
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+from ag.ag import construir_gene_space
+from ag.motor import EstadoSimulacion
+
+
+def poblacion_aleatoria(
+    instancia: Dict[str, Any], individuos: int, rng: np.random.Generator
+) -> np.ndarray:
+    """Individuos al azar: operarios válidos del ``gene_space`` y prioridades en [0, 1)."""
+    gene_space = construir_gene_space(instancia)
+    n_tareas = len(instancia["tareas_a_programar"])
+    filas = []
+    for _ in range(individuos):
+        operarios = [rng.choice(opciones) for opciones in gene_space[:n_tareas]]
+        filas.append(operarios + list(rng.random(n_tareas)))
+    return np.asarray(filas, dtype=float)
+
+
+def resumen_simulacion(estado_sim: EstadoSimulacion) -> Tuple[Any, ...]:
+    """Cronograma, rechazos, tiempos por operario, ocupación por OT y penalizaciones."""
+    return (
+        [(idx, estado_sim.inicios[idx]) for idx in estado_sim.asignadas],
+        list(estado_sim.rechazos),
+        list(estado_sim.tiempo_por_operario.items()),
+        list(estado_sim.intervalos_por_ot().items()),
+        estado_sim.penalizaciones(),
+    )
@@ -0,0 +1,81 @@
+"""Corridas cortas del AG con configuraciones poco habituales.
+
+Verifica que ``run_generations`` termine y devuelva un individuo válido con
+poblaciones más chicas que el lote de fitness por defecto, con lotes explícitos,
+sin lotes (``fitness_batch_size=None``) y en el modo de islas, donde además el perfil
+y las estadísticas de la cache deben llegar al resultado. Además compara el
+resultado de la población chica con el de la misma corrida evaluada de a un
+individuo: el tamaño del lote no debe cambiar la solución.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.configuraciones --num_ot 8
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Dict, List, Tuple
+
+from ag.ag import run_generations
+from config.generador_instancias import generar_instancia
+
+
+CONFIGURACIONES: List[Tuple[str, Dict[str, Any]]] = [
+    ("poblacion_chica", {"sol_per_pop": 20, "num_parents_mating": 4, "keep_parents": 2}),
+    (
+        "poblacion_chica_sin_lote",
+        {
+            "sol_per_pop": 20,
+            "num_parents_mating": 4,
+            "keep_parents": 2,
+            "fitness_batch_size": None,
+        },
+    ),
+    ("lote_explicito", {"sol_per_pop": 30, "fitness_batch_size": 7, "keep_parents": 2}),
+    (
+        "islas_poblacion_chica",
+        {"sol_per_pop": 12, "num_parents_mating": 4, "keep_parents": 2, "islas": 2},
+    ),
+    ("islas_perfil", {"sol_per_pop": 20, "islas": 2, "intervalo_migracion": 2, "perfilar": True}),
+]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_ot", type=int, default=8)
+    parser.add_argument("--generaciones", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    base = generar_instancia("bench_configuraciones", args.num_ot)
+    resultados = {}
+    for nombre, config in CONFIGURACIONES:
+        instancia = {
+            **base,
+            "ga_config": {"num_generations": args.generaciones, "random_seed": args.seed, **config},
+        }
+        inicio = time.perf_counter()
+        resultado = run_generations(instancia)
+        duracion = time.perf_counter() - inicio
+        if len(resultado["solution"]) != 2 * len(base["tareas_a_programar"]):
+            raise AssertionError(f"{nombre}: la solución no tiene la longitud esperada.")
+        if config.get("perfilar") and resultado["perfil"] is None:
+            raise AssertionError(f"{nombre}: se pidió perfilar y no hay perfil.")
+        if resultado["cache_fitness"] is None:
+            raise AssertionError(f"{nombre}: la cache de fitness no informó estadísticas.")
+        resultados[nombre] = resultado
+        print(f"{nombre:<26} fitness {resultado['fitness']:>10.2f}  {duracion:.2f} s")
+
+    con_lote = resultados["poblacion_chica"]
+    sin_lote = resultados["poblacion_chica_sin_lote"]
+    if con_lote["fitness"] != sin_lote["fitness"] or (
+        con_lote["solution"].tolist() != sin_lote["solution"].tolist()
+    ):
+        raise AssertionError("El tamaño del lote cambió la solución de la población chica.")
+    print("Todas las configuraciones terminaron; el lote no cambia la solución.")
+
+
+if __name__ == "__main__":
+    main()
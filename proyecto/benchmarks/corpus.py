@@ -0,0 +1,77 @@
+"""Benchmark del corpus binario de instancias frente a regenerarlas.
+
+Genera ``--n`` instancias con ``iterar_instancias``, las guarda con ``guardar_corpus``
+y mide el tamaño del archivo (comparado con un pickle de la lista), el tiempo de
+apertura y el de armar ``--consultas`` instancias al azar desde el corpus y con
+``generar_instancia_lote``. Verifica además que cada instancia leída sea idéntica a
+la generada y que ``instancia_id`` acepte índices negativos y rechace los fuera de
+rango como ``corpus[indice]``.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.corpus --n 20000 --consultas 2000
+"""
+
+import argparse
+import pickle
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from config.corpus import CorpusInstancias, guardar_corpus
+from config.generador_instancias import generar_instancia_lote, iterar_instancias
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--n", type=int, default=20000)
+    parser.add_argument("--consultas", type=int, default=2000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = Path(carpeta) / "corpus.bin"
+        inicio = time.perf_counter()
+        guardar_corpus(iterar_instancias(args.n, seed=args.seed), ruta)
+        guardar_s = time.perf_counter() - inicio
+        tamano_pickle = len(pickle.dumps(list(iterar_instancias(min(args.n, 1000), seed=args.seed))))
+        tamano_pickle *= args.n / min(args.n, 1000)
+
+        inicio = time.perf_counter()
+        corpus = CorpusInstancias(ruta)
+        abrir_s = time.perf_counter() - inicio
+
+        indices = random.Random(args.seed).choices(range(args.n), k=args.consultas)
+        inicio = time.perf_counter()
+        leidas = [corpus[indice] for indice in indices]
+        leer_s = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        generadas = [generar_instancia_lote(args.seed, indice) for indice in indices]
+        generar_s = time.perf_counter() - inicio
+
+        iguales = all(leida == generada for leida, generada in zip(leidas, generadas))
+        iguales = iguales and all(
+            corpus.instancia_id(indice) == leida["instancia_id"]
+            and corpus.instancia_id(indice - args.n) == leida["instancia_id"]
+            for indice, leida in zip(indices, leidas)
+        )
+        for fuera_de_rango in (args.n, -args.n - 1):
+            try:
+                corpus.instancia_id(fuera_de_rango)
+            except IndexError:
+                continue
+            iguales = False
+        print(f"Instancias: {args.n}")
+        print(f"Archivo: {ruta.stat().st_size / 1e6:.1f} MB (pickle estimado {tamano_pickle / 1e6:.1f} MB)")
+        print(f"Guardar: {guardar_s:.2f} s")
+        print(f"Abrir: {abrir_s * 1e3:.2f} ms")
+        print(f"Armar desde el corpus: {leer_s / args.consultas * 1e6:.1f} us/instancia")
+        print(f"Regenerar: {generar_s / args.consultas * 1e6:.1f} us/instancia")
+        print("Instancias idénticas a las generadas:", iguales)
+        if not iguales:
+            raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Reevaluación incremental de hijos con pocos genes cambiados vs. simulación completa.
+
+Para cada tamaño de instancia traza ``--padres`` individuos al azar con
+``trazar_individuo`` y evalúa ``--hijos`` hijos de cada uno que difieren en
+``--genes`` genes (operario o prioridad) con ``evaluar_cambios``. Mide el tiempo por
+hijo frente a ``fitness_func`` sobre el hijo completo, con el corte por defecto
+(``MAX_GENES_INCREMENTAL``: más allá se simula completo) y sin corte
+(``max_genes=None``), el mejor de ``--repeticiones`` pasadas alternadas; la pasada media desde la que se retoma la simulación sin corte
+y el costo de trazar al padre. Antes de medir compara cada hijo (cronograma,
+rechazos, tiempos por operario, penalizaciones y fitness) con su simulación completa,
+en ambos modos, y falla si algo difiere.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.incremental --num_ot 12 25 50 --genes 1 2 5 20
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from ag.ag import construir_gene_space, fitness_func
+from ag.compilada import InstanciaCompilada, compilar_instancia
+from ag.incremental import MAX_GENES_INCREMENTAL, evaluar_cambios, trazar_individuo
+from ag.motor import EstadoSimulacion, decodificar, ejecutar
+from benchmarks.comun import poblacion_aleatoria, resumen_simulacion
+from config.generador_instancias import generar_instancia
+
+
+def _cambios(
+    gene_space: List[Any], n_genes: int, rng: np.random.Generator
+) -> Dict[int, float]:
+    n_tareas = len(gene_space) // 2
+    cambios = {}
+    for gen in rng.choice(len(gene_space), size=min(n_genes, len(gene_space)), replace=False):
+        gen = int(gen)
+        if gen < n_tareas:
+            cambios[gen] = float(rng.choice(gene_space[gen]))
+        else:
+            cambios[gen] = float(rng.random())
+    return cambios
+
+
+def _verificar(
+    compilada: InstanciaCompilada,
+    poblacion: np.ndarray,
+    gene_space: List[Any],
+    n_genes: int,
+    hijos: int,
+    rng: np.random.Generator,
+) -> None:
+    for posicion, individuo in enumerate(poblacion):
+        padre = trazar_individuo(individuo, compilada, detalle=True)
+        max_genes = None if posicion % 2 else MAX_GENES_INCREMENTAL
+        for _ in range(hijos):
+            # Los hijos trazados pasan a ser padres: se prueban también cadenas.
+            hijo = evaluar_cambios(
+                padre, _cambios(gene_space, n_genes, rng), trazar=True, max_genes=max_genes
+            )
+            completo = ejecutar(
+                EstadoSimulacion(compilada), *decodificar(hijo.genotipo, compilada)
+            )
+            if resumen_simulacion(completo) != resumen_simulacion(hijo.estado_sim) or (
+                completo.fitness() != hijo.fitness
+            ):
+                raise AssertionError(f"Un hijo con {n_genes} genes cambiados difiere.")
+            padre = hijo
+
+
+def _tiempo(funcion: Callable[[], None]) -> float:
+    inicio = time.perf_counter()
+    funcion()
+    return time.perf_counter() - inicio
+
+
+def medir(
+    num_ots: List[int],
+    genes: List[int],
+    padres: int,
+    hijos: int,
+    repeticiones: int,
+    seed: int,
+) -> List[Dict[str, float]]:
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    filas = []
+    for num_ot in num_ots:
+        instancia = generar_instancia(f"bench_incremental_{num_ot}", num_ot)
+        compilada = compilar_instancia(instancia)
+        gene_space = construir_gene_space(instancia)
+        poblacion = poblacion_aleatoria(instancia, padres, rng)
+
+        inicio = time.perf_counter()
+        trazas = [trazar_individuo(individuo, compilada) for individuo in poblacion]
+        trazar_us = (time.perf_counter() - inicio) / padres * 1e6
+        inicio = time.perf_counter()
+        for individuo in poblacion:
+            fitness_func(individuo, 0, compilada)
+        completo_padre_us = (time.perf_counter() - inicio) / padres * 1e6
+
+        for n_genes in genes:
+            _verificar(compilada, poblacion[:5], gene_space, n_genes, 10, rng)
+            lotes = [
+                (traza, [_cambios(gene_space, n_genes, rng) for _ in range(hijos)])
+                for traza in trazas
+            ]
+            completos = []
+            for traza, cambios_hijos in lotes:
+                for cambios in cambios_hijos:
+                    genotipo = traza.genotipo.copy()
+                    genotipo[list(cambios)] = list(cambios.values())
+                    completos.append(genotipo)
+
+            def completo() -> None:
+                for genotipo in completos:
+                    fitness_func(genotipo, 0, compilada)
+
+            def incremental(max_genes: Optional[int]) -> None:
+                for traza, cambios_hijos in lotes:
+                    for cambios in cambios_hijos:
+                        evaluar_cambios(traza, cambios, max_genes=max_genes)
+
+            # Las tres variantes se alternan en cada repetición y se toma la mejor,
+            # para que el orden y el ruido no decidan el speedup.
+            completo_s = incremental_s = sin_corte_s = float("inf")
+            for _ in range(repeticiones):
+                completo_s = min(completo_s, _tiempo(completo))
+                incremental_s = min(
+                    incremental_s, _tiempo(lambda: incremental(MAX_GENES_INCREMENTAL))
+                )
+                sin_corte_s = min(sin_corte_s, _tiempo(lambda: incremental(None)))
+
+            reinicios = [
+                evaluar_cambios(traza, cambios, max_genes=None).pasada_reinicio
+                / max(len(traza.registro.asignadas), 1)
+                for traza, cambios_hijos in lotes
+                for cambios in cambios_hijos
+            ]
+
+            evaluados = len(completos)
+            filas.append(
+                {
+                    "num_ot": num_ot,
+                    "num_tareas": compilada.n_tareas,
+                    "genes": n_genes,
+                    "completo_us": completo_s / evaluados * 1e6,
+                    "incremental_us": incremental_s / evaluados * 1e6,
+                    "speedup": completo_s / incremental_s,
+                    "sin_corte_us": sin_corte_s / evaluados * 1e6,
+                    "speedup_sin_corte": completo_s / sin_corte_s,
+                    "reinicio": float(np.mean(reinicios)),
+                    "trazar_us": trazar_us,
+                    "padre_us": completo_padre_us,
+                }
+            )
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_ot", type=int, nargs="+", default=[12, 25, 50])
+    parser.add_argument("--genes", type=int, nargs="+", default=[1, 2, 5, 20])
+    parser.add_argument("--padres", type=int, default=20)
+    parser.add_argument("--hijos", type=int, default=20)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    filas = medir(
+        args.num_ot, args.genes, args.padres, args.hijos, args.repeticiones, args.seed
+    )
+    print(
+        f"{'num_ot':>6} {'tareas':>6} {'genes':>5} {'completo us':>12} "
+        f"{'incremental us':>15} {'speedup':>8} {'sin corte us':>13} {'speedup':>8} "
+        f"{'reinicio':>9} {'trazar/padre':>13}"
+    )
+    for fila in filas:
+        print(
+            f"{fila['num_ot']:>6} {fila['num_tareas']:>6} {fila['genes']:>5} "
+            f"{fila['completo_us']:>12.1f} {fila['incremental_us']:>15.1f} "
+            f"{fila['speedup']:>8.2f} {fila['sin_corte_us']:>13.1f} "
+            f"{fila['speedup_sin_corte']:>8.2f} {fila['reinicio']:>9.0%} "
+            f"{fila['trazar_us'] / fila['padre_us']:>13.2f}"
+        )
+    print(
+        f"Con más de {MAX_GENES_INCREMENTAL} genes cambiados evaluar_cambios simula el hijo "
+        "completo: retomar la instantánea no ahorra pasadas y cuesta más. La ganancia "
+        "esperable, con uno o dos genes, ronda 1.1 a 1.4 veces."
+    )
+    print("Los hijos reevaluados coinciden con su simulación completa.")
+
+
+if __name__ == "__main__":
+    main()
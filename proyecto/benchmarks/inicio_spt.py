@@ -0,0 +1,70 @@
+"""Generaciones hasta un fitness objetivo con y sin población inicial sembrada con SPT.
+
+Para cada instancia corre el AG dos veces con la misma semilla: con población
+inicial aleatoria y con ``inicio_spt``. El objetivo es el mejor fitness final de la
+corrida aleatoria; se reporta la generación en que cada variante lo alcanza, además
+del fitness del cromosoma SPT y el mejor de la población inicial.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.inicio_spt --num_ot 4 8 12 20 --generaciones 60
+"""
+
+import argparse
+import random
+from typing import Dict, List
+
+from ag.ag import construir_gene_space, fitness_func, run_generations
+from ag.inicio import codificar_spt
+from benchmarks.presolve import generacion_objetivo
+from config.generador_instancias import generar_instancia
+
+
+def medir(num_ot: int, generaciones: int, seed: int) -> Dict[str, object]:
+    random.seed(seed)
+    instancia = generar_instancia(f"bench_inicio_{num_ot}", num_ot)
+    cromosoma_spt = codificar_spt(instancia, construir_gene_space(instancia))
+
+    trayectorias: Dict[bool, List[float]] = {}
+    for inicio_spt in (False, True):
+        instancia["ga_config"] = {"num_generations": generaciones, "inicio_spt": inicio_spt}
+        resultado = run_generations(instancia)
+        trayectorias[inicio_spt] = list(resultado["simulacion"]["best_solutions_fitness"])
+
+    objetivo = trayectorias[False][-1]
+    return {
+        "num_ot": num_ot,
+        "fitness_spt": fitness_func(cromosoma_spt, 0, instancia),
+        "inicial": trayectorias[False][0],
+        "inicial_spt": trayectorias[True][0],
+        "final": trayectorias[False][-1],
+        "final_spt": trayectorias[True][-1],
+        "gen_objetivo": generacion_objetivo(trayectorias[False], objetivo),
+        "gen_objetivo_spt": generacion_objetivo(trayectorias[True], objetivo),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_ot", type=int, nargs="+", default=[4, 8, 12, 20])
+    parser.add_argument("--generaciones", type=int, default=60)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'OT':>4} {'fit. SPT':>9} {'mejor inicial':>21} {'mejor final':>21} {'gen. objetivo':>15}"
+    )
+    for num_ot in args.num_ot:
+        fila = medir(num_ot, args.generaciones, args.seed)
+        gen_spt = fila["gen_objetivo_spt"]
+        print(
+            f"{fila['num_ot']:>4} {fila['fitness_spt']:>9.1f}"
+            f" {fila['inicial']:>10.1f}/{fila['inicial_spt']:<10.1f}"
+            f" {fila['final']:>10.1f}/{fila['final_spt']:<10.1f}"
+            f" {fila['gen_objetivo']:>7}/{'-' if gen_spt is None else gen_spt:<7}"
+        )
+    print("Columnas: población aleatoria / sembrada con SPT.")
+
+
+if __name__ == "__main__":
+    main()
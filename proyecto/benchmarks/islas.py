@@ -0,0 +1,66 @@
+"""Calidad y tiempo del AG con modelo de islas frente a una sola población.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.islas --islas 1 2 4 --num_ot 20 --generaciones 60
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from ag.ag import run_generations
+from config.generador_instancias import generar_instancia
+
+
+def medir(
+    num_ot: int,
+    generaciones: int,
+    islas: List[int],
+    intervalo: int,
+    seed: int,
+) -> List[Dict[str, float]]:
+    random.seed(seed)
+    instancia = generar_instancia("bench_islas", num_ot)
+
+    filas: List[Dict[str, float]] = []
+    for num_islas in islas:
+        instancia["ga_config"] = {
+            "num_generations": generaciones,
+            "islas": num_islas,
+            "intervalo_migracion": intervalo,
+        }
+        inicio = time.perf_counter()
+        resultado = run_generations(instancia)
+        filas.append(
+            {
+                "islas": num_islas,
+                "fitness": resultado["fitness"],
+                "evaluaciones": resultado["parada"]["evaluaciones"],
+                "segundos": time.perf_counter() - inicio,
+            }
+        )
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--islas", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--num_ot", type=int, default=20)
+    parser.add_argument("--generaciones", type=int, default=60)
+    parser.add_argument("--intervalo", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    filas = medir(args.num_ot, args.generaciones, args.islas, args.intervalo, args.seed)
+    print(f"{'islas':>6} {'fitness':>10} {'evaluaciones':>13} {'segundos':>10}")
+    for fila in filas:
+        print(
+            f"{fila['islas']:>6} {fila['fitness']:>10.1f}"
+            f" {fila['evaluaciones']:>13} {fila['segundos']:>10.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
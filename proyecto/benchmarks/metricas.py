@@ -0,0 +1,122 @@
+"""Simulación completa vs. modo ``solo_metricas`` del fitness del AG.
+
+Para cada tamaño de instancia mide, por evaluación, el mejor tiempo de 5 repeticiones
+y la memoria pico (``tracemalloc``) de ``simular_individuo`` completo seguido de
+``calcular_fitness`` (lo que hacía ``fitness_func``), de ``fitness_func`` con
+``solo_metricas`` y de ``fitness_poblacion`` sobre toda la población. Falla si algún fitness difiere del
+de la simulación completa o si el desbalance no coincide con ``np.std``.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.metricas --num_ot 12 25 50 100 --individuos 200
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import numpy as np
+
+from ag.ag import calcular_fitness, fitness_func, fitness_poblacion, simular_individuo
+from ag.compilada import InstanciaCompilada, compilar_instancia
+from ag.motor import EstadoSimulacion, decodificar, ejecutar
+from benchmarks.comun import poblacion_aleatoria
+from config.generador_instancias import generar_instancia
+
+
+def _completo(individuo: np.ndarray, compilada: InstanciaCompilada) -> float:
+    simulacion = simular_individuo(individuo, compilada)
+    return calcular_fitness(
+        simulacion["tareas_ejecutadas"],
+        simulacion["penalizaciones"],
+        simulacion["desbalance"],
+        simulacion["makespan"],
+    )
+
+
+def _medir(
+    evaluar: Callable[[np.ndarray], Any], poblacion: np.ndarray, repeticiones: int = 5
+) -> Dict[str, float]:
+    segundos = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for individuo in poblacion:
+            evaluar(individuo)
+        segundos = min(segundos, time.perf_counter() - inicio)
+
+    tracemalloc.start()
+    pico = 0
+    for individuo in poblacion:
+        tracemalloc.reset_peak()
+        antes = tracemalloc.get_traced_memory()[0]
+        evaluar(individuo)
+        pico += tracemalloc.get_traced_memory()[1] - antes
+    tracemalloc.stop()
+    return {"us": segundos / len(poblacion) * 1e6, "kb": pico / len(poblacion) / 1024}
+
+
+def _verificar(poblacion: np.ndarray, compilada: InstanciaCompilada, num_ot: int) -> None:
+    estado_sim = EstadoSimulacion(compilada)
+    lote = fitness_poblacion(poblacion, compilada)
+    for posicion, individuo in enumerate(poblacion):
+        esperado = _completo(individuo, compilada)
+        if fitness_func(individuo, posicion, compilada) != esperado or lote[posicion] != esperado:
+            raise AssertionError(f"El fitness difiere en el individuo {posicion} con {num_ot} OT.")
+        ejecutar(estado_sim, *decodificar(individuo, compilada), detalle=False)
+        cargas = estado_sim.cargas()
+        if cargas and estado_sim.desbalance() != float(np.std(cargas)):
+            raise AssertionError(f"El desbalance difiere de np.std con {num_ot} OT.")
+
+
+def medir(num_ots: List[int], individuos: int, seed: int) -> List[Dict[str, float]]:
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    filas = []
+    for num_ot in num_ots:
+        instancia = generar_instancia(f"bench_metricas_{num_ot}", num_ot)
+        compilada = compilar_instancia(instancia)
+        poblacion = poblacion_aleatoria(instancia, individuos, rng)
+        _verificar(poblacion, compilada, num_ot)
+
+        completo = _medir(lambda individuo: _completo(individuo, compilada), poblacion)
+        metricas = _medir(lambda individuo: fitness_func(individuo, 0, compilada), poblacion)
+        lote = _medir(lambda _: fitness_poblacion(poblacion, compilada), poblacion[:1])
+        filas.append(
+            {
+                "num_ot": num_ot,
+                "num_tareas": compilada.n_tareas,
+                "completo_us": completo["us"],
+                "completo_kb": completo["kb"],
+                "metricas_us": metricas["us"],
+                "metricas_kb": metricas["kb"],
+                "lote_us": lote["us"] / individuos,
+            }
+        )
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_ot", type=int, nargs="+", default=[12, 25, 50, 100])
+    parser.add_argument("--individuos", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    filas = medir(args.num_ot, args.individuos, args.seed)
+    print(
+        f"{'num_ot':>6} {'tareas':>6} {'completo us':>12} {'completo KB':>12} "
+        f"{'metricas us':>12} {'metricas KB':>12} {'lote us':>8}"
+    )
+    for fila in filas:
+        print(
+            f"{fila['num_ot']:>6} {fila['num_tareas']:>6} {fila['completo_us']:>12.1f} "
+            f"{fila['completo_kb']:>12.1f} {fila['metricas_us']:>12.1f} "
+            f"{fila['metricas_kb']:>12.1f} {fila['lote_us']:>8.1f}"
+        )
+    print("El fitness de solo_metricas coincide con el de la simulación completa.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Motor de eventos vs. barrido completo de referencia sobre instancias grandes.
+
+Además de medir evaluaciones por segundo, compara ambos motores individuo a
+individuo (cronograma, rechazos, tiempos por operario y penalizaciones) y falla si
+difieren en algo.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.motor --num_ot 25 50 100 150 --individuos 100
+"""
+
+import argparse
+import random
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+import numpy as np
+
+from ag.compilada import InstanciaCompilada, compilar_instancia
+from ag.motor import EstadoSimulacion, decodificar, ejecutar, ejecutar_barrido
+from benchmarks.comun import poblacion_aleatoria, resumen_simulacion
+from config.generador_instancias import generar_instancia
+
+
+def _correr(
+    motor: Callable[..., EstadoSimulacion],
+    compilada: InstanciaCompilada,
+    poblacion: np.ndarray,
+) -> Tuple[float, List[Tuple[Any, ...]]]:
+    decodificados = [decodificar(individuo, compilada) for individuo in poblacion]
+    estado_sim = EstadoSimulacion(compilada)
+    resumenes = []
+    inicio = time.perf_counter()
+    for operarios_asignados, tareas_por_operario in decodificados:
+        motor(estado_sim, operarios_asignados, tareas_por_operario)
+        resumenes.append(resumen_simulacion(estado_sim))
+    return time.perf_counter() - inicio, resumenes
+
+
+def medir(num_ots: List[int], individuos: int, seed: int) -> List[Dict[str, float]]:
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+    filas = []
+    for num_ot in num_ots:
+        instancia = generar_instancia(f"bench_motor_{num_ot}", num_ot)
+        compilada = compilar_instancia(instancia)
+        poblacion = poblacion_aleatoria(instancia, individuos, rng)
+
+        t_barrido, esperados = _correr(ejecutar_barrido, compilada, poblacion)
+        t_eventos, obtenidos = _correr(ejecutar, compilada, poblacion)
+        for posicion, (esperado, obtenido) in enumerate(zip(esperados, obtenidos)):
+            if esperado != obtenido:
+                raise AssertionError(
+                    f"Los motores difieren en el individuo {posicion} con {num_ot} OT."
+                )
+
+        filas.append(
+            {
+                "num_ot": num_ot,
+                "num_tareas": compilada.n_tareas,
+                "barrido_eval_s": individuos / t_barrido,
+                "eventos_eval_s": individuos / t_eventos,
+                "speedup": t_barrido / t_eventos,
+            }
+        )
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_ot", type=int, nargs="+", default=[25, 50, 100, 150])
+    parser.add_argument("--individuos", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    filas = medir(args.num_ot, args.individuos, args.seed)
+    print(f"{'num_ot':>6} {'tareas':>6} {'barrido/s':>10} {'eventos/s':>10} {'speedup':>8}")
+    for fila in filas:
+        print(
+            f"{fila['num_ot']:>6} {fila['num_tareas']:>6} {fila['barrido_eval_s']:>10.1f} "
+            f"{fila['eventos_eval_s']:>10.1f} {fila['speedup']:>8.2f}"
+        )
+    print("Ambos motores produjeron resultados idénticos.")
+
+
+if __name__ == "__main__":
+    main()
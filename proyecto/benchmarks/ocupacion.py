@@ -0,0 +1,102 @@
+"""Micro-benchmark de IndiceOcupacion frente a las búsquedas lineales sobre listas.
+
+Compara ``IndiceOcupacion.primer_hueco`` con ``spt.find_earliest_slot`` (que ordena
+la lista en cada llamada) y ``IndiceOcupacion.disponible`` con el recorrido lineal de
+solapamientos que usaba el AG. Verifica además que ambas versiones respondan igual.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.ocupacion --intervalos 8 64 512 --consultas 20000
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Sequence, Tuple
+
+from comun.ocupacion import IndiceOcupacion
+from spt.spt import find_earliest_slot
+
+
+def _solapamiento_lineal(occ_list: Sequence[Tuple[int, int]], inicio: int, fin: int) -> bool:
+    for inicio_ocupado, fin_ocupado in occ_list:
+        if inicio < fin_ocupado and fin > inicio_ocupado:
+            return False
+    return True
+
+
+def _ocupacion(cantidad: int, rng: random.Random) -> List[Tuple[int, int]]:
+    """Intervalos sin solape con huecos aleatorios, insertados en orden mezclado."""
+    intervalos = []
+    t = 0
+    for _ in range(cantidad):
+        t += rng.randint(0, 20)
+        duracion = rng.randint(5, 40)
+        intervalos.append((t, t + duracion))
+        t += duracion
+    rng.shuffle(intervalos)
+    return intervalos
+
+
+def medir(tamanos: List[int], consultas: int, seed: int) -> List[Dict[str, float]]:
+    rng = random.Random(seed)
+    filas = []
+    for cantidad in tamanos:
+        occ_list = _ocupacion(cantidad, rng)
+        indice = IndiceOcupacion(occ_list)
+        horizonte = max((fin for _, fin in occ_list), default=0) + 100
+        pedidos = [
+            (rng.randint(0, horizonte), rng.randint(1, 30)) for _ in range(consultas)
+        ]
+
+        inicio = time.perf_counter()
+        esperados_hueco = [find_earliest_slot(occ_list, e, d, horizonte) for e, d in pedidos]
+        t_lineal_hueco = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        obtenidos_hueco = [indice.primer_hueco(e, d, horizonte) for e, d in pedidos]
+        t_indice_hueco = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        esperados_libre = [_solapamiento_lineal(occ_list, e, e + d) for e, d in pedidos]
+        t_lineal_libre = time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        obtenidos_libre = [indice.disponible(e, e + d) for e, d in pedidos]
+        t_indice_libre = time.perf_counter() - inicio
+
+        if esperados_hueco != obtenidos_hueco or esperados_libre != obtenidos_libre:
+            raise AssertionError(f"IndiceOcupacion difiere de la versión lineal con {cantidad} intervalos.")
+
+        filas.append(
+            {
+                "intervalos": cantidad,
+                "hueco_lineal_us": 1e6 * t_lineal_hueco / consultas,
+                "hueco_indice_us": 1e6 * t_indice_hueco / consultas,
+                "libre_lineal_us": 1e6 * t_lineal_libre / consultas,
+                "libre_indice_us": 1e6 * t_indice_libre / consultas,
+            }
+        )
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--intervalos", type=int, nargs="+", default=[8, 64, 512])
+    parser.add_argument("--consultas", type=int, default=20000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    filas = medir(args.intervalos, args.consultas, args.seed)
+    print(
+        f"{'intervalos':>10} {'hueco lineal':>13} {'hueco índice':>13} "
+        f"{'libre lineal':>13} {'libre índice':>13}   (µs por consulta)"
+    )
+    for fila in filas:
+        print(
+            f"{fila['intervalos']:>10} {fila['hueco_lineal_us']:>13.2f} {fila['hueco_indice_us']:>13.2f} "
+            f"{fila['libre_lineal_us']:>13.2f} {fila['libre_indice_us']:>13.2f}"
+        )
+    print("Ambas versiones respondieron igual a todas las consultas.")
+
+
+if __name__ == "__main__":
+    main()
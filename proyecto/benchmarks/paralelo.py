@@ -0,0 +1,173 @@
+"""Speedup del fitness paralelo del AG según el número de procesos.
+
+Mide dos cosas:
+
+- Por llamada: el tiempo de ``EvaluadorParalelo`` forzado a usar el pool (sin el
+  mínimo de filas por proceso) frente a ``evaluar_poblacion`` en el proceso actual,
+  para lotes de distinto tamaño; el speedup por tamaño de lote muestra desde dónde
+  conviene repartir. El costo fijo de cada llamada al pool se estima con una fila por
+  worker: el tiempo de esa llamada menos el de simular una fila en el proceso actual.
+- Corrida completa: ``run_generations`` con ``perfilar`` para cada número de
+  procesos, con el tiempo total, el tiempo dentro del fitness, su speedup frente al
+  primer número de procesos y cuántas llamadas fueron al pool o se evaluaron en el
+  proceso actual (la cache de fitness deja muchos lotes chicos). Falla si la
+  solución cambia con el número de procesos.
+
+El speedup está acotado por los núcleos disponibles (``os.cpu_count()``, que se
+informa): con menos núcleos que procesos no hay ganancia posible.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.paralelo --procesos 1 2 4 8 --num_ot 12 --generaciones 20
+"""
+
+import argparse
+import os
+import random
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from ag.ag import run_generations
+from ag.compilada import compilar_instancia
+from ag.motor import evaluar_poblacion
+from ag.paralelo import EvaluadorParalelo
+from benchmarks.comun import poblacion_aleatoria
+from config.generador_instancias import generar_instancia
+
+
+def _mejor_tiempo(funcion, repeticiones: int) -> float:
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def medir_llamadas(
+    instancia: Dict[str, Any],
+    procesos: List[int],
+    lotes: List[int],
+    repeticiones: int,
+    seed: int,
+) -> List[Dict[str, float]]:
+    compilada = compilar_instancia(instancia)
+    poblacion = poblacion_aleatoria(instancia, max(lotes), np.random.default_rng(seed))
+    filas = []
+    for num_procesos in procesos:
+        if num_procesos < 2:
+            continue
+        with EvaluadorParalelo(compilada, num_procesos, min_filas_por_proceso=1) as evaluador:
+            una_por_worker = poblacion[:num_procesos]
+            evaluador(una_por_worker)  # arranca los workers
+            costo_fijo_s = _mejor_tiempo(lambda: evaluador(una_por_worker), repeticiones) - (
+                _mejor_tiempo(lambda: evaluar_poblacion(poblacion[:1], compilada), repeticiones)
+            )
+            for lote in lotes:
+                if lote < 2:
+                    continue
+                soluciones = poblacion[:lote]
+                if not np.array_equal(evaluador(soluciones), evaluar_poblacion(soluciones, compilada)):
+                    raise AssertionError(f"El fitness con {num_procesos} procesos difiere.")
+                local_s = _mejor_tiempo(
+                    lambda: evaluar_poblacion(soluciones, compilada), repeticiones
+                )
+                pool_s = _mejor_tiempo(lambda: evaluador(soluciones), repeticiones)
+                filas.append(
+                    {
+                        "procesos": num_procesos,
+                        "lote": lote,
+                        "local_ms": local_s * 1e3,
+                        "pool_ms": pool_s * 1e3,
+                        "speedup": local_s / pool_s,
+                        "costo_fijo_ms": costo_fijo_s * 1e3,
+                    }
+                )
+    return filas
+
+
+def medir_corridas(
+    instancia: Dict[str, Any], generaciones: int, procesos: List[int]
+) -> List[Dict[str, float]]:
+    filas: List[Dict[str, float]] = []
+    referencia = None
+    base = None
+    for num_procesos in procesos:
+        instancia["ga_config"] = {
+            "num_generations": generaciones,
+            "num_procesos": num_procesos,
+            "perfilar": True,
+        }
+        inicio = time.perf_counter()
+        resultado = run_generations(instancia)
+        duracion = time.perf_counter() - inicio
+        fitness_s = resultado["perfil"]["fases"]["fitness_s"]
+
+        solucion = resultado["solution"].tolist()
+        if referencia is None:
+            referencia = (resultado["fitness"], solucion)
+            base = (duracion, fitness_s)
+        elif (resultado["fitness"], solucion) != referencia:
+            raise AssertionError(
+                f"El resultado con {num_procesos} procesos difiere del de {procesos[0]}."
+            )
+
+        llamadas = resultado.get("paralelo") or {"llamadas_pool": 0, "llamadas_locales": 0}
+        filas.append(
+            {
+                "procesos": num_procesos,
+                "segundos": duracion,
+                "speedup": base[0] / duracion,
+                "fitness_s": fitness_s,
+                "speedup_fitness": base[1] / fitness_s,
+                "llamadas_pool": llamadas["llamadas_pool"],
+                "llamadas_locales": llamadas["llamadas_locales"],
+            }
+        )
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--procesos", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--num_ot", type=int, default=12)
+    parser.add_argument("--generaciones", type=int, default=20)
+    parser.add_argument("--lotes", type=int, nargs="+", default=[4, 16, 64, 100])
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    random.seed(args.seed)
+    instancia = generar_instancia("bench_paralelo", args.num_ot)
+    print(f"Núcleos disponibles: {os.cpu_count()}")
+
+    llamadas = medir_llamadas(instancia, args.procesos, args.lotes, args.repeticiones, args.seed)
+    if llamadas:
+        print(f"\n{'procesos':>8} {'lote':>6} {'local ms':>9} {'pool ms':>9} {'speedup':>8}")
+        for fila in llamadas:
+            print(
+                f"{fila['procesos']:>8} {fila['lote']:>6} {fila['local_ms']:>9.2f} "
+                f"{fila['pool_ms']:>9.2f} {fila['speedup']:>8.2f}"
+            )
+        costos = {fila["procesos"]: fila["costo_fijo_ms"] for fila in llamadas}
+        for num_procesos, costo_ms in costos.items():
+            print(f"Costo fijo por llamada al pool con {num_procesos} procesos: {costo_ms:.2f} ms")
+
+    corridas = medir_corridas(instancia, args.generaciones, args.procesos)
+    print(
+        f"\n{'procesos':>8} {'segundos':>10} {'speedup':>8} {'fitness s':>10} "
+        f"{'speedup fit':>12} {'pool':>6} {'locales':>8}"
+    )
+    for fila in corridas:
+        print(
+            f"{fila['procesos']:>8} {fila['segundos']:>10.2f} {fila['speedup']:>8.2f} "
+            f"{fila['fitness_s']:>10.2f} {fila['speedup_fitness']:>12.2f} "
+            f"{fila['llamadas_pool']:>6} {fila['llamadas_locales']:>8}"
+        )
+    print("Resultados idénticos para todos los números de procesos.")
+
+
+if __name__ == "__main__":
+    main()
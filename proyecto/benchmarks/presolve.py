@@ -0,0 +1,103 @@
+"""Efecto del presolve del cromosoma sobre el tamaño de la búsqueda y la convergencia.
+
+Primero comprueba, sobre individuos aleatorios, que fijar los genes que quita el
+presolve no cambia el fitness. Luego corre el AG con y sin presolve y reporta los
+genes de cada variante, el mejor fitness final y la generación en que cada una
+alcanza el mejor fitness final de la corrida sin presolve.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.presolve --num_ot 4 12 30 --generaciones 100
+"""
+
+import argparse
+import random
+import time
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from ag.ag import construir_gene_space, fitness_poblacion, run_generations
+from ag.compilada import compilar_instancia
+from ag.presolve import presolver
+from config.generador_instancias import generar_instancia
+
+
+def verificar(instancia: Dict, individuos: int, rng: np.random.Generator) -> None:
+    gene_space = construir_gene_space(instancia)
+    compilada = compilar_instancia(instancia)
+    reduccion = presolver(gene_space, compilada)
+
+    n_tareas = compilada.n_tareas
+    soluciones = np.empty((individuos, 2 * n_tareas), dtype=float)
+    for idx in range(n_tareas):
+        soluciones[:, idx] = rng.choice(gene_space[idx], size=individuos)
+    soluciones[:, n_tareas:] = rng.random((individuos, n_tareas))
+
+    completas = fitness_poblacion(soluciones, compilada)
+    reducidas = fitness_poblacion(reduccion.expandir(reduccion.reducir(soluciones)), compilada)
+    if not np.array_equal(completas, reducidas):
+        raise AssertionError("Fijar los genes del presolve cambió el fitness.")
+
+
+def generacion_objetivo(trayectoria: List[float], objetivo: float) -> Optional[int]:
+    for generacion, valor in enumerate(trayectoria):
+        if valor >= objetivo:
+            return generacion
+    return None
+
+
+def medir(num_ot: int, generaciones: int, seed: int) -> Dict[str, object]:
+    random.seed(seed)
+    instancia = generar_instancia(f"bench_presolve_{num_ot}", num_ot)
+    verificar(instancia, 200, np.random.default_rng(seed))
+
+    corridas = {}
+    for presolve in (False, True):
+        instancia["ga_config"] = {"num_generations": generaciones, "presolve": presolve}
+        inicio = time.perf_counter()
+        resultado = run_generations(instancia)
+        corridas[presolve] = (resultado, time.perf_counter() - inicio)
+
+    sin, seg_sin = corridas[False]
+    con, seg_con = corridas[True]
+    objetivo = sin["fitness"]
+    return {
+        "num_ot": num_ot,
+        "genes": len(sin["solution"]),
+        "genes_presolve": con["presolve"]["genes_libres"],
+        "fitness": sin["fitness"],
+        "fitness_presolve": con["fitness"],
+        "gen_objetivo": generacion_objetivo(sin["simulacion"]["best_solutions_fitness"], objetivo),
+        "gen_objetivo_presolve": generacion_objetivo(
+            con["simulacion"]["best_solutions_fitness"], objetivo
+        ),
+        "segundos": seg_sin,
+        "segundos_presolve": seg_con,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_ot", type=int, nargs="+", default=[4, 12, 30])
+    parser.add_argument("--generaciones", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    print(
+        f"{'OT':>4} {'genes':>11} {'fitness':>21} {'gen. objetivo':>15} {'segundos':>13}"
+    )
+    for num_ot in args.num_ot:
+        fila = medir(num_ot, args.generaciones, args.seed)
+        gen_con = fila["gen_objetivo_presolve"]
+        print(
+            f"{fila['num_ot']:>4} {fila['genes']:>5}/{fila['genes_presolve']:<5}"
+            f" {fila['fitness']:>10.1f}/{fila['fitness_presolve']:<10.1f}"
+            f" {fila['gen_objetivo']:>7}/{'-' if gen_con is None else gen_con:<7}"
+            f" {fila['segundos']:>6.2f}/{fila['segundos_presolve']:<6.2f}"
+        )
+    print("Columnas: sin presolve / con presolve. Fitness idéntico al fijar los genes quitados.")
+
+
+if __name__ == "__main__":
+    main()
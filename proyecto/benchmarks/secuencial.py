@@ -0,0 +1,57 @@
+"""Simulación de ``PruebaSecuencial`` con diferencias sintéticas.
+
+Repite ``--repeticiones`` experimentos con diferencias normales de media ``--efecto``
+y desviación ``--desviacion``, revisando la prueba cada ``--lote`` instancias hasta
+``--max_instancias``. Informa cuántas veces decidió cada cosa y el tamaño medio de
+muestra al detenerse. Con ``--efecto 0`` la fracción de decisiones ``AG_menor`` o
+``AG_mayor`` estima el error de la prueba, que debe quedar por debajo de ``--alfa``.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.secuencial --efecto 0 --repeticiones 2000
+    python -m benchmarks.secuencial --efecto -10 --desviacion 30
+"""
+
+import argparse
+import random
+from collections import Counter
+
+from comun.agregados import Welford
+from comun.secuencial import AG_MAYOR, AG_MENOR, PruebaSecuencial, SIN_DECISION
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--efecto", type=float, default=0.0)
+    parser.add_argument("--desviacion", type=float, default=30.0)
+    parser.add_argument("--efecto_minimo", type=float, default=0.0)
+    parser.add_argument("--alfa", type=float, default=0.05)
+    parser.add_argument("--lote", type=int, default=25)
+    parser.add_argument("--max_instancias", type=int, default=1000)
+    parser.add_argument("--repeticiones", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    decisiones: Counter = Counter()
+    tamanos = []
+    for _ in range(args.repeticiones):
+        prueba = PruebaSecuencial("makespan", args.alfa, args.efecto_minimo)
+        diferencias = Welford()
+        while diferencias.n < args.max_instancias and prueba.decision is None:
+            for _ in range(args.lote):
+                diferencias.agregar(rng.gauss(args.efecto, args.desviacion))
+            prueba.revisar(diferencias)
+        decisiones[prueba.decision or SIN_DECISION] += 1
+        tamanos.append(diferencias.n)
+
+    for decision, cantidad in decisiones.most_common():
+        print(f"{decision:<14} {cantidad / args.repeticiones:>7.1%}")
+    print(f"Instancias al detenerse: media {sum(tamanos) / len(tamanos):.0f}, máximo {max(tamanos)}")
+    if args.efecto == 0:
+        errores = (decisiones[AG_MENOR] + decisiones[AG_MAYOR]) / args.repeticiones
+        print(f"Error con efecto nulo: {errores:.1%} (alfa {args.alfa:.0%})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""Benchmark de ``SalidaSQLite`` con resultados sintéticos.
+
+Escribe ``--resultados`` resultados (AG y SPT alternados, con ``--asignaciones``
+asignaciones cada uno) y mide las filas por segundo de la inserción por lotes. Luego
+mide consultas típicas sobre la base: el resultado de una instancia, el cronograma de
+un resultado y el makespan medio por algoritmo.
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.sqlite --resultados 200000 --asignaciones 40
+"""
+
+import argparse
+import random
+import sqlite3
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+from ag.utils import CSV_COLUMNS
+from comun.salida import SalidaSQLite
+
+
+def _resultado(indice: int, asignaciones: int, rng: random.Random) -> Dict[str, Any]:
+    algoritmo = "AG" if indice % 2 == 0 else "SPT"
+    cronograma = []
+    for orden in range(asignaciones):
+        inicio = rng.randint(0, 400)
+        cronograma.append(
+            {
+                "ot": rng.randint(1, 12),
+                "t": rng.randint(1, 35),
+                "operario": rng.randint(1, 18),
+                "inicio": inicio,
+                "fin": inicio + rng.randint(15, 55),
+                "orden": orden + 1,
+            }
+        )
+    carga = {operario: rng.randint(0, 480) for operario in range(1, 19)}
+    return {
+        "instancia_id": f"inst_{indice // 2}",
+        "algoritmo": algoritmo,
+        "num_OT": rng.randint(4, 12),
+        "num_tareas": asignaciones + 5,
+        "tareas_ejecutadas": asignaciones,
+        "tareas_rechazadas": 5,
+        "makespan": rng.randint(150, 480),
+        "carga_total": sum(carga.values()),
+        "carga_std": rng.random() * 50,
+        "generaciones": 300 if algoritmo == "AG" else None,
+        "criterios_parada": "num_generations" if algoritmo == "AG" else None,
+        "asignaciones": cronograma,
+        "carga_por_operario": carga,
+    }
+
+
+def _medir(
+    conexion: sqlite3.Connection, consulta: str, parametros=(), repeticiones: int = 200
+) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticiones):
+        conexion.execute(consulta, parametros).fetchall()
+    return (time.perf_counter() - inicio) / repeticiones
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resultados", type=int, default=200000)
+    parser.add_argument("--asignaciones", type=int, default=40)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = Path(carpeta) / "resultados.db"
+        insertar_s = 0.0
+        salida = SalidaSQLite(ruta, CSV_COLUMNS, max_segundos=float("inf"))
+        for indice in range(args.resultados):
+            # Sólo se cronometra la escritura, no la construcción de los resultados.
+            resultado = _resultado(indice, args.asignaciones, rng)
+            inicio = time.perf_counter()
+            salida.escribir(resultado)
+            insertar_s += time.perf_counter() - inicio
+        inicio = time.perf_counter()
+        salida.cerrar()
+        insertar_s += time.perf_counter() - inicio
+
+        conexion = sqlite3.connect(ruta)
+        instancia = f"inst_{args.resultados // 4}"
+        por_instancia = _medir(
+            conexion,
+            "SELECT * FROM resultados WHERE instancia_id = ? AND algoritmo = ?",
+            (instancia, "AG"),
+        )
+        (resultado_id,) = conexion.execute(
+            "SELECT id FROM resultados WHERE instancia_id = ?", (instancia,)
+        ).fetchone()
+        cronograma = _medir(
+            conexion,
+            "SELECT * FROM asignaciones WHERE resultado_id = ? ORDER BY orden",
+            (resultado_id,),
+        )
+        agregado = _medir(
+            conexion,
+            "SELECT algoritmo, AVG(makespan) FROM resultados GROUP BY algoritmo",
+            repeticiones=5,
+        )
+
+        print(f"Resultados: {args.resultados} ({args.resultados * args.asignaciones} asignaciones)")
+        print(f"Base: {ruta.stat().st_size / 1e6:.1f} MB")
+        print(f"Inserción: {args.resultados / insertar_s:,.0f} resultados/s")
+        print(f"Resultado de una instancia: {por_instancia * 1e6:.1f} us")
+        print(f"Cronograma de un resultado: {cronograma * 1e6:.1f} us")
+        print(f"Makespan medio por algoritmo: {agregado * 1e3:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,233 @@
+"""Suite de rendimiento de los caminos críticos con comparación contra una línea base.
+
+Mide, con semillas fijas y para varios tamaños de instancia de ``generar_instancia``:
+
+- ``simular_individuo``: evaluaciones por segundo sobre individuos aleatorios.
+- ``run_ag``: latencia de una corrida corta del AG.
+- ``simular_spt``: latencia de una simulación SPT.
+- ``find_earliest_slot`` e ``IndiceOcupacion.primer_hueco``: microsegundos por
+  consulta sobre OT con distinta cantidad de intervalos ocupados.
+
+Cada métrica toma el mejor de ``--repeticiones`` intentos. Con ``--guardar`` los
+resultados se escriben como línea base en JSON; sin él se comparan con la línea base
+guardada y el proceso termina con código 1 si alguna métrica empeora más que
+``--umbral`` (fracción relativa).
+
+Uso (desde ``proyecto/``)::
+
+    python -m benchmarks.suite --guardar
+    python -m benchmarks.suite --umbral 0.15
+"""
+
+import argparse
+import json
+import platform
+import random
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ag.ag import run_ag, simular_individuo
+from ag.compilada import compilar_instancia
+from benchmarks.comun import poblacion_aleatoria
+from comun.ocupacion import IndiceOcupacion
+from config.generador_instancias import generar_instancia
+from spt.spt import find_earliest_slot, simular_spt
+
+
+BASELINE_POR_DEFECTO = Path(__file__).with_name("baseline.json")
+
+# Métrica -> {"valor", "unidad", "mayor_es_mejor"}.
+Metricas = Dict[str, Dict[str, Any]]
+
+
+def _mejor_tiempo(funcion: Callable[[], Any], repeticiones: int) -> float:
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        funcion()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def _metrica(valor: float, unidad: str, mayor_es_mejor: bool) -> Dict[str, Any]:
+    return {"valor": valor, "unidad": unidad, "mayor_es_mejor": mayor_es_mejor}
+
+
+def _instancia(num_ot: int, seed: int) -> Dict[str, Any]:
+    # Cada tamaño tiene su propia semilla: agregar o quitar tamaños no cambia los demás.
+    random.seed(seed * 1000 + num_ot)
+    return generar_instancia(f"bench_suite_{num_ot}", num_ot)
+
+
+def medir_simulacion(
+    num_ots: Sequence[int], individuos: int, repeticiones: int, seed: int
+) -> Metricas:
+    metricas: Metricas = {}
+    for num_ot in num_ots:
+        instancia = _instancia(num_ot, seed)
+        compilada = compilar_instancia(instancia)
+        poblacion = poblacion_aleatoria(instancia, individuos, np.random.default_rng(seed))
+
+        def evaluar_todos() -> None:
+            for individuo in poblacion:
+                simular_individuo(individuo, compilada)
+
+        segundos = _mejor_tiempo(evaluar_todos, repeticiones)
+        metricas[f"simular_individuo/{num_ot}_ot"] = _metrica(individuos / segundos, "eval/s", True)
+    return metricas
+
+
+def medir_run_ag(
+    num_ots: Sequence[int], generaciones: int, repeticiones: int, seed: int
+) -> Metricas:
+    metricas: Metricas = {}
+    for num_ot in num_ots:
+        instancia = _instancia(num_ot, seed)
+        instancia["ga_config"] = {"num_generations": generaciones, "random_seed": seed}
+        segundos = _mejor_tiempo(lambda: run_ag(instancia, f"bench_{num_ot}"), repeticiones)
+        metricas[f"run_ag/{num_ot}_ot"] = _metrica(segundos, "s", False)
+    return metricas
+
+
+def medir_spt(num_ots: Sequence[int], repeticiones: int, seed: int) -> Metricas:
+    metricas: Metricas = {}
+    for num_ot in num_ots:
+        instancia = _instancia(num_ot, seed)
+        segundos = _mejor_tiempo(lambda: simular_spt(instancia), repeticiones)
+        metricas[f"simular_spt/{num_ot}_ot"] = _metrica(segundos, "s", False)
+    return metricas
+
+
+def medir_huecos(
+    tamanos: Sequence[int], consultas: int, repeticiones: int, seed: int
+) -> Metricas:
+    rng = np.random.default_rng(seed)
+    metricas: Metricas = {}
+    for tamano in tamanos:
+        intervalos = _intervalos_disjuntos(tamano, rng)
+        indice = IndiceOcupacion()
+        for inicio, fin in intervalos:
+            indice.agregar(inicio, fin)
+        horizonte = intervalos[-1][1] + 100
+        pedidos = list(
+            zip(
+                rng.integers(0, horizonte, size=consultas).tolist(),
+                rng.integers(1, 40, size=consultas).tolist(),
+            )
+        )
+
+        def lineal() -> None:
+            for earliest, duracion in pedidos:
+                find_earliest_slot(intervalos, earliest, duracion, horizonte)
+
+        def bisect() -> None:
+            for earliest, duracion in pedidos:
+                indice.primer_hueco(earliest, duracion, horizonte)
+
+        for nombre, funcion in (("find_earliest_slot", lineal), ("primer_hueco", bisect)):
+            segundos = _mejor_tiempo(funcion, repeticiones)
+            metricas[f"{nombre}/{tamano}_intervalos"] = _metrica(
+                segundos / consultas * 1e6, "us/consulta", False
+            )
+    return metricas
+
+
+def _intervalos_disjuntos(cantidad: int, rng: np.random.Generator) -> List[Tuple[int, int]]:
+    intervalos = []
+    tiempo = 0
+    for hueco, duracion in zip(
+        rng.integers(0, 30, size=cantidad).tolist(), rng.integers(5, 60, size=cantidad).tolist()
+    ):
+        tiempo += hueco
+        intervalos.append((tiempo, tiempo + duracion))
+        tiempo += duracion
+    return intervalos
+
+
+def comparar(
+    actuales: Metricas, base: Metricas, umbral: float
+) -> List[Tuple[str, float, float, float, bool]]:
+    """(métrica, base, actual, cambio relativo, es_regresion) para las métricas comunes.
+
+    El cambio relativo es positivo cuando la métrica mejora.
+    """
+    filas = []
+    for nombre, actual in actuales.items():
+        if nombre not in base:
+            continue
+        valor_base = base[nombre]["valor"]
+        valor = actual["valor"]
+        if actual["mayor_es_mejor"]:
+            cambio = valor / valor_base - 1.0
+        else:
+            cambio = valor_base / valor - 1.0
+        filas.append((nombre, valor_base, valor, cambio, cambio < -umbral))
+    return filas
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--num_ot", type=int, nargs="+", default=[4, 25, 50, 100, 200])
+    parser.add_argument("--individuos", type=int, default=50)
+    parser.add_argument("--generaciones_ag", type=int, default=5)
+    parser.add_argument("--intervalos", type=int, nargs="+", default=[10, 100, 1000])
+    parser.add_argument("--consultas", type=int, default=2000)
+    parser.add_argument("--repeticiones", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_POR_DEFECTO)
+    parser.add_argument("--guardar", action="store_true", help="Guarda la línea base.")
+    parser.add_argument(
+        "--umbral",
+        type=float,
+        default=0.15,
+        help="Empeoramiento relativo tolerado antes de fallar (default 0.15).",
+    )
+    args = parser.parse_args()
+
+    metricas: Metricas = {}
+    metricas.update(medir_simulacion(args.num_ot, args.individuos, args.repeticiones, args.seed))
+    metricas.update(medir_run_ag(args.num_ot, args.generaciones_ag, args.repeticiones, args.seed))
+    metricas.update(medir_spt(args.num_ot, args.repeticiones, args.seed))
+    metricas.update(medir_huecos(args.intervalos, args.consultas, args.repeticiones, args.seed))
+
+    parametros = {
+        clave: valor
+        for clave, valor in vars(args).items()
+        if clave not in ("baseline", "guardar", "umbral")
+    }
+    if args.guardar or not args.baseline.exists():
+        contenido = {
+            "parametros": parametros,
+            "entorno": {"python": platform.python_version(), "numpy": np.__version__},
+            "metricas": metricas,
+        }
+        args.baseline.write_text(json.dumps(contenido, indent=2, ensure_ascii=False) + "\n")
+        for nombre, metrica in metricas.items():
+            print(f"{nombre:<36} {metrica['valor']:>12.3f} {metrica['unidad']}")
+        print(f"Línea base guardada en {args.baseline}")
+        return
+
+    base = json.loads(args.baseline.read_text())
+    if base.get("parametros") != parametros:
+        print("Aviso: los parámetros difieren de los de la línea base.")
+
+    filas = comparar(metricas, base["metricas"], args.umbral)
+    print(f"{'métrica':<36} {'base':>12} {'actual':>12} {'cambio':>8}")
+    for nombre, valor_base, valor, cambio, regresion in filas:
+        marca = "  REGRESIÓN" if regresion else ""
+        print(f"{nombre:<36} {valor_base:>12.3f} {valor:>12.3f} {cambio:>+8.1%}{marca}")
+
+    regresiones = [fila[0] for fila in filas if fila[4]]
+    if regresiones:
+        raise SystemExit(
+            f"{len(regresiones)} métrica(s) empeoraron más de {args.umbral:.0%}: "
+            + ", ".join(regresiones)
+        )
+    print(f"Sin regresiones por encima de {args.umbral:.0%}.")
+
+
+if __name__ == "__main__":
+    main()
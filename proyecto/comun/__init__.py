@@ -0,0 +1,15 @@
+"""Estructuras compartidas por los planificadores AG y SPT."""
+
+from .agregados import ResumenComparativo, Welford
+from .cache_resultados import CacheResultados
+from .ocupacion import IndiceOcupacion
+from .salida import SalidaCSV, SalidaSQLite
+
+__all__ = [
+    "CacheResultados",
+    "IndiceOcupacion",
+    "ResumenComparativo",
+    "SalidaCSV",
+    "SalidaSQLite",
+    "Welford",
+]
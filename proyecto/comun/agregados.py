@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import math
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Métricas de cada resultado que se agregan en el resumen comparativo.
+METRICAS_RESUMEN = ("makespan", "carga_std", "tareas_ejecutadas", "tareas_rechazadas")
+
+# Grupo bajo el que se acumulan las diferencias pareadas por instancia.
+GRUPO_DIFERENCIA = "AG-SPT"
+
+
+class Welford:
+    """Media y varianza en línea (algoritmo de Welford), con memoria constante."""
+
+    __slots__ = ("n", "media", "_m2")
+
+    def __init__(self) -> None:
+        self.n = 0
+        self.media = 0.0
+        self._m2 = 0.0
+
+    def agregar(self, valor: float) -> None:
+        self.n += 1
+        delta = valor - self.media
+        self.media += delta / self.n
+        self._m2 += delta * (valor - self.media)
+
+    @property
+    def varianza(self) -> float:
+        """Varianza muestral; 0 con menos de dos valores."""
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    @property
+    def desviacion(self) -> float:
+        return math.sqrt(self.varianza)
+
+
+class ResumenComparativo:
+    """Agregados de AG y SPT que se actualizan a medida que llegan los resultados.
+
+    Acumula media y varianza de ``METRICAS_RESUMEN`` por algoritmo y por rango de
+    cantidad de OT (de ``ancho_rango`` en ``ancho_rango``), además de las diferencias
+    AG − SPT de cada instancia que trae ambos resultados. La memoria depende sólo de
+    la cantidad de rangos, no de la cantidad de instancias.
+    """
+
+    def __init__(self, ancho_rango: int = 4, metricas: Sequence[str] = METRICAS_RESUMEN) -> None:
+        if ancho_rango < 1:
+            raise ValueError("ancho_rango debe ser un entero positivo.")
+        self.ancho_rango = ancho_rango
+        self.metricas = tuple(metricas)
+        self.instancias = 0
+        # (grupo, rango) -> métrica -> acumulador; el rango None agrupa todas las OT.
+        self._acumuladores: Dict[Tuple[str, Optional[int]], Dict[str, Welford]] = {}
+
+    def registrar_instancia(self, resultados: Iterable[Dict[str, Any]]) -> None:
+        """Agrega los resultados (uno por algoritmo) de una misma instancia."""
+        por_algoritmo = {resultado["algoritmo"]: resultado for resultado in resultados}
+        if not por_algoritmo:
+            return
+        self.instancias += 1
+        for algoritmo, resultado in por_algoritmo.items():
+            self._agregar(algoritmo, resultado["num_OT"], resultado)
+
+        if "AG" in por_algoritmo and "SPT" in por_algoritmo:
+            ag, spt = por_algoritmo["AG"], por_algoritmo["SPT"]
+            diferencia = {metrica: ag[metrica] - spt[metrica] for metrica in self.metricas}
+            self._agregar(GRUPO_DIFERENCIA, ag["num_OT"], diferencia)
+
+    def acumulador(self, grupo: str, metrica: str, rango: Optional[int] = None) -> Welford:
+        """Acumulador de ``metrica`` para ``grupo`` (algoritmo o ``GRUPO_DIFERENCIA``).
+
+        ``rango`` es el inicio del rango de OT; ``None`` cubre todas las instancias.
+        """
+        return self._acumuladores.get((grupo, rango), {}).get(metrica, Welford())
+
+    def resumen(self) -> List[Dict[str, Any]]:
+        """Una fila por grupo y rango con n, media y desviación de cada métrica."""
+        filas = []
+        for (grupo, rango), acumuladores in sorted(
+            self._acumuladores.items(), key=lambda item: _orden_fila(*item[0])
+        ):
+            fila: Dict[str, Any] = {
+                "grupo": grupo,
+                "num_OT": self._etiqueta_rango(rango),
+                "n": next(iter(acumuladores.values())).n,
+            }
+            for metrica, acumulador in acumuladores.items():
+                fila[f"{metrica}_media"] = acumulador.media
+                fila[f"{metrica}_desv"] = acumulador.desviacion
+            filas.append(fila)
+        return filas
+
+    def tabla(self) -> str:
+        """Resumen en texto, con ``media ± desviación`` por métrica."""
+        encabezado = f"{'grupo':<8} {'num_OT':>7} {'n':>7}" + "".join(
+            f" {metrica:>20}" for metrica in self.metricas
+        )
+        lineas = [encabezado]
+        for fila in self.resumen():
+            celdas = "".join(
+                f" {fila[f'{metrica}_media']:>11.2f} ± {fila[f'{metrica}_desv']:<6.2f}"
+                for metrica in self.metricas
+            )
+            lineas.append(f"{fila['grupo']:<8} {fila['num_OT']:>7} {fila['n']:>7}{celdas}")
+        return "\n".join(lineas)
+
+    def _agregar(self, grupo: str, num_ot: int, valores: Dict[str, Any]) -> None:
+        rango = (int(num_ot) // self.ancho_rango) * self.ancho_rango
+        for clave in ((grupo, rango), (grupo, None)):
+            acumuladores = self._acumuladores.setdefault(
+                clave, {metrica: Welford() for metrica in self.metricas}
+            )
+            for metrica in self.metricas:
+                acumuladores[metrica].agregar(float(valores[metrica]))
+
+    def _etiqueta_rango(self, rango: Optional[int]) -> str:
+        if rango is None:
+            return "todas"
+        return f"{rango}-{rango + self.ancho_rango - 1}"
+
+
+def _orden_fila(grupo: str, rango: Optional[int]) -> Tuple[bool, str, float]:
+    # Primero AG y SPT, luego las diferencias; dentro de cada grupo, "todas" al final.
+    return (grupo == GRUPO_DIFERENCIA, grupo, math.inf if rango is None else rango)
@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import ast
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+# Forma parte de cada clave: cambiarlo invalida todos los resultados guardados.
+# La clave ya incluye el código de los módulos que corre cada algoritmo (ver
+# ``fuentes_algoritmo``), así que sólo hace falta incrementarlo cuando cambia algo que
+# influye en los resultados fuera de ``proyecto/`` (p. ej. la versión de PyGAD o de
+# NumPy) o un dato que no es código (un archivo que lean los algoritmos).
+VERSION_RESULTADOS = 1
+
+# Módulo de entrada de cada algoritmo. Su código y el de todos los módulos de
+# ``proyecto/`` que importa, directa o indirectamente, entran en la clave: editar
+# cualquiera invalida los resultados guardados de ese algoritmo.
+MODULOS_ALGORITMO = {"AG": "ag.ag", "SPT": "spt.spt"}
+
+# Claves de la instancia que no describen el problema y quedan fuera del hash.
+CLAVES_EXCLUIDAS = ("instancia_id", "ga_config")
+
+
+class CacheResultados:
+    """Cache en disco de resultados por contenido de ``(algoritmo, instancia, config)``.
+
+    La clave es el SHA-256 de una serialización JSON canónica (claves ordenadas, sin
+    ``instancia_id`` ni ``ga_config``) de la instancia, del algoritmo, de su
+    configuración efectiva y de ``huella_fuentes(algoritmo)``. Cada resultado se guarda con pickle en
+    ``directorio/<2 primeros hex>/<clave>.pickle``, escrito en un archivo temporal y
+    renombrado para que los procesos que comparten el directorio nunca lean uno a
+    medias. Un acierto actualiza la fecha de modificación del archivo, que ``podar``
+    usa para descartar primero lo más viejo (por edad y por tamaño total).
+
+    Al serializarse con pickle sólo viajan el directorio y los límites, así que se
+    puede pasar a los procesos del simulador.
+    """
+
+    def __init__(
+        self,
+        directorio: str | Path,
+        max_bytes: Optional[int] = None,
+        max_edad_s: Optional[float] = None,
+    ) -> None:
+        self.directorio = Path(directorio)
+        self.max_bytes = max_bytes
+        self.max_edad_s = max_edad_s
+        self.aciertos = 0
+        self.fallos = 0
+
+    def clave(self, algoritmo: str, instancia: Dict[str, Any], config: Dict[str, Any]) -> str:
+        contenido = {
+            "version": VERSION_RESULTADOS,
+            "fuentes": huella_fuentes(algoritmo),
+            "algoritmo": algoritmo,
+            "config": config,
+            "instancia": {
+                clave: valor
+                for clave, valor in instancia.items()
+                if clave not in CLAVES_EXCLUIDAS
+            },
+        }
+        texto = json.dumps(
+            contenido, sort_keys=True, separators=(",", ":"), default=_json_canonico
+        )
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    def obtener(self, clave: str) -> Optional[Dict[str, Any]]:
+        ruta = self._ruta(clave)
+        try:
+            with ruta.open("rb") as archivo:
+                resultado = pickle.load(archivo)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            self.fallos += 1
+            return None
+        try:
+            os.utime(ruta)
+        except FileNotFoundError:
+            pass
+        self.aciertos += 1
+        return resultado
+
+    def guardar(self, clave: str, resultado: Dict[str, Any]) -> None:
+        ruta = self._ruta(clave)
+        ruta.parent.mkdir(parents=True, exist_ok=True)
+        descriptor, temporal = tempfile.mkstemp(dir=ruta.parent, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as archivo:
+                pickle.dump(resultado, archivo, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, ruta)
+        except BaseException:
+            Path(temporal).unlink(missing_ok=True)
+            raise
+
+    def podar(self) -> Dict[str, int]:
+        """Aplica los límites de edad y tamaño; devuelve lo eliminado y lo que queda."""
+        entradas = []
+        for ruta in self._entradas():
+            try:
+                estado = ruta.stat()
+            except FileNotFoundError:
+                continue
+            entradas.append((estado.st_mtime, estado.st_size, ruta))
+        entradas.sort()
+
+        eliminadas = 0
+        limite_edad = time.time() - self.max_edad_s if self.max_edad_s is not None else None
+        total = sum(tamano for _, tamano, _ in entradas)
+        conservadas = []
+        for modificado, tamano, ruta in entradas:
+            # Las entradas están ordenadas de la más vieja a la más nueva.
+            vencida = limite_edad is not None and modificado < limite_edad
+            excedida = self.max_bytes is not None and total > self.max_bytes
+            if vencida or excedida:
+                ruta.unlink(missing_ok=True)
+                total -= tamano
+                eliminadas += 1
+            else:
+                conservadas.append(ruta)
+        return {"eliminadas": eliminadas, "entradas": len(conservadas), "bytes": total}
+
+    def _entradas(self) -> Iterable[Path]:
+        if not self.directorio.exists():
+            return []
+        return self.directorio.glob("*/*.pickle")
+
+    def _ruta(self, clave: str) -> Path:
+        return self.directorio / clave[:2] / f"{clave}.pickle"
+
+    def __reduce__(self):
+        return (CacheResultados, (str(self.directorio), self.max_bytes, self.max_edad_s))
+
+
+# Raíz de los módulos del proyecto (``proyecto/``).
+_RAIZ = Path(__file__).resolve().parent.parent
+
+
+@lru_cache(maxsize=None)
+def huella_fuentes(algoritmo: str) -> str:
+    """SHA-256 del código de ``fuentes_algoritmo(algoritmo)``."""
+    huella = hashlib.sha256()
+    for ruta in fuentes_algoritmo(algoritmo):
+        huella.update(ruta.encode("utf-8") + b"\0")
+        huella.update((_RAIZ / ruta).read_bytes())
+        huella.update(b"\0")
+    return huella.hexdigest()
+
+
+def fuentes_algoritmo(algoritmo: str) -> List[str]:
+    """Archivos (relativos a ``proyecto/``) del módulo de entrada y todo lo que importa.
+
+    Se recorren los ``import`` de cada archivo, también los que están dentro de
+    funciones, y se siguen los que resuelven a un módulo de ``proyecto/``. Los
+    ``__init__`` de los paquetes no se siguen: sólo reexportan. Para un algoritmo sin
+    módulo de entrada conocido se usan los de todos.
+    """
+    if algoritmo in MODULOS_ALGORITMO:
+        pendientes = [MODULOS_ALGORITMO[algoritmo]]
+    else:
+        pendientes = list(MODULOS_ALGORITMO.values())
+    vistos: Set[str] = set()
+    while pendientes:
+        modulo = pendientes.pop()
+        if modulo in vistos:
+            continue
+        vistos.add(modulo)
+        pendientes.extend(_importados(modulo) - vistos)
+    return sorted(_archivo_modulo(modulo) for modulo in vistos)
+
+
+def _importados(modulo: str) -> Set[str]:
+    """Módulos de ``proyecto/`` que importa ``modulo``."""
+    arbol = ast.parse((_RAIZ / _archivo_modulo(modulo)).read_text("utf-8"))
+    paquete = modulo.rpartition(".")[0]
+    candidatos: Set[str] = set()
+    for nodo in ast.walk(arbol):
+        if isinstance(nodo, ast.Import):
+            candidatos.update(alias.name for alias in nodo.names)
+        elif isinstance(nodo, ast.ImportFrom):
+            if nodo.level:
+                partes = paquete.split(".") if paquete else []
+                base = ".".join(partes[: len(partes) - (nodo.level - 1)])
+                origen = f"{base}.{nodo.module}" if nodo.module else base
+            else:
+                origen = nodo.module or ""
+            candidatos.add(origen)
+            # ``from paquete import modulo`` importa un módulo, no un nombre.
+            candidatos.update(f"{origen}.{alias.name}" for alias in nodo.names)
+    return {candidato for candidato in candidatos if _es_modulo_propio(candidato)}
+
+
+def _archivo_modulo(modulo: str) -> str:
+    return modulo.replace(".", "/") + ".py"
+
+
+def _es_modulo_propio(modulo: str) -> bool:
+    return bool(modulo) and (_RAIZ / _archivo_modulo(modulo)).is_file()
+
+
+def _json_canonico(valor: Any) -> Any:
+    # Escalares y arreglos de NumPy, conjuntos y otros valores que json no serializa.
+    if hasattr(valor, "tolist"):
+        return valor.tolist()
+    if isinstance(valor, (set, frozenset)):
+        return sorted(valor)
+    return repr(valor)
@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from bisect import bisect_right
+from typing import Iterable, Iterator, List, Tuple
+
+
+class IndiceOcupacion:
+    """Intervalos ``[inicio, fin)`` de una OT guardados como arreglos ordenados.
+
+    Los intervalos se mantienen ordenados por inicio (los de igual inicio en orden de
+    inserción) junto con el máximo acumulado de sus fines, que es no decreciente. Así
+    las consultas de solapamiento y de primer hueco arrancan con búsqueda binaria en
+    lugar de ordenar o recorrer toda la lista.
+    """
+
+    __slots__ = ("inicios", "fines", "fines_max")
+
+    def __init__(self, intervalos: Iterable[Tuple[int, int]] = ()) -> None:
+        self.inicios: List[int] = []
+        self.fines: List[int] = []
+        self.fines_max: List[int] = []
+        for inicio, fin in intervalos:
+            self.agregar(inicio, fin)
+
+    def agregar(self, inicio: int, fin: int) -> None:
+        inicios = self.inicios
+        fines_max = self.fines_max
+        if not inicios or inicio >= inicios[-1]:
+            # Caso habitual del AG: las asignaciones llegan en orden de tiempo.
+            inicios.append(inicio)
+            self.fines.append(fin)
+            fines_max.append(max(fin, fines_max[-1]) if fines_max else fin)
+            return
+
+        posicion = bisect_right(inicios, inicio)
+        inicios.insert(posicion, inicio)
+        self.fines.insert(posicion, fin)
+        previo = fines_max[posicion - 1] if posicion else fin
+        fines_max.insert(posicion, max(fin, previo))
+        for siguiente in range(posicion + 1, len(fines_max)):
+            if fines_max[siguiente] >= fin:
+                break
+            fines_max[siguiente] = fin
+
+    def disponible(self, inicio: int, fin: int) -> bool:
+        """``True`` si ``[inicio, fin)`` no se cruza con ningún intervalo ocupado."""
+        # Antes de ``posicion`` todos los intervalos terminan a más tardar en
+        # ``inicio``; desde ahí el de menor inicio es justamente el de ``posicion``.
+        posicion = bisect_right(self.fines_max, inicio)
+        return posicion == len(self.inicios) or self.inicios[posicion] >= fin
+
+    def primer_hueco(
+        self, earliest_start: int, duration: int, horizonte: int
+    ) -> Tuple[bool, int, int]:
+        """Mismo contrato que ``spt.find_earliest_slot`` sobre los intervalos del índice."""
+        s = max(0, earliest_start)
+        inicios = self.inicios
+        if not inicios:
+            f = s + duration
+            return (f <= horizonte, s, f)
+
+        fines_max = self.fines_max
+        # Los intervalos que terminan a más tardar en ``s`` no acotan el hueco: se
+        # saltan con búsqueda binaria y sólo se recorren los huecos desde ahí.
+        posicion = bisect_right(fines_max, s)
+        for siguiente in range(posicion, len(inicios)):
+            if siguiente:
+                s = max(s, fines_max[siguiente - 1])
+            f = s + duration
+            if f <= inicios[siguiente]:
+                return (True, s, f) if f <= horizonte else (False, -1, -1)
+
+        s = max(s, fines_max[-1])
+        f = s + duration
+        if f <= horizonte:
+            return True, s, f
+        return False, -1, -1
+
+    def intervalos(self) -> List[Tuple[int, int]]:
+        return list(zip(self.inicios, self.fines))
+
+    def __iter__(self) -> Iterator[Tuple[int, int]]:
+        return zip(self.inicios, self.fines)
+
+    def __len__(self) -> int:
+        return len(self.inicios)
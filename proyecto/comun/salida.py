@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import csv
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Set, TextIO, Tuple
+
+
+class SalidaCSV:
+    """Destino de resultados que mantiene un único archivo CSV abierto.
+
+    Las filas se acumulan en memoria y se escriben cuando el buffer llega a
+    ``max_filas``, cuando pasaron ``max_segundos`` desde la última escritura o al
+    cerrar. El archivo se abre en modo anexar con la primera escritura y lleva
+    encabezado sólo si no existía, así que el contenido es el mismo que producen
+    ``exportar_csv_ag`` y ``exportar_csv_spt`` fila a fila.
+    """
+
+    def __init__(
+        self,
+        ruta: str | Path,
+        columnas: Sequence[str],
+        max_filas: int = 200,
+        max_segundos: float = 5.0,
+    ) -> None:
+        if max_filas < 1:
+            raise ValueError("max_filas debe ser un entero positivo.")
+        self.ruta = Path(ruta)
+        self.columnas = list(columnas)
+        self.max_filas = max_filas
+        self.max_segundos = max_segundos
+        self.filas_escritas = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._archivo: Optional[TextIO] = None
+        self._writer: Optional[csv.DictWriter] = None
+        self._ultima_escritura = time.monotonic()
+
+    def escribir(self, resultado: Dict[str, Any]) -> None:
+        self._buffer.append({columna: resultado.get(columna) for columna in self.columnas})
+        if (
+            len(self._buffer) >= self.max_filas
+            or time.monotonic() - self._ultima_escritura >= self.max_segundos
+        ):
+            self.vaciar()
+
+    def vaciar(self) -> None:
+        """Escribe las filas pendientes y las entrega al sistema operativo."""
+        if self._buffer:
+            writer = self._abrir()
+            writer.writerows(self._buffer)
+            self.filas_escritas += len(self._buffer)
+            self._buffer.clear()
+            self._archivo.flush()
+        self._ultima_escritura = time.monotonic()
+
+    def cerrar(self) -> None:
+        self.vaciar()
+        if self._archivo is not None:
+            self._archivo.close()
+            self._archivo = None
+            self._writer = None
+
+    def _abrir(self) -> csv.DictWriter:
+        if self._writer is None:
+            self.ruta.parent.mkdir(parents=True, exist_ok=True)
+            escribir_encabezado = not self.ruta.exists() or self.ruta.stat().st_size == 0
+            self._archivo = self.ruta.open("a", newline="")
+            self._writer = csv.DictWriter(self._archivo, fieldnames=self.columnas)
+            if escribir_encabezado:
+                self._writer.writeheader()
+        return self._writer
+
+    def __enter__(self) -> "SalidaCSV":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cerrar()
+
+
+# Tipo SQL de las columnas de métricas conocidas; el resto queda sin tipo declarado.
+TIPOS_SQLITE: Dict[str, str] = {
+    "instancia_id": "TEXT NOT NULL",
+    "algoritmo": "TEXT NOT NULL",
+    "num_OT": "INTEGER",
+    "num_tareas": "INTEGER",
+    "tareas_ejecutadas": "INTEGER",
+    "tareas_rechazadas": "INTEGER",
+    "makespan": "INTEGER",
+    "carga_total": "INTEGER",
+    "carga_std": "REAL",
+    "generaciones": "INTEGER",
+    "criterios_parada": "TEXT",
+    "runtime_s": "REAL",
+    "evaluaciones": "INTEGER",
+}
+
+
+class SalidaSQLite:
+    """Destino de resultados en una base SQLite, con la misma interfaz que ``SalidaCSV``.
+
+    Además de una fila de métricas por ``(instancia_id, algoritmo)`` en la tabla
+    ``resultados``, guarda el cronograma completo en ``asignaciones`` y la carga de
+    cada operario en ``carga_operario``, ambas enlazadas por ``resultado_id``. Las
+    filas se acumulan como en ``SalidaCSV`` y cada vaciado es una sola transacción
+    con ``executemany``. Volver a escribir un par ``(instancia_id, algoritmo)``
+    reemplaza la fila anterior junto con su cronograma.
+    """
+
+    def __init__(
+        self,
+        ruta: str | Path,
+        columnas: Sequence[str],
+        max_filas: int = 200,
+        max_segundos: float = 5.0,
+    ) -> None:
+        if max_filas < 1:
+            raise ValueError("max_filas debe ser un entero positivo.")
+        self.ruta = Path(ruta)
+        self.columnas = list(columnas)
+        self.max_filas = max_filas
+        self.max_segundos = max_segundos
+        self.filas_escritas = 0
+        self._buffer: List[Dict[str, Any]] = []
+        self._conexion: Optional[sqlite3.Connection] = None
+        self._siguiente_id = 1
+        self._ultima_escritura = time.monotonic()
+
+    def escribir(self, resultado: Dict[str, Any]) -> None:
+        self._buffer.append(resultado)
+        if (
+            len(self._buffer) >= self.max_filas
+            or time.monotonic() - self._ultima_escritura >= self.max_segundos
+        ):
+            self.vaciar()
+
+    def vaciar(self) -> None:
+        """Inserta los resultados pendientes en una transacción."""
+        if self._buffer:
+            conexion = self._abrir()
+            filas: List[Tuple[Any, ...]] = []
+            asignaciones: List[Tuple[Any, ...]] = []
+            cargas: List[Tuple[Any, ...]] = []
+            for resultado in self._buffer:
+                resultado_id = self._siguiente_id
+                self._siguiente_id += 1
+                filas.append((resultado_id, *(resultado.get(columna) for columna in self.columnas)))
+                asignaciones.extend(
+                    (
+                        resultado_id,
+                        asignacion["ot"],
+                        asignacion["t"],
+                        asignacion["operario"],
+                        asignacion["inicio"],
+                        asignacion["fin"],
+                        asignacion["orden"],
+                    )
+                    for asignacion in resultado.get("asignaciones", [])
+                )
+                cargas.extend(
+                    (resultado_id, operario, carga)
+                    for operario, carga in resultado.get("carga_por_operario", {}).items()
+                )
+
+            marcadores = ", ".join("?" * (len(self.columnas) + 1))
+            nombres = ", ".join(f'"{columna}"' for columna in self.columnas)
+            with conexion:
+                conexion.executemany(
+                    f"INSERT OR REPLACE INTO resultados (id, {nombres}) VALUES ({marcadores})",
+                    filas,
+                )
+                conexion.executemany(
+                    "INSERT INTO asignaciones VALUES (?, ?, ?, ?, ?, ?, ?)", asignaciones
+                )
+                conexion.executemany("INSERT INTO carga_operario VALUES (?, ?, ?)", cargas)
+            self.filas_escritas += len(self._buffer)
+            self._buffer.clear()
+        self._ultima_escritura = time.monotonic()
+
+    def cerrar(self) -> None:
+        self.vaciar()
+        if self._conexion is not None:
+            self._conexion.close()
+            self._conexion = None
+
+    def completados(self) -> Dict[str, Set[str]]:
+        """Algoritmos con resultado guardado, por ``instancia_id``."""
+        if not self.ruta.exists():
+            return {}
+        completados: Dict[str, Set[str]] = {}
+        for instancia_id, algoritmo in self._abrir().execute(
+            "SELECT instancia_id, algoritmo FROM resultados"
+        ):
+            completados.setdefault(instancia_id, set()).add(algoritmo)
+        return completados
+
+    def _abrir(self) -> sqlite3.Connection:
+        if self._conexion is None:
+            self.ruta.parent.mkdir(parents=True, exist_ok=True)
+            conexion = sqlite3.connect(self.ruta)
+            conexion.execute("PRAGMA journal_mode = WAL")
+            conexion.execute("PRAGMA synchronous = NORMAL")
+            conexion.execute("PRAGMA foreign_keys = ON")
+            with conexion:
+                self._crear_esquema(conexion)
+            (ultimo,) = conexion.execute("SELECT COALESCE(MAX(id), 0) FROM resultados").fetchone()
+            self._siguiente_id = ultimo + 1
+            self._conexion = conexion
+        return self._conexion
+
+    def _crear_esquema(self, conexion: sqlite3.Connection) -> None:
+        definiciones = ", ".join(
+            f'"{columna}" {TIPOS_SQLITE.get(columna, "")}'.rstrip() for columna in self.columnas
+        )
+        conexion.execute(
+            f"CREATE TABLE IF NOT EXISTS resultados (id INTEGER PRIMARY KEY, {definiciones})"
+        )
+        # Una base creada con otras columnas (p. ej. sin --perfil) se completa.
+        existentes = {fila[1] for fila in conexion.execute("PRAGMA table_info(resultados)")}
+        for columna in self.columnas:
+            if columna not in existentes:
+                tipo = TIPOS_SQLITE.get(columna, "").replace(" NOT NULL", "")
+                conexion.execute(f'ALTER TABLE resultados ADD COLUMN "{columna}" {tipo}')
+        conexion.execute(
+            "CREATE UNIQUE INDEX IF NOT EXISTS resultados_instancia_algoritmo "
+            "ON resultados (instancia_id, algoritmo)"
+        )
+        conexion.execute(
+            "CREATE INDEX IF NOT EXISTS resultados_algoritmo ON resultados (algoritmo)"
+        )
+        conexion.execute(
+            "CREATE TABLE IF NOT EXISTS asignaciones ("
+            "resultado_id INTEGER NOT NULL REFERENCES resultados (id) ON DELETE CASCADE, "
+            "ot INTEGER, tarea INTEGER, operario INTEGER, inicio INTEGER, fin INTEGER, "
+            "orden INTEGER)"
+        )
+        conexion.execute(
+            "CREATE INDEX IF NOT EXISTS asignaciones_resultado ON asignaciones (resultado_id)"
+        )
+        conexion.execute(
+            "CREATE TABLE IF NOT EXISTS carga_operario ("
+            "resultado_id INTEGER NOT NULL REFERENCES resultados (id) ON DELETE CASCADE, "
+            "operario INTEGER, carga INTEGER)"
+        )
+        conexion.execute(
+            "CREATE INDEX IF NOT EXISTS carga_operario_resultado ON carga_operario (resultado_id)"
+        )
+
+    def __enter__(self) -> "SalidaSQLite":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.cerrar()
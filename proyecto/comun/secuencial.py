@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import math
+from statistics import NormalDist
+from typing import Any, Dict, List, Optional
+
+from .agregados import Welford
+
+
+# Decisiones posibles de la prueba secuencial.
+AG_MENOR = "AG_menor"
+AG_MAYOR = "AG_mayor"
+EQUIVALENTES = "equivalentes"
+SIN_DECISION = "sin_decision"
+
+
+class PruebaSecuencial:
+    """Prueba pareada y secuencial sobre las diferencias AG − SPT de una métrica.
+
+    Se revisa después de cada lote de instancias con un intervalo de confianza t de
+    Student para la media de las diferencias. Para que mirar varias veces no infle el
+    error, la revisión ``k`` usa ``alfa_k = alfa * 6 / (pi^2 k^2)`` (la suma de todos
+    los ``alfa_k`` es ``alfa``), así que la probabilidad de que algún intervalo no
+    cubra la diferencia real es a lo sumo ``alfa``. Decide:
+
+    - ``AG_menor`` / ``AG_mayor`` cuando el intervalo no incluye el 0;
+    - ``equivalentes`` cuando el intervalo queda dentro de ``(-efecto_minimo,
+      efecto_minimo)`` (sólo con ``efecto_minimo > 0``).
+    """
+
+    def __init__(
+        self,
+        metrica: str,
+        alfa: float = 0.05,
+        efecto_minimo: float = 0.0,
+        min_instancias: int = 10,
+    ) -> None:
+        if not 0 < alfa < 1:
+            raise ValueError("alfa debe estar entre 0 y 1.")
+        if efecto_minimo < 0:
+            raise ValueError("efecto_minimo no puede ser negativo.")
+        self.metrica = metrica
+        self.alfa = alfa
+        self.efecto_minimo = efecto_minimo
+        self.min_instancias = max(2, min_instancias)
+        self.decision: Optional[str] = None
+        self.revisiones: List[Dict[str, Any]] = []
+
+    def revisar(self, diferencias: Welford) -> Optional[str]:
+        """Actualiza la prueba con las diferencias acumuladas y devuelve la decisión.
+
+        Devuelve ``None`` mientras no haya decisión o no se alcance ``min_instancias``.
+        """
+        if diferencias.n < self.min_instancias:
+            return None
+        revision = len(self.revisiones) + 1
+        alfa_revision = self.alfa * 6 / (math.pi**2 * revision**2)
+        critico = _cuantil_t(1 - alfa_revision / 2, diferencias.n - 1)
+        error = diferencias.desviacion / math.sqrt(diferencias.n)
+        inferior = diferencias.media - critico * error
+        superior = diferencias.media + critico * error
+
+        decision = None
+        if superior < 0:
+            decision = AG_MENOR
+        elif inferior > 0:
+            decision = AG_MAYOR
+        elif -self.efecto_minimo < inferior and superior < self.efecto_minimo:
+            decision = EQUIVALENTES
+        self.revisiones.append(
+            {
+                "revision": revision,
+                "n": diferencias.n,
+                "media": diferencias.media,
+                "desviacion": diferencias.desviacion,
+                "alfa_revision": alfa_revision,
+                "intervalo": [inferior, superior],
+                "decision": decision,
+            }
+        )
+        self.decision = decision
+        return decision
+
+    def resumen(self) -> Dict[str, Any]:
+        """Decisión final (``sin_decision`` si no se alcanzó) con la última revisión."""
+        ultima = self.revisiones[-1] if self.revisiones else {}
+        return {
+            "metrica": self.metrica,
+            "diferencia": "AG - SPT",
+            "alfa": self.alfa,
+            "efecto_minimo": self.efecto_minimo,
+            "decision": self.decision or SIN_DECISION,
+            "n": ultima.get("n", 0),
+            "media": ultima.get("media"),
+            "intervalo": ultima.get("intervalo"),
+            "revisiones": self.revisiones,
+        }
+
+
+def _cuantil_t(probabilidad: float, grados: int) -> float:
+    """Cuantil de la t de Student por la expansión de Cornish-Fisher desde la normal.
+
+    Con 9 o más grados de libertad el error relativo es menor al 0.1 % para los
+    niveles que usa la prueba.
+    """
+    z = NormalDist().inv_cdf(probabilidad)
+    g = float(grados)
+    return (
+        z
+        + (z**3 + z) / (4 * g)
+        + (5 * z**5 + 16 * z**3 + 3 * z) / (96 * g**2)
+        + (3 * z**7 + 19 * z**5 + 17 * z**3 - 15 * z) / (384 * g**3)
+        + (79 * z**9 + 776 * z**7 + 1482 * z**5 - 1920 * z**3 - 945 * z) / (92160 * g**4)
+    )
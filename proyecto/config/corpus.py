@@ -0,0 +1,290 @@
+"""Corpus de instancias en un archivo binario columnar que se abre con ``mmap``.
+
+El archivo guarda un lote completo como arreglos planos: offsets por instancia y,
+dentro de cada una, cantidades por OT y por tarea, con el entero más chico que
+alcanza para cada columna. Abrirlo no lee ni decodifica las instancias: cada una se
+arma recién cuando se pide.
+Formato (little-endian)::
+
+    MAGIA (8 bytes) | largo del encabezado (uint64) | encabezado JSON | columnas
+
+El encabezado describe cada columna (dtype, offset relativo a la zona de columnas y
+forma) y guarda lo que es común a todas las instancias del taller (operarios,
+habilidades, horizonte y el catálogo de tareas con el que se indexan duraciones y
+precedencias). La zona de columnas y cada columna comienzan alineadas a 64 bytes.
+
+Uso (desde ``proyecto/``)::
+
+    python -m config.corpus --n 100000 --seed 7 --output corpus.bin
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import struct
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+import numpy as np
+
+from .generador_instancias import iterar_instancias
+
+
+MAGIA = b"OTCORP01"
+ALINEACION = 64
+
+# Claves que se comparten entre todas las instancias y van en el encabezado.
+CLAVES_TALLER = ("operarios", "operarios_aptos", "horizonte")
+
+
+def guardar_corpus(instancias: Iterable[Dict[str, Any]], ruta: str | Path) -> int:
+    """Escribe las instancias en ``ruta`` y devuelve cuántas se guardaron.
+
+    Las instancias se consumen de a una (sirve ``iterar_instancias``); en memoria sólo
+    quedan las columnas compactas. Todas deben compartir operarios, habilidades,
+    horizonte y catálogo de tareas. ``ga_config`` no forma parte del corpus.
+    """
+    ids = bytearray()
+    ids_offsets = array("q", [0])
+    instancia_ots = array("q", [0])
+    instancia_tareas = array("q", [0])
+    instancia_prerequisitos = array("q", [0])
+    tareas_por_ot = array("q")
+    tareas = array("q")
+    repuestos = array("q")
+    tiempos = array("q")
+    prerequisitos_por_tarea = array("q")
+    prerequisitos = array("q")
+
+    catalogo: Optional[List[int]] = None
+    taller: Dict[str, Any] = {}
+    for instancia in instancias:
+        if catalogo is None:
+            catalogo = list(instancia["tiempos_procesamiento"])
+            taller = {clave: instancia[clave] for clave in CLAVES_TALLER}
+        elif list(instancia["tiempos_procesamiento"]) != catalogo or any(
+            instancia[clave] != taller[clave] for clave in CLAVES_TALLER
+        ):
+            raise ValueError(
+                f"La instancia {instancia['instancia_id']} no comparte el taller del corpus."
+            )
+        if list(instancia["prerequisitos"]) != catalogo:
+            raise ValueError(
+                f"Las precedencias de {instancia['instancia_id']} no siguen el catálogo de tareas."
+            )
+        if instancia["OT"] != list(range(1, len(instancia["OT"]) + 1)):
+            raise ValueError(f"Las OT de {instancia['instancia_id']} no son 1..N.")
+
+        ids.extend(instancia["instancia_id"].encode("utf-8"))
+        ids_offsets.append(len(ids))
+        for ot in instancia["OT"]:
+            tareas_por_ot.append(len(instancia["mapeo_ot"][ot]))
+            tareas.extend(instancia["mapeo_ot"][ot])
+            repuestos.extend(instancia["repuestos_por_ot"][ot])
+        instancia_ots.append(len(tareas_por_ot))
+        instancia_tareas.append(len(tareas))
+        tiempos.extend(instancia["tiempos_procesamiento"][tarea] for tarea in catalogo)
+        for tarea in catalogo:
+            prerequisitos_por_tarea.append(len(instancia["prerequisitos"][tarea]))
+            prerequisitos.extend(instancia["prerequisitos"][tarea])
+        instancia_prerequisitos.append(len(prerequisitos))
+
+    n = len(ids_offsets) - 1
+    if catalogo is None:
+        catalogo = []
+        taller = {"operarios": [], "operarios_aptos": {}, "horizonte": None}
+    columnas = {
+        "ids": np.frombuffer(bytes(ids), dtype=np.uint8),
+        "ids_offsets": np.asarray(ids_offsets, dtype="<i8"),
+        "instancia_ots": np.asarray(instancia_ots, dtype="<i8"),
+        "instancia_tareas": np.asarray(instancia_tareas, dtype="<i8"),
+        "instancia_prerequisitos": np.asarray(instancia_prerequisitos, dtype="<i8"),
+        "tareas_por_ot": _compacto(tareas_por_ot),
+        "tareas": _compacto(tareas),
+        "repuestos": _compacto(repuestos),
+        "tiempos": _compacto(tiempos).reshape(n, len(catalogo)),
+        "prerequisitos_por_tarea": _compacto(prerequisitos_por_tarea),
+        "prerequisitos": _compacto(prerequisitos),
+    }
+    # Los offsets de las columnas son relativos al comienzo de la zona de datos.
+    ubicaciones = {}
+    offset = 0
+    for nombre, datos in columnas.items():
+        offset = _alinear(offset)
+        ubicaciones[nombre] = {
+            "dtype": datos.dtype.str,
+            "offset": offset,
+            "forma": list(datos.shape),
+        }
+        offset += datos.nbytes
+    encabezado = json.dumps(
+        {
+            "version": 1,
+            "n": n,
+            "catalogo_tareas": catalogo,
+            "taller": {
+                "operarios": taller["operarios"],
+                # JSON sólo admite claves de texto; se convierten de vuelta al cargar.
+                "operarios_aptos": {
+                    str(op): aptas for op, aptas in taller["operarios_aptos"].items()
+                },
+                "horizonte": taller["horizonte"],
+            },
+            "columnas": ubicaciones,
+        }
+    ).encode("utf-8")
+    inicio_datos = _alinear(len(MAGIA) + 8 + len(encabezado))
+
+    ruta = Path(ruta)
+    ruta.parent.mkdir(parents=True, exist_ok=True)
+    with ruta.open("wb") as archivo:
+        archivo.write(MAGIA)
+        archivo.write(struct.pack("<Q", len(encabezado)))
+        archivo.write(encabezado)
+        for nombre, datos in columnas.items():
+            archivo.write(b"\0" * (inicio_datos + ubicaciones[nombre]["offset"] - archivo.tell()))
+            archivo.write(np.ascontiguousarray(datos).tobytes())
+    return n
+
+
+def _compacto(valores: array) -> np.ndarray:
+    """Arreglo con el entero más chico que representa todos los valores."""
+    datos = np.asarray(valores, dtype=np.int64)
+    if len(datos) == 0:
+        return datos.astype(np.uint8)
+    tipo = np.result_type(np.min_scalar_type(datos.min()), np.min_scalar_type(datos.max()))
+    return datos.astype(tipo.newbyteorder("<"))
+
+
+def _alinear(offset: int) -> int:
+    return -(-offset // ALINEACION) * ALINEACION
+
+
+class CorpusInstancias:
+    """Lectura perezosa de un corpus escrito con ``guardar_corpus``.
+
+    El archivo se mapea en memoria y cada columna es una vista de NumPy sobre el
+    mapeo: abrir el corpus es instantáneo sin importar su tamaño, y los procesos que
+    lo abren comparten las páginas del sistema operativo. Al serializarse con pickle
+    sólo viaja la ruta y el proceso que lo recibe lo abre con ``cargar_corpus``, así
+    que se puede enviar a un pool de procesos sin copiar las instancias.
+    """
+
+    def __init__(self, ruta: str | Path) -> None:
+        self.ruta = Path(ruta)
+        self._mapa = np.memmap(self.ruta, dtype=np.uint8, mode="r")
+        if bytes(self._mapa[: len(MAGIA)]) != MAGIA:
+            raise ValueError(f"{self.ruta} no es un corpus de instancias.")
+        (largo,) = struct.unpack("<Q", bytes(self._mapa[len(MAGIA) : len(MAGIA) + 8]))
+        inicio = len(MAGIA) + 8
+        encabezado = json.loads(bytes(self._mapa[inicio : inicio + largo]))
+        inicio_datos = _alinear(inicio + largo)
+
+        self.n: int = encabezado["n"]
+        self.catalogo: List[int] = encabezado["catalogo_tareas"]
+        taller = encabezado["taller"]
+        self._operarios: List[int] = taller["operarios"]
+        self._operarios_aptos: Dict[int, List[int]] = {
+            int(op): tareas for op, tareas in taller["operarios_aptos"].items()
+        }
+        self._horizonte = taller["horizonte"]
+        self._columnas: Dict[str, np.ndarray] = {}
+        for nombre, meta in encabezado["columnas"].items():
+            dtype = np.dtype(meta["dtype"])
+            cantidad = int(np.prod(meta["forma"]))
+            self._columnas[nombre] = np.frombuffer(
+                self._mapa, dtype=dtype, count=cantidad, offset=inicio_datos + meta["offset"]
+            ).reshape(meta["forma"])
+
+    def __len__(self) -> int:
+        return self.n
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for indice in range(self.n):
+            yield self[indice]
+
+    def __getitem__(self, indice: int) -> Dict[str, Any]:
+        indice = self._normalizar(indice)
+        c = self._columnas
+
+        desde_ot, hasta_ot = c["instancia_ots"][indice : indice + 2].tolist()
+        desde, hasta = c["instancia_tareas"][indice : indice + 2].tolist()
+        tareas = c["tareas"][desde:hasta].tolist()
+        repuestos = c["repuestos"][desde:hasta].tolist()
+        ot_list = list(range(1, hasta_ot - desde_ot + 1))
+        mapeo_ot: Dict[int, List[int]] = {}
+        repuestos_por_ot: Dict[int, List[int]] = {}
+        limites = [0, *accumulate(c["tareas_por_ot"][desde_ot:hasta_ot].tolist())]
+        for ot, desde, hasta in zip(ot_list, limites, limites[1:]):
+            mapeo_ot[ot] = tareas[desde:hasta]
+            repuestos_por_ot[ot] = repuestos[desde:hasta]
+
+        t = len(self.catalogo)
+        desde, hasta = c["instancia_prerequisitos"][indice : indice + 2].tolist()
+        requeridas = c["prerequisitos"][desde:hasta].tolist()
+        limites = [0, *accumulate(c["prerequisitos_por_tarea"][indice * t : (indice + 1) * t].tolist())]
+        prerequisitos = {
+            tarea: requeridas[desde:hasta]
+            for tarea, desde, hasta in zip(self.catalogo, limites, limites[1:])
+        }
+
+        return {
+            "instancia_id": self.instancia_id(indice),
+            "OT": ot_list,
+            "tareas_a_programar": [(ot, tarea) for ot in ot_list for tarea in mapeo_ot[ot]],
+            "mapeo_ot": mapeo_ot,
+            "tiempos_procesamiento": dict(zip(self.catalogo, c["tiempos"][indice].tolist())),
+            "prerequisitos": prerequisitos,
+            "repuestos_por_ot": repuestos_por_ot,
+            "operarios": list(self._operarios),
+            "operarios_aptos": {op: list(tareas) for op, tareas in self._operarios_aptos.items()},
+            "horizonte": self._horizonte,
+        }
+
+    def instancia_id(self, indice: int) -> str:
+        """Id de la instancia sin armar el resto del diccionario."""
+        indice = self._normalizar(indice)
+        desde, hasta = self._columnas["ids_offsets"][indice : indice + 2].tolist()
+        return bytes(self._columnas["ids"][desde:hasta]).decode("utf-8")
+
+    def _normalizar(self, indice: int) -> int:
+        if not -self.n <= indice < self.n:
+            raise IndexError(f"El corpus tiene {self.n} instancias.")
+        return indice % self.n
+
+    def __reduce__(self):
+        return (cargar_corpus, (str(self.ruta),))
+
+
+# Corpus ya abiertos en este proceso, por ruta absoluta.
+_ABIERTOS: Dict[Path, CorpusInstancias] = {}
+
+
+def cargar_corpus(ruta: str | Path) -> CorpusInstancias:
+    """Abre el corpus en ``ruta``; dentro de un mismo proceso se reutiliza el mapeo."""
+    clave = Path(ruta).resolve()
+    if clave not in _ABIERTOS:
+        _ABIERTOS[clave] = CorpusInstancias(clave)
+    return _ABIERTOS[clave]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Genera un corpus binario de instancias.")
+    parser.add_argument("--n", type=int, required=True)
+    parser.add_argument("--seed", type=int, required=True)
+    parser.add_argument("--min_ot", type=int, default=4)
+    parser.add_argument("--max_ot", type=int, default=12)
+    parser.add_argument("--output", type=Path, required=True)
+    args = parser.parse_args()
+
+    n = guardar_corpus(
+        iterar_instancias(args.n, args.min_ot, args.max_ot, seed=args.seed), args.output
+    )
+    print(f"Corpus de {n} instancias guardado en {args.output} ({args.output.stat().st_size} bytes)")
+
+
+if __name__ == "__main__":
+    main()
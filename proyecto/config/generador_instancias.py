@@ -1,4 +1,4 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, Iterator, List, Optional
 import random
 from .taller_config import (
     TAREAS,
@@ -31,8 +31,14 @@ def generar_instancia(
     variabilidad_duracion: float = 0.10,
     prob_falta_repuesto: float = 0.15,
     pesos_categorias: Optional[Dict[str, float]] = None,
+    rng: Optional[random.Random] = None,
 ) -> Dict[str, Any]:
-    """Genera una sola instancia válida para los algoritmos AG y SPT."""
+    """Genera una sola instancia válida para los algoritmos AG y SPT.
+
+    ``rng`` es el generador del que se sacan todos los sorteos; sin él se usa el
+    estado global del módulo ``random``.
+    """
+    rng = rng or random
 
     ot_list = list(range(1, num_ot + 1))
     mapeo_ot: Dict[int, List[int]] = {}
@@ -40,23 +46,24 @@ def generar_instancia(
     repuestos_por_ot: Dict[int, List[int]] = {}
 
     tareas_disponibles = list(TAREAS.values())
-    precedencias_instancia = _aplicar_precedencias_opcionales(PRECEDENCIAS)
+    precedencias_instancia = _aplicar_precedencias_opcionales(PRECEDENCIAS, rng)
 
     for ot in ot_list:
-        cantidad = random.randint(min_tareas_por_ot, max_tareas_por_ot)
+        cantidad = rng.randint(min_tareas_por_ot, max_tareas_por_ot)
         tareas_ot = _seleccionar_tareas_validas(
             cantidad,
             tareas_disponibles,
             precedencias_instancia,
             pesos_categorias,
+            rng,
         )
         mapeo_ot[ot] = tareas_ot
         tareas_a_programar.extend((ot, tarea) for tarea in tareas_ot)
         repuestos_por_ot[ot] = [
-            0 if random.random() < prob_falta_repuesto else 1 for _ in tareas_ot
+            0 if rng.random() < prob_falta_repuesto else 1 for _ in tareas_ot
         ]
 
-    tiempos = _generar_duraciones_variadas(DURACIONES_BASE, variabilidad_duracion)
+    tiempos = _generar_duraciones_variadas(DURACIONES_BASE, variabilidad_duracion, rng)
 
     return {
         "instancia_id": instancia_id,
@@ -72,6 +79,52 @@ def generar_instancia(
     }
 
 
+def rng_instancia(seed: int, indice: int) -> random.Random:
+    """Generador propio de la instancia ``indice`` de un lote con semilla ``seed``.
+
+    Depende sólo de ``(seed, indice)``: cualquier instancia del lote se puede volver a
+    generar por separado (y en otro proceso) sin generar las anteriores.
+    """
+    return random.Random(f"{seed}/{indice}")
+
+
+def generar_instancia_lote(
+    seed: int,
+    indice: int,
+    min_ot: int = 4,
+    max_ot: int = 12,
+    pesos_categorias: Optional[Dict[str, float]] = None,
+) -> Dict[str, Any]:
+    """Instancia ``inst_{indice}`` del lote generado con ``seed``."""
+    rng = rng_instancia(seed, indice)
+    num_ot = rng.randint(min_ot, max_ot)
+    return generar_instancia(
+        f"inst_{indice}",
+        num_ot,
+        pesos_categorias=pesos_categorias,
+        rng=rng,
+    )
+
+
+def iterar_instancias(
+    n: int,
+    min_ot: int = 4,
+    max_ot: int = 12,
+    seed: int | None = None,
+    pesos_categorias: Optional[Dict[str, float]] = None,
+    inicio: int = 0,
+) -> Iterator[Dict[str, Any]]:
+    """Entrega las instancias ``inicio .. n - 1`` del lote de a una.
+
+    Sólo la instancia en curso vive en memoria. Sin ``seed`` se sortea una semilla
+    para el lote completo.
+    """
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+    for indice in range(inicio, n):
+        yield generar_instancia_lote(seed, indice, min_ot, max_ot, pesos_categorias)
+
+
 def generar_batch_instancias(
     n: int,
     min_ot: int = 4,
@@ -79,37 +132,25 @@ def generar_batch_instancias(
     seed: int | None = None,
     pesos_categorias: Optional[Dict[str, float]] = None,
 ) -> List[Dict[str, Any]]:
-    """Genera un conjunto de instancias aleatorias."""
-    if seed is not None:
-        random.seed(seed)
-
-    batch = []
-    for i in range(n):
-        num_ot = random.randint(min_ot, max_ot)
-        batch.append(
-            generar_instancia(
-                f"inst_{i}",
-                num_ot,
-                pesos_categorias=pesos_categorias,
-            )
-        )
-    return batch
+    """Genera un conjunto de instancias aleatorias (ver ``iterar_instancias``)."""
+    return list(iterar_instancias(n, min_ot, max_ot, seed, pesos_categorias))
 
 
 def _seleccionar_tareas_validas(
     cantidad: int,
     universo: List[int],
     precedencias: Dict[int, List[int]],
-    pesos_categorias: Optional[Dict[str, float]] = None,
+    pesos_categorias: Optional[Dict[str, float]],
+    rng: random.Random,
 ) -> List[int]:
     """Selecciona un subconjunto de tareas que respeta todas las precedencias."""
     seleccionadas: List[int] = []
     candidatos = universo.copy()
-    random.shuffle(candidatos)
+    rng.shuffle(candidatos)
 
     while candidatos and len(seleccionadas) < cantidad:
-        categoria = _seleccionar_categoria(candidatos, pesos_categorias)
-        tarea = _seleccionar_candidato(candidatos, categoria)
+        categoria = _seleccionar_categoria(candidatos, pesos_categorias, rng)
+        tarea = _seleccionar_candidato(candidatos, categoria, rng)
         candidatos.remove(tarea)
 
         if _puede_agregarse(tarea, seleccionadas, precedencias):
@@ -133,17 +174,19 @@ def _puede_agregarse(tarea: int, seleccionadas: List[int], precedencias: Dict[in
 def _generar_duraciones_variadas(
     duraciones_base: Dict[int, int],
     variabilidad: float,
+    rng: random.Random,
 ) -> Dict[int, int]:
     """Aplica variabilidad aleatoria a las duraciones base."""
     tiempos = {}
     for tarea_id, base in duraciones_base.items():
-        factor = random.uniform(1 - variabilidad, 1 + variabilidad)
+        factor = rng.uniform(1 - variabilidad, 1 + variabilidad)
         tiempos[tarea_id] = max(1, int(round(base * factor)))
     return tiempos
 
 
 def _aplicar_precedencias_opcionales(
     precedencias: Dict[int, List[int]],
+    rng: random.Random,
     prob_relajar: float = 0.4,
 ) -> Dict[int, List[int]]:
     """Relaja algunas precedencias para simular ramificaciones opcionales."""
@@ -155,11 +198,11 @@ def _aplicar_precedencias_opcionales(
 
         requeridas_locales: List[int] = []
         for req in requeridas:
-            if random.random() > prob_relajar:
+            if rng.random() > prob_relajar:
                 requeridas_locales.append(req)
 
         if not requeridas_locales:
-            requeridas_locales.append(random.choice(requeridas))
+            requeridas_locales.append(rng.choice(requeridas))
 
         resultado[tarea] = requeridas_locales
     return resultado
@@ -168,16 +211,19 @@ def _aplicar_precedencias_opcionales(
 def _seleccionar_categoria(
     candidatos: List[int],
     pesos_categorias: Optional[Dict[str, float]],
+    rng: random.Random,
 ) -> str:
     """Elige una categoría disponible en base a los pesos configurados."""
-    categorias_disponibles = {
-        TAREA_A_CATEGORIA.get(tarea) for tarea in candidatos if TAREA_A_CATEGORIA.get(tarea)
-    }
+    # Orden fijo: iterar el set directamente depende de PYTHONHASHSEED y rompe la
+    # reproducibilidad de las instancias entre procesos con la misma semilla.
+    categorias_disponibles = sorted(
+        {TAREA_A_CATEGORIA.get(tarea) for tarea in candidatos if TAREA_A_CATEGORIA.get(tarea)}
+    )
     if not categorias_disponibles:
-        return random.choice(list(CATEGORIAS_TAREAS.keys()))
+        return rng.choice(list(CATEGORIAS_TAREAS.keys()))
 
     if not pesos_categorias:
-        return random.choice(list(categorias_disponibles))
+        return rng.choice(categorias_disponibles)
 
     ponderadas: List[tuple[str, float]] = []
     total = 0.0
@@ -187,9 +233,9 @@ def _seleccionar_categoria(
         total += peso
 
     if total <= 0:
-        return random.choice(list(categorias_disponibles))
+        return rng.choice(categorias_disponibles)
 
-    umbral = random.uniform(0, total)
+    umbral = rng.uniform(0, total)
     acumulado = 0.0
     for categoria, peso in ponderadas:
         acumulado += peso
@@ -199,9 +245,13 @@ def _seleccionar_categoria(
     return ponderadas[-1][0]
 
 
-def _seleccionar_candidato(candidatos: List[int], categoria: str) -> int:
+def _seleccionar_candidato(
+    candidatos: List[int],
+    categoria: str,
+    rng: random.Random,
+) -> int:
     """Selecciona una tarea aleatoria que pertenezca a la categoría solicitada."""
     filtrados = [tarea for tarea in candidatos if TAREA_A_CATEGORIA.get(tarea) == categoria]
     if not filtrados:
-        return random.choice(candidatos)
-    return random.choice(filtrados)
+        return rng.choice(candidatos)
+    return rng.choice(filtrados)
@@ -1,69 +1,395 @@
 import argparse
 import csv
+import json
+import random
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from functools import partial
+from itertools import islice
 from pathlib import Path
-from typing import Dict
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Set, Tuple
 
-from config.generador_instancias import generar_batch_instancias, CATEGORIAS_TAREAS
-from ag.ag import run_ag
+import numpy as np
+
+from config.corpus import cargar_corpus
+from config.generador_instancias import generar_instancia_lote, CATEGORIAS_TAREAS
+from ag.ag import configuracion_efectiva, run_ag
 from spt.spt import run_spt
-from ag.utils import exportar_csv_ag
-from spt.utils import exportar_csv_spt
+from ag.utils import CSV_COLUMNS, CSV_COLUMNS_RENDIMIENTO
+from comun.cache_resultados import CacheResultados
+from comun.agregados import GRUPO_DIFERENCIA, METRICAS_RESUMEN, ResumenComparativo
+from comun.salida import SalidaCSV, SalidaSQLite
+from comun.secuencial import PruebaSecuencial
+
+
+# Algoritmos que se corren sobre cada instancia, en el orden en que se escriben.
+ALGORITMOS: Dict[str, Callable[..., Dict[str, Any]]] = {"AG": run_ag, "SPT": run_spt}
+
+# Destinos de resultados seleccionables con ``--formato``.
+SALIDAS: Dict[str, Callable[..., SalidaCSV | SalidaSQLite]] = {
+    "csv": SalidaCSV,
+    "sqlite": SalidaSQLite,
+}
+
+# Instancias en curso (enviadas o esperando su turno de escritura) por cada worker.
+EN_VUELO_POR_WORKER = 4
 
 
 def ejecutar_simulaciones(
-    n: int,
+    n: int | None,
     output: str,
     seed: int | None = None,
     min_ot: int = 4,
     max_ot: int = 12,
     pesos_categorias: Dict[str, float] | None = None,
+    workers: int = 1,
+    ordenado: bool = True,
+    ga_config: Dict[str, Any] | None = None,
+    perfil: bool = False,
+    reanudar: bool = False,
+    corpus: str | None = None,
+    formato: str = "csv",
+    resumen_cada: int | None = None,
+    prueba: PruebaSecuencial | None = None,
+    lote_secuencial: int = 25,
+    cache: CacheResultados | None = None,
 ) -> None:
-    """Genera instancias y compara AG vs SPT, consolidando resultados en un CSV."""
-    instancias = generar_batch_instancias(
-        n,
-        min_ot=min_ot,
-        max_ot=max_ot,
-        seed=seed,
-        pesos_categorias=pesos_categorias,
-    )
+    """Genera instancias y compara AG vs SPT, consolidando resultados en un CSV.
+
+    Con ``workers > 1`` las instancias se reparten en un pool de procesos. Por defecto
+    las filas se escriben en el orden de ``instancia_id``; con ``ordenado=False`` se
+    escriben a medida que cada instancia termina. ``ga_config`` se aplica al AG de
+    todas las instancias (por ejemplo, los criterios de parada anticipada). Con
+    ``perfil=True`` el CSV agrega las columnas ``runtime_s`` y ``evaluaciones``.
+
+    Las instancias se generan de a una con ``generar_instancia_lote``: la instancia
+    ``inst_i`` depende sólo de ``(seed, i)`` y la memoria no crece con ``n``. Con
+    ``corpus`` las instancias se leen de un corpus de ``config.corpus`` (las primeras
+    ``n``, o todas si ``n`` es ``None``) y ``seed`` sólo fija las semillas del AG.
+
+    Con ``formato="sqlite"`` los resultados van a una base SQLite (``SalidaSQLite``)
+    que además guarda las asignaciones y la carga por operario de cada resultado.
+
+    Mientras llegan los resultados se acumulan, con memoria constante, la media y la
+    desviación de las métricas por algoritmo y rango de OT, junto con las diferencias
+    AG − SPT por instancia (``ResumenComparativo``). La tabla se imprime al final y,
+    con ``resumen_cada``, cada esa cantidad de instancias.
+
+    Con ``prueba`` las instancias se corren en lotes de ``lote_secuencial`` y, al
+    cerrar cada lote, la prueba secuencial revisa las diferencias AG − SPT de su
+    métrica; la corrida se detiene apenas decide o al llegar a ``n`` instancias. La
+    decisión y el intervalo se escriben en ``<output>.secuencial.json``.
+
+    Con ``reanudar=True`` se conserva la salida existente: sólo se regeneran y corren
+    los pares ``(instancia_id, algoritmo)`` que aún no tienen fila.
 
-    columnas = [
-        "instancia_id",
-        "algoritmo",
-        "num_OT",
-        "num_tareas",
-        "tareas_ejecutadas",
-        "tareas_rechazadas",
-        "makespan",
-        "carga_total",
-        "carga_std",
-    ]
+    Con ``cache`` (``CacheResultados``) los resultados de AG y SPT se reutilizan entre
+    corridas cuando coinciden la instancia y la configuración efectiva; al terminar se
+    informa cuántas instancias salieron de la cache y se poda según sus límites.
+    """
+    if workers < 1:
+        raise ValueError("workers debe ser un entero positivo.")
+    if reanudar and seed is None:
+        raise ValueError("Para reanudar se necesita la semilla (--seed) de la corrida original.")
+    if prueba is not None:
+        if lote_secuencial < 1:
+            raise ValueError("lote_secuencial debe ser un entero positivo.")
+        if reanudar:
+            raise ValueError("La prueba secuencial no se puede combinar con la reanudación.")
+        if not ordenado:
+            # El orden de llegada favorece a las instancias más rápidas (más chicas).
+            raise ValueError("La prueba secuencial necesita escribir en orden de instancia_id.")
+    fuente = cargar_corpus(corpus) if corpus is not None else None
+    if fuente is not None:
+        n = len(fuente) if n is None else min(n, len(fuente))
+    elif n is None:
+        raise ValueError("Sin corpus hay que indicar el número de instancias.")
 
     output_path = Path(output)
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    if output_path.exists():
-        output_path.unlink()
+    columnas = CSV_COLUMNS + CSV_COLUMNS_RENDIMIENTO if perfil else CSV_COLUMNS
+    if formato not in SALIDAS:
+        raise ValueError(f"Formato de salida desconocido: {formato}")
+    completados: Dict[str, Set[str]] = {}
+    if reanudar and formato == "sqlite":
+        with SalidaSQLite(output_path, columnas) as base:
+            completados = base.completados()
+    elif reanudar:
+        completados = _leer_completados(output_path, columnas)
+    else:
+        # Una corrida nueva no deja junto a su salida archivos de una corrida anterior,
+        # como la decisión de una prueba secuencial que esta corrida no hace.
+        for ruta in (
+            output_path,
+            *_archivos_auxiliares(output_path, formato),
+            _ruta_secuencial(output_path),
+        ):
+            ruta.unlink(missing_ok=True)
+    if seed is None:
+        seed = random.SystemRandom().getrandbits(64)
+        print(f"Semilla sorteada para el lote: {seed}")
+
+    # Cada trabajo arma su instancia en el proceso que la corre: la instancia i sale de
+    # ``(seed, i)`` o del corpus (que viaja como ruta y se mapea una vez por proceso),
+    # así que la memoria no crece con ``n`` y sólo se envían unos pocos argumentos.
+    if fuente is not None:
+        obtener: Callable[[int], Dict[str, Any]] = fuente.__getitem__
+    else:
+        obtener = partial(
+            generar_instancia_lote,
+            seed,
+            min_ot=min_ot,
+            max_ot=max_ot,
+            pesos_categorias=pesos_categorias,
+        )
+
+    def trabajos() -> Iterator[Tuple[Any, ...]]:
+        for indice in range(n):
+            instancia_id = fuente.instancia_id(indice) if fuente is not None else f"inst_{indice}"
+            hechos = completados.get(instancia_id, set())
+            algoritmos = [algoritmo for algoritmo in ALGORITMOS if algoritmo not in hechos]
+            if algoritmos:
+                config = {**(ga_config or {}), "random_seed": _semilla_instancia(seed, indice)}
+                yield obtener, indice, config, algoritmos, cache
+
+    resumen = ResumenComparativo()
+    desde_cache = {"instancias": 0, "resultados": 0, "total": 0}
+    with SALIDAS[formato](output_path, columnas) as salida:
+
+        def exportar(resultados: List[Dict[str, Any]]) -> bool:
+            """Escribe una instancia; devuelve True si la prueba secuencial ya decidió."""
+            _exportar(resultados, salida, resumen, resumen_cada)
+            aciertos = sum(bool(resultado.get("desde_cache")) for resultado in resultados)
+            desde_cache["resultados"] += aciertos
+            desde_cache["total"] += len(resultados)
+            desde_cache["instancias"] += aciertos == len(resultados)
+            if prueba is None or resumen.instancias % lote_secuencial:
+                return False
+            diferencias = resumen.acumulador(GRUPO_DIFERENCIA, prueba.metrica)
+            return prueba.revisar(diferencias) is not None
+
+        if workers == 1:
+            for trabajo in trabajos():
+                if exportar(_procesar_trabajo(*trabajo)):
+                    break
+        else:
+            ventana = EN_VUELO_POR_WORKER * workers
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                pendientes = enumerate(trabajos())
+                futuros: Dict[Future, int] = {}
+                terminados: Dict[int, List[Dict[str, Any]]] = {}
+                siguiente = 0
+                decidida = False
+                try:
+                    while not decidida:
+                        # Las instancias enviadas más las que esperan turno para
+                        # escribirse no superan ``ventana``: la memoria queda acotada
+                        # aunque una instancia lenta frene la escritura ordenada.
+                        for posicion, trabajo in islice(
+                            pendientes, max(ventana - len(futuros) - len(terminados), 0)
+                        ):
+                            futuros[pool.submit(_procesar_trabajo, *trabajo)] = posicion
+                        if not futuros:
+                            break
+                        listos, _ = wait(futuros, return_when=FIRST_COMPLETED)
+                        for futuro in listos:
+                            posicion = futuros.pop(futuro)
+                            if ordenado:
+                                terminados[posicion] = futuro.result()
+                            else:
+                                exportar(futuro.result())
+                        # Con la prueba secuencial, lo que termine después de decidir
+                        # se descarta para que la muestra sea exactamente los lotes.
+                        while siguiente in terminados and not decidida:
+                            decidida = exportar(terminados.pop(siguiente))
+                            siguiente += 1
+                except BaseException:
+                    # Si la corrida se interrumpe no se esperan las instancias en cola.
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    raise
+                # Al terminar (o decidir la prueba) se cancela lo que sigue en cola y se
+                # espera a los procesos, para no cerrar el intérprete con el pool activo.
+                pool.shutdown(cancel_futures=True)
+
+    procesadas = resumen.instancias
+    if reanudar:
+        print(f"Reanudación: {n - procesadas} instancias ya estaban completas")
+    print(f"Simulación completada: {procesadas} instancias procesadas")
+    if cache is not None:
+        poda = cache.podar()
+        print(
+            f"Cache de resultados: {desde_cache['instancias']} de {procesadas} instancias "
+            f"servidas desde cache ({desde_cache['resultados']} de {desde_cache['total']} "
+            f"resultados); {poda['entradas']} entradas, {poda['bytes'] / 1e6:.1f} MB, "
+            f"{poda['eliminadas']} eliminadas por edad o tamaño"
+        )
+    if resumen.instancias:
+        print("Resumen AG vs SPT (media ± desviación):")
+        print(resumen.tabla())
+    if prueba is not None:
+        diferencias = resumen.acumulador(GRUPO_DIFERENCIA, prueba.metrica)
+        ultima_n = prueba.revisiones[-1]["n"] if prueba.revisiones else 0
+        if prueba.decision is None and diferencias.n != ultima_n:
+            # El último lote quedó incompleto al llegar al máximo de instancias.
+            prueba.revisar(diferencias)
+        decision = prueba.resumen()
+        ruta_decision = _ruta_secuencial(output_path)
+        ruta_decision.write_text(json.dumps(decision, indent=2, ensure_ascii=False) + "\n")
+        intervalo = decision["intervalo"]
+        print(
+            f"Prueba secuencial sobre {prueba.metrica} (AG - SPT): {decision['decision']} "
+            f"con {decision['n']} instancias"
+            + (f", intervalo [{intervalo[0]:.2f}, {intervalo[1]:.2f}]" if intervalo else "")
+        )
+        print(f"Decisión guardada en: {ruta_decision.resolve()}")
+    print(f"Resultados guardados en: {output_path.resolve()}")
+
+
+def _procesar_trabajo(
+    obtener: Callable[[int], Dict[str, Any]],
+    indice: int,
+    ga_config: Dict[str, Any],
+    algoritmos: Sequence[str],
+    cache: CacheResultados | None = None,
+) -> List[Dict[str, Any]]:
+    """Arma la instancia ``indice`` y corre sobre ella los algoritmos pedidos."""
+    instancia = obtener(indice)
+    instancia["ga_config"] = {**instancia.get("ga_config", {}), **ga_config}
+    return _procesar_instancia(instancia, algoritmos, cache)
+
+
+def _procesar_instancia(
+    instancia: Dict[str, Any],
+    algoritmos: Sequence[str] = tuple(ALGORITMOS),
+    cache: CacheResultados | None = None,
+) -> List[Dict[str, Any]]:
+    """Corre los algoritmos pedidos sobre una instancia y mide el tiempo de cada uno.
+
+    Con ``cache`` cada resultado se busca primero por el contenido de la instancia y
+    la configuración efectiva del algoritmo; ``desde_cache`` indica si se reutilizó
+    (en ese caso ``runtime_s`` es el de la corrida que lo calculó).
+    """
+    instancia_id = instancia.get("instancia_id", "instancia")
+    resultados = []
+    for algoritmo in algoritmos:
+        clave = None
+        if cache is not None:
+            clave = cache.clave(algoritmo, instancia, _configuracion(algoritmo, instancia))
+            resultado = cache.obtener(clave)
+            if resultado is not None:
+                resultado.update({"instancia_id": instancia_id, "desde_cache": True})
+                resultados.append(resultado)
+                continue
+        inicio = time.perf_counter()
+        resultado = ALGORITMOS[algoritmo](instancia, instancia_id=instancia_id)
+        resultado["runtime_s"] = time.perf_counter() - inicio
+        if clave is not None:
+            cache.guardar(clave, resultado)
+        resultado["desde_cache"] = False
+        resultados.append(resultado)
+    return resultados
+
+
+def _configuracion(algoritmo: str, instancia: Dict[str, Any]) -> Dict[str, Any]:
+    """Configuración que determina el resultado de ``algoritmo`` sobre la instancia."""
+    if algoritmo == "AG":
+        return configuracion_efectiva(instancia.get("ga_config", {}))
+    return {}
 
-    for instancia in instancias:
-        instancia_id = instancia.get("instancia_id", "instancia")
-        resultado_ag = run_ag(instancia, instancia_id=instancia_id)
-        resultado_spt = run_spt(instancia, instancia_id=instancia_id)
-        exportar_csv_ag(resultado_ag, output)
-        exportar_csv_spt(resultado_spt, output)
 
-    print(f"Simulación completada: {len(instancias)} instancias procesadas")
-    print(f"CSV guardado en: {output_path.resolve()}")
+def _exportar(
+    resultados: List[Dict[str, Any]],
+    salida: SalidaCSV | SalidaSQLite,
+    resumen: ResumenComparativo,
+    resumen_cada: int | None = None,
+) -> None:
+    for resultado in resultados:
+        salida.escribir(resultado)
+    resumen.registrar_instancia(resultados)
+    if resumen_cada and resumen.instancias % resumen_cada == 0:
+        print(f"Resumen parcial tras {resumen.instancias} instancias:")
+        print(resumen.tabla())
+
+
+def _leer_completados(ruta: Path, columnas: Sequence[str]) -> Dict[str, Set[str]]:
+    """Algoritmos con fila en el CSV, por ``instancia_id``.
+
+    Si la corrida anterior se cortó a mitad de una fila, esa fila se descarta del
+    archivo para que la reanudación la vuelva a escribir completa.
+    """
+    if not ruta.exists():
+        return {}
+    _descartar_fila_incompleta(ruta)
+
+    completados: Dict[str, Set[str]] = {}
+    with ruta.open(newline="") as csvfile:
+        reader = csv.DictReader(csvfile)
+        if reader.fieldnames is None:
+            return completados
+        if list(reader.fieldnames) != list(columnas):
+            raise ValueError(
+                f"Las columnas de {ruta} no coinciden con las de esta corrida; "
+                "revisa que --perfil se use igual que en la corrida original."
+            )
+        for fila in reader:
+            completados.setdefault(fila["instancia_id"], set()).add(fila["algoritmo"])
+    return completados
+
+
+def _descartar_fila_incompleta(ruta: Path) -> None:
+    contenido = ruta.read_bytes()
+    if contenido and not contenido.endswith(b"\n"):
+        with ruta.open("r+b") as archivo:
+            archivo.truncate(contenido.rfind(b"\n") + 1)
+
+
+def _archivos_auxiliares(ruta: Path, formato: str) -> List[Path]:
+    """Archivos que SQLite crea junto a la base en modo WAL."""
+    if formato != "sqlite":
+        return []
+    return [ruta.with_name(ruta.name + sufijo) for sufijo in ("-wal", "-shm")]
+
+
+def _ruta_secuencial(ruta: Path) -> Path:
+    """Archivo con la decisión de la prueba secuencial junto a la salida."""
+    return ruta.with_suffix(".secuencial.json")
+
+
+def _semilla_instancia(seed: int, posicion: int) -> int:
+    """Semilla del AG para la instancia ``posicion``, derivada sólo de ``--seed``."""
+    return int(np.random.SeedSequence([seed, posicion]).generate_state(1)[0])
 
 
 def parse_args() -> argparse.Namespace:
     parser = argparse.ArgumentParser(description="Simulador comparativo AG vs SPT.")
-    parser.add_argument("--n", type=int, required=True, help="Número de instancias a generar.")
+    parser.add_argument(
+        "--n",
+        type=int,
+        default=None,
+        help="Número de instancias a generar (obligatorio salvo con --corpus).",
+    )
+    parser.add_argument(
+        "--corpus",
+        type=str,
+        default=None,
+        help="Corpus binario de instancias (config.corpus) a usar en lugar de generarlas.",
+    )
     parser.add_argument("--seed", type=int, default=None, help="Semilla aleatoria opcional.")
     parser.add_argument(
         "--output",
         type=str,
         default="resultados.csv",
-        help="Ruta del CSV consolidado.",
+        help="Ruta del CSV consolidado (o de la base SQLite con --formato sqlite).",
+    )
+    parser.add_argument(
+        "--formato",
+        choices=sorted(SALIDAS),
+        default="csv",
+        help=(
+            "Destino de los resultados: csv (default) o sqlite, que además guarda las "
+            "asignaciones de cada cronograma."
+        ),
     )
     parser.add_argument("--min_ot", type=int, default=4, help="Número mínimo de OT por instancia.")
     parser.add_argument("--max_ot", type=int, default=12, help="Número máximo de OT por instancia.")
@@ -77,6 +403,100 @@ def parse_args() -> argparse.Namespace:
             "Se puede repetir la bandera."
         ),
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Procesos para correr instancias en paralelo (default 1).",
+    )
+    parser.add_argument(
+        "--sin_orden",
+        action="store_true",
+        help="Escribe cada instancia apenas termina, sin respetar el orden de instancia_id.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help=(
+            "Conserva la salida existente y corre sólo las instancias/algoritmos que faltan. "
+            "Requiere los mismos --seed, --n y parámetros de la corrida original."
+        ),
+    )
+    parser.add_argument(
+        "--resumen_cada",
+        type=int,
+        default=None,
+        help="Imprime el resumen AG vs SPT cada N instancias, además de al final.",
+    )
+    parser.add_argument(
+        "--secuencial",
+        choices=METRICAS_RESUMEN,
+        default=None,
+        metavar="METRICA",
+        help=(
+            "Corre por lotes y se detiene cuando la prueba pareada sobre la diferencia "
+            "AG - SPT de la métrica decide; --n pasa a ser el máximo de instancias."
+        ),
+    )
+    parser.add_argument(
+        "--lote", type=int, default=25, help="Instancias por lote de la prueba secuencial."
+    )
+    parser.add_argument(
+        "--alfa", type=float, default=0.05, help="Error total de la prueba secuencial."
+    )
+    parser.add_argument(
+        "--efecto_minimo",
+        type=float,
+        default=0.0,
+        help="Diferencia por debajo de la cual AG y SPT se consideran equivalentes.",
+    )
+    parser.add_argument(
+        "--cache",
+        type=str,
+        default=None,
+        metavar="DIRECTORIO",
+        help=(
+            "Reutiliza resultados de AG y SPT guardados en este directorio. La clave "
+            "incluye el código de los módulos que importan AG y SPT; si cambia algo de "
+            "fuera del proyecto que altere los resultados (p. ej. la versión de PyGAD), "
+            "incrementar VERSION_RESULTADOS o borrar el directorio."
+        ),
+    )
+    parser.add_argument(
+        "--cache_max_mb",
+        type=float,
+        default=None,
+        help="Tamaño máximo de la cache; al terminar se borran primero las entradas más viejas.",
+    )
+    parser.add_argument(
+        "--cache_max_dias",
+        type=float,
+        default=None,
+        help="Edad máxima (sin uso) de las entradas de la cache.",
+    )
+    parser.add_argument(
+        "--perfil",
+        action="store_true",
+        help="Agrega al CSV las columnas runtime_s y evaluaciones de cada algoritmo.",
+    )
+    parser.add_argument(
+        "--generaciones_saturacion",
+        type=int,
+        default=None,
+        help="Detiene el AG si el mejor fitness no mejora en K generaciones.",
+    )
+    parser.add_argument(
+        "--tiempo_max_ag",
+        type=float,
+        default=None,
+        help="Presupuesto de tiempo (segundos) para el AG de cada instancia.",
+    )
+    parser.add_argument(
+        "--max_evaluaciones_ag",
+        type=int,
+        default=None,
+        help="Máximo de evaluaciones de fitness del AG por instancia.",
+    )
     return parser.parse_args()
 
 
@@ -103,10 +523,48 @@ def _parse_pesos_categorias(entries: list[str] | None) -> Dict[str, float] | Non
     return pesos
 
 
+def _ga_config_parada(args: argparse.Namespace) -> Dict[str, Any]:
+    """Criterios de parada anticipada del AG indicados por CLI."""
+    criterios = {
+        "generaciones_saturacion": args.generaciones_saturacion,
+        "tiempo_maximo_s": args.tiempo_max_ag,
+        "max_evaluaciones": args.max_evaluaciones_ag,
+    }
+    return {clave: valor for clave, valor in criterios.items() if valor is not None}
+
+
+def _cache_desde_args(args: argparse.Namespace) -> CacheResultados | None:
+    if args.cache is None:
+        return None
+    return CacheResultados(
+        args.cache,
+        max_bytes=int(args.cache_max_mb * 1e6) if args.cache_max_mb is not None else None,
+        max_edad_s=args.cache_max_dias * 86400 if args.cache_max_dias is not None else None,
+    )
+
+
+def _terminar(signum: int, frame: Any) -> None:
+    # Convierte SIGTERM (p. ej. una expropiación del cluster) en una salida ordenada
+    # para que se escriban las filas que quedan en el buffer del CSV.
+    raise SystemExit(128 + signum)
+
+
 def main() -> None:
+    signal.signal(signal.SIGTERM, _terminar)
     args = parse_args()
+    if args.resume and args.seed is None:
+        raise SystemExit("--resume requiere la misma --seed de la corrida original.")
+    if args.secuencial is not None and (args.resume or args.sin_orden):
+        raise SystemExit("--secuencial no se puede combinar con --resume ni con --sin_orden.")
+    if args.n is None and args.corpus is None:
+        raise SystemExit("Indica --n o un --corpus de instancias.")
     try:
         pesos_categorias = _parse_pesos_categorias(args.peso_categoria)
+        prueba = (
+            PruebaSecuencial(args.secuencial, args.alfa, args.efecto_minimo)
+            if args.secuencial is not None
+            else None
+        )
     except ValueError as exc:
         raise SystemExit(str(exc))
     ejecutar_simulaciones(
@@ -116,6 +574,17 @@ def main() -> None:
         min_ot=args.min_ot,
         max_ot=args.max_ot,
         pesos_categorias=pesos_categorias,
+        workers=args.workers,
+        ordenado=not args.sin_orden,
+        ga_config=_ga_config_parada(args),
+        perfil=args.perfil,
+        reanudar=args.resume,
+        corpus=args.corpus,
+        formato=args.formato,
+        resumen_cada=args.resumen_cada,
+        prueba=prueba,
+        lote_secuencial=args.lote,
+        cache=_cache_desde_args(args),
     )
 
 
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Sequence, Set, Tuple
+import heapq
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from comun.ocupacion import IndiceOcupacion
 
 from .utils import formatear_resultados_spt
 
@@ -39,71 +42,115 @@ def simular_spt(instancia: Dict[str, Any]) -> Dict[str, Any]:
         raise ValueError("La instancia debe definir un horizonte ('horizonte' o 'H').")
 
     pendientes: Set[Tuple[int, int]] = set(tareas)
-    completadas_por_ot: Dict[int, Set[int]] = {ot: set() for ot in ots}
-    ocupacion_ot: Dict[int, List[Tuple[int, int]]] = {ot: [] for ot in ots}
+    ocupacion_ot: Dict[int, IndiceOcupacion] = {ot: IndiceOcupacion() for ot in ots}
     tiempo_por_operario: Dict[int, int] = {int(op): 0 for op in operarios}
     orden_operario: Dict[int, int] = {int(op): 0 for op in operarios}
     cronograma: List[Dict[str, Any]] = []
     tareas_rechazadas: List[Dict[str, Any]] = []
     indice_tarea = {tuple_tarea: idx for idx, tuple_tarea in enumerate(tareas)}
 
-    contexto_orden = {
-        "pendientes": pendientes,
-        "completadas_por_ot": completadas_por_ot,
-        "mapeo_ot": mapeo_ot,
-        "prerequisitos": prerequisitos,
-        "repuestos_por_ot": repuestos_por_ot,
-        "tiempos_procesamiento": tiempos_procesamiento,
-    }
-
-    progreso = True
-    while pendientes and progreso:
-        progreso = False
-        tareas_listas = ordenar_spt(contexto_orden)
-        if not tareas_listas:
-            break
-
-        for (ot, tarea) in tareas_listas:
+    # Prerequisitos locales aún no programados de cada tarea y, a la inversa, qué
+    # tareas esperan a cada (OT, tipo). Una tarea entra a la cola de listas cuando su
+    # contador llega a cero, en vez de volver a filtrar todas las pendientes.
+    faltan: Dict[Tuple[int, int], int] = {}
+    dependientes: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+    for ot, tarea in pendientes:
+        tipos_en_ot = set(mapeo_ot.get(ot, []))
+        exigibles = set(prerequisitos.get(tarea, [])).intersection(tipos_en_ot)
+        faltan[(ot, tarea)] = len(exigibles)
+        for req in exigibles:
+            dependientes.setdefault((ot, req), []).append((ot, tarea))
+
+    # Índice invertido tipo de tarea -> operarios aptos y, por tipo, un min-heap de
+    # (tiempo libre, posición en ``operarios``, operario). Al avanzar un operario se
+    # empuja una entrada nueva en los heaps de sus tipos; las viejas se descartan al
+    # llegar a la cima. El desempate por posición reproduce el ``sorted`` estable
+    # sobre la lista de operarios.
+    tipos_instancia = {tarea for _, tarea in tareas}
+    posicion_operario: Dict[int, int] = {}
+    for posicion, op in enumerate(operarios):
+        posicion_operario.setdefault(op, posicion)
+    tipos_de_operario: Dict[int, List[int]] = {}
+    disponibilidad: Dict[int, List[Tuple[int, int, int]]] = {tipo: [] for tipo in tipos_instancia}
+    for op, posicion in posicion_operario.items():
+        tipos_op = sorted(set(operarios_aptos.get(op, [])).intersection(tipos_instancia))
+        tipos_de_operario[op] = tipos_op
+        for tipo in tipos_op:
+            # Se recorren los operarios en orden de posición: cada lista ya es un heap.
+            disponibilidad[tipo].append((0, posicion, op))
+
+    def _operario_mas_libre(tipo: int) -> Optional[int]:
+        heap = disponibilidad[tipo]
+        while heap:
+            tiempo, _, op = heap[0]
+            if tiempo == tiempo_por_operario[op]:
+                return op
+            heapq.heappop(heap)
+        return None
+
+    def _clave_spt(ot: int, tarea: int) -> Tuple[int, int, int]:
+        duracion = tiempos_procesamiento.get(tarea)
+        if duracion is None:
+            raise ValueError(f"No se definió duración para la tarea {tarea}.")
+        return (int(duracion), ot, tarea)
+
+    # Cada ronda atiende, en orden SPT, las tareas que estaban listas al comenzarla;
+    # las que se liberan durante la ronda esperan a la siguiente, como en el barrido
+    # original con ``ordenar_spt``.
+    listas: List[Tuple[int, int, int]] = [
+        _clave_spt(ot, tarea)
+        for ot, tarea in pendientes
+        if faltan[(ot, tarea)] == 0
+        and _repuesto_disponible(ot, tarea, mapeo_ot, repuestos_por_ot)
+    ]
+    heapq.heapify(listas)
+
+    while listas:
+        siguiente_ronda: List[Tuple[int, int, int]] = []
+        while listas:
+            duracion, ot, tarea = heapq.heappop(listas)
             if (ot, tarea) not in pendientes:
                 continue
 
-            candidatos = [op for op in operarios if tarea in operarios_aptos.get(op, [])]
-            if not candidatos:
+            operario = _operario_mas_libre(tarea)
+            if operario is None:
                 continue
 
-            duracion = tiempos_procesamiento.get(tarea)
-            if duracion is None:
-                raise ValueError(f"No se definió duración para la tarea {tarea}.")
-
-            asignado = False
-            for operario in sorted(candidatos, key=lambda op: tiempo_por_operario[int(op)]):
-                op_int = int(operario)
-                earliest = tiempo_por_operario[op_int]
-                ok, inicio, fin = find_earliest_slot(ocupacion_ot[ot], earliest, int(duracion), int(horizonte))
-                if ok:
-                    tiempo_por_operario[op_int] = fin
-                    ocupacion_ot[ot].append((inicio, fin))
-                    completadas_por_ot.setdefault(ot, set()).add(tarea)
-                    orden_operario[op_int] += 1
-                    pendientes.remove((ot, tarea))
-                    cronograma.append(
-                        {
-                            "idx": indice_tarea[(ot, tarea)],
-                            "ot": ot,
-                            "tarea": tarea,
-                            "operario": op_int,
-                            "inicio": inicio,
-                            "fin": fin,
-                            "orden": orden_operario[op_int],
-                        }
-                    )
-                    progreso = True
-                    asignado = True
-                    break
-
-            if not asignado:
+            # Sólo hace falta probar el operario más libre: si no cabe desde su tiempo,
+            # tampoco cabe desde el de otro apto (que empieza igual o más tarde). Y si no
+            # hay hueco ahora tampoco lo habrá en rondas posteriores: los operarios sólo
+            # avanzan y las OT sólo se ocupan más.
+            earliest = tiempo_por_operario[operario]
+            ok, inicio, fin = ocupacion_ot[ot].primer_hueco(earliest, duracion, int(horizonte))
+            if not ok:
                 continue
 
+            tiempo_por_operario[operario] = fin
+            for tipo in tipos_de_operario[operario]:
+                heapq.heappush(disponibilidad[tipo], (fin, posicion_operario[operario], operario))
+            ocupacion_ot[ot].agregar(inicio, fin)
+            orden_operario[operario] += 1
+            pendientes.remove((ot, tarea))
+            cronograma.append(
+                {
+                    "idx": indice_tarea[(ot, tarea)],
+                    "ot": ot,
+                    "tarea": tarea,
+                    "operario": operario,
+                    "inicio": inicio,
+                    "fin": fin,
+                    "orden": orden_operario[operario],
+                }
+            )
+            for dependiente in dependientes.pop((ot, tarea), []):
+                faltan[dependiente] -= 1
+                if faltan[dependiente] == 0 and _repuesto_disponible(
+                    dependiente[0], dependiente[1], mapeo_ot, repuestos_por_ot
+                ):
+                    heapq.heappush(siguiente_ronda, _clave_spt(*dependiente))
+
+        listas = siguiente_ronda
+
     cronograma.sort(key=lambda tarea: (tarea["operario"], tarea["inicio"], tarea["fin"]))
     tareas_rechazadas = [{"ot": ot, "tarea": tarea} for ot, tarea in sorted(pendientes)]
     makespan = max(tiempo_por_operario.values()) if tiempo_por_operario else 0
@@ -112,7 +159,7 @@ def simular_spt(instancia: Dict[str, Any]) -> Dict[str, Any]:
         "cronograma": cronograma,
         "tareas_rechazadas": tareas_rechazadas,
         "tiempo_por_operario": tiempo_por_operario,
-        "ocupacion_ot": {ot: sorted(intervalos) for ot, intervalos in ocupacion_ot.items()},
+        "ocupacion_ot": {ot: sorted(indice) for ot, indice in ocupacion_ot.items()},
         "tareas_ejecutadas": len(cronograma),
         "makespan": makespan,
         "n_tareas": len(tareas),
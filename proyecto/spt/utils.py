@@ -1,7 +1,9 @@
 import csv
 from pathlib import Path
 from statistics import pstdev
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, Iterable, List, Sequence
+
+from comun.salida import SalidaSQLite
 
 
 CSV_COLUMNS = [
@@ -14,6 +16,8 @@ CSV_COLUMNS = [
     "makespan",
     "carga_total",
     "carga_std",
+    "generaciones",
+    "criterios_parada",
 ]
 
 
@@ -98,7 +102,11 @@ def _calcular_carga_por_operario(
     return carga
 
 
-def exportar_csv_spt(resultado: Dict[str, Any], ruta: str) -> None:
+def exportar_csv_spt(
+    resultado: Dict[str, Any],
+    ruta: str,
+    columnas: Sequence[str] = CSV_COLUMNS,
+) -> None:
     """Agrega el resultado a un CSV orientado a métricas comparativas."""
 
     csv_path = Path(ruta)
@@ -106,7 +114,18 @@ def exportar_csv_spt(resultado: Dict[str, Any], ruta: str) -> None:
     escribir_encabezado = not csv_path.exists()
 
     with csv_path.open("a", newline="") as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=CSV_COLUMNS)
+        writer = csv.DictWriter(csvfile, fieldnames=columnas)
         if escribir_encabezado:
             writer.writeheader()
-        writer.writerow({columna: resultado.get(columna) for columna in CSV_COLUMNS})
+        writer.writerow({columna: resultado.get(columna) for columna in columnas})
+
+
+def exportar_sqlite_spt(
+    resultado: Dict[str, Any],
+    ruta: str,
+    columnas: Sequence[str] = CSV_COLUMNS,
+) -> None:
+    """Guarda el resultado, con sus asignaciones, en una base SQLite (ver ``SalidaSQLite``)."""
+
+    with SalidaSQLite(ruta, columnas) as salida:
+        salida.escribir(resultado)